@@ -34,7 +34,7 @@ class OptionParserTestable(OptionParser):
             self.exit(2, msg2)
 
 
-def _loadFile(fileName):
+def _loadFile(fileName, workers=None):
     # convert to string for possible pathlib path object from testing data
     if type(fileName) != str:
         fileName = str(fileName)
@@ -49,7 +49,7 @@ def _loadFile(fileName):
         wl = reg.getWorldVolume()
     elif fileName.find(".inp") != -1:
         r = _pyg4.fluka.Reader(fileName)
-        reg = _pyg4.convert.fluka2Geant4(r.getRegistry())
+        reg = _pyg4.convert.fluka2Geant4(r.getRegistry(), workers=workers)
         wl = reg.getWorldVolume()
     elif fileName.find(".stl") != -1:
         reg = _pyg4.geant4.Registry()
@@ -139,6 +139,7 @@ def cli(
     view=False,
     bounding=False,
     checkOverlaps=False,
+    workers=None,
     analysis=False,
     nullMeshException=False,
     compareFileName=None,
@@ -186,7 +187,7 @@ def cli(
     if nullMeshException:
         _pyg4.config.meshingNullException = not nullMeshException
 
-    reg, wl = _loadFile(inputFileName)
+    reg, wl = _loadFile(inputFileName, workers=workers)
 
     if bounding:
         bbExtent = _np.array(wl.extent())
@@ -226,7 +227,7 @@ def cli(
 
     if checkOverlaps:
         print("pyg4> checkoverlaps")  # noqa: T201
-        wl.checkOverlaps(True)
+        wl.checkOverlaps(True, workers=workers)
 
     if analysis:
         print("pyg4> analysis")  # noqa: T201
@@ -287,7 +288,13 @@ def cli(
         raise NotImplementedError(errMsg)
 
     if outputFileName is not None:
-        if outputFileName.find(".gl") != -1:
+        if outputFileName.endswith(".glb"):
+            v = _pyg4.visualisation.VtkViewerColouredMaterialNew()
+            v.addLogicalVolume(reg.getWorldVolume())
+            v.removeInvisible()
+            scale = float(gltfScale) if gltfScale is not None else 1.0
+            v.exportGLB(outputFileName, scale=scale)
+        elif outputFileName.find(".gl") != -1:
             v = _pyg4.visualisation.VtkViewerColouredMaterialNew()
             v.addLogicalVolume(reg.getWorldVolume())
             v.removeInvisible()
@@ -329,13 +336,22 @@ def cli(
             raise ValueError(errMsg)
         # up the quality of meshes
         _pyg4.config.setGlobalMeshSliceAndStack(56)
-        v = _pyg4.visualisation.VtkViewerColouredMaterialNew()
-        v.addLogicalVolume(wl)
-        o = planeCutterData[:3]
-        n = planeCutterData[3:]
-        v.addCutter("cli-cutter", o, n)
-        v.buildPipelinesAppend()
-        v.exportCutter("cli-cutter", planeCutterOutputFileName)
+        if str(planeCutterOutputFileName).endswith((".json", ".npz")):
+            # numpy section engine, any number of planes x,y,z,nx,ny,nz,x,y,z,...
+            planes = _np.array(planeCutterData, dtype=float).reshape(-1, 6)
+            o = planes[:, :3]
+            n = planes[:, 3:]
+            s = _pyg4.visualisation.SectionExporter()
+            s.addLogicalVolume(wl)
+            s.exportSections(planeCutterOutputFileName, o, n)
+        else:
+            v = _pyg4.visualisation.VtkViewerColouredMaterialNew()
+            v.addLogicalVolume(wl)
+            o = planeCutterData[:3]
+            n = planeCutterData[3:]
+            v.addCutter("cli-cutter", o, n)
+            v.buildPipelinesAppend()
+            v.exportCutter("cli-cutter", planeCutterOutputFileName)
         print(  # noqa: T201
             "pyg4> cutter with " + str(o) + ", " + str(n) + " written to: ",
             planeCutterOutputFileName,
@@ -379,6 +395,14 @@ def main(testArgs=None, testing=False):
         dest="checkOverlaps",
         action="store_true",
     )
+    parser.add_option(
+        "-w",
+        "--workers",
+        help="number of processes used to check overlaps and convert FLUKA regions",
+        dest="workers",
+        type="int",
+        metavar="NPROCESSES",
+    )
     parser.add_option(
         "-C",
         "--clip",
@@ -456,13 +480,14 @@ def main(testArgs=None, testing=False):
     parser.add_option(
         "-p",
         "--planeCutter",
-        help="add (p)plane cutter -p x,y,z,nx,ny,nz",
+        help="add (p)plane cutter -p x,y,z,nx,ny,nz (repeated, or x,y,z,nx,ny,nz,x,y,z,..., for several planes with a .json or .npz output)",
+        action="append",
         dest="planeCutter",
     )
     parser.add_option(
         "-P",
         "--planeCutterOutput",
-        help="plane cutter output file",
+        help="plane cutter output file (.json or .npz for the numpy section engine, else vtk)",
         dest="planeCutterOutputFileName",
         metavar="CUTTERFILE",
     )
@@ -531,7 +556,8 @@ def main(testArgs=None, testing=False):
     # parse plane
     planeData = options.__dict__["planeCutter"]
     if planeData is not None:
-        planeData = _parseStrMultipletAsFloat(planeData)
+        # each -p is one or more planes, all given together as one flat list of floats
+        planeData = [v for plane in planeData for v in _parseStrMultipletAsFloat(plane)]
         if verbose:
             print("pyg4> clipper plane data", planeData)  # noqa: T201
 
@@ -580,6 +606,7 @@ def main(testArgs=None, testing=False):
         view=options.__dict__["view"],
         bounding=options.__dict__["bounding"],
         checkOverlaps=options.__dict__["checkOverlaps"],
+        workers=options.__dict__["workers"],
         analysis=options.__dict__["analysis"],
         nullMeshException=options.__dict__["nullmesh"],
         compareFileName=options.__dict__["compareFileName"],
@@ -9,6 +9,13 @@ errors. The default is around float precision.
 
 twoPiComparisonTolerance = 1e-7
 
+"""
+Distance (mm) by which daughter bounding boxes are grown in the broad phase of the overlap
+check, so that touching (coplanar) daughters are still passed on to the full mesh test.
+"""
+
+overlapBroadPhaseTolerance = 1e-6
+
 
 class meshingType:
     pycsg = 1
@@ -33,6 +40,20 @@ def backendName():
 # whether to generate meshes during the construction of each logical volume
 # note this is required for a lot of functionality
 doMeshing = True
+# generate the mesh of a logical volume only when it is first used (LogicalVolume.mesh) and
+# again after its solid is replaced or edited, instead of during construction. Reading and
+# writing geometry then does no meshing at all
+lazyMeshing = False
+
+# optional on-disk cache of solid meshes (see visualisation.MeshCache). None disables the
+# cache, otherwise meshes are stored in this directory and reused while the solid is unchanged
+meshCacheDirectory = None
+# maximum total size of the mesh cache in bytes, least recently used meshes are removed first
+meshCacheMaxSize = 2 * 1024**3
+# keep the meshes of boolean operands in memory (per registry) so solids shared by many
+# booleans are only meshed once, see Registry.solidMesh, and likewise FLUKA bodies and zones
+# shared by many regions, see FlukaRegistry.bodyMesh
+memoiseSolidMeshes = True
 
 # Global settings for default meshing settings for solids
 # nslice and and nstacks determine the discretisation of curved solids.
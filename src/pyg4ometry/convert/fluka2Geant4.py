@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 from copy import deepcopy as _deepcopy
 from collections import namedtuple as _namedtuple
 from functools import reduce as _reduce
@@ -12,10 +13,14 @@ from .. import fluka as _fluka
 from .. import geant4 as _g4
 from .. import transformation as _trans
 from .. import config as _config
+from .. import exceptions as _exceptions
+from ..visualisation.MeshCache import cachedMesh as _cachedMesh
 
 if _config.meshing == _config.meshingType.cgal_sm:
+    from ..pycgal.core import CSG as _CSG
     from ..pycgal.core import do_intersect as _do_intersect
 elif _config.meshing == _config.meshingType.pycsg:
+    from ..pycsg.core import CSG as _CSG
     from ..pycsg.core import do_intersect as _do_intersect
 
 logger = _logging.getLogger(__name__)
@@ -36,6 +41,7 @@ def fluka2Geant4(
     worldDimensions=None,
     omitBlackholeRegions=True,
     quadricRegionAABBs=None,
+    workers=None,
     **kwargs,
 ):
     """
@@ -55,6 +61,8 @@ def fluka2Geant4(
     :type omitBlackholeRegions: bool
     :param quadricRegionAABBs: The axis-aligned aabbs of any regions featuring QUA bodies, mapping region names to fluka.AABB instances.
     :type quadricRegionAABBs: dict
+    :param workers: Number of processes the region solids are meshed in.  None or 1 meshes them in this process.  The resulting registry is the same either way.
+    :type workers: int
 
     Developer options (to kwargs) withLengthSafety: Whether or not to apply automatic length safety.
 
@@ -102,18 +110,62 @@ def fluka2Geant4(
 
     # After the several steps above transforming the fluka registry, we now
     # take the transformed fluka registry and convert it to a g4 registry.
-    return _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo)
+    return _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo, workers=workers)
 
 
-def _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo):
+def _regionMeshSerialised(job):
     """
-    Convert a transformed fluka registry to a geant4 registry.
+    Mesh the Geant4 solid of a region in a throwaway registry and return it as arrays,
+    or None if it cannot be meshed (the error is then reported when it is meshed again).
+    """
+    region, aabbMap = job
+    solid = region.geant4Solid(_g4.Registry(), aabb=aabbMap)
+    try:
+        return _cachedMesh(solid).toArrays()
+    except (_exceptions.NullMeshError, ValueError):
+        return None
+
+
+def _regionMeshes(regions, aabbMap, workers):
+    """
+    Mesh the Geant4 solids of the regions over worker processes, returning the meshes in
+    the order of the regions (None for any that could not be meshed).
+    """
+    jobs = []
+    for region in regions:
+        regionAABBMap = aabbMap
+        if aabbMap is not None:
+            # only send the aabbs of the bodies in this region
+            names = {body.name for body in region.bodies()}
+            regionAABBMap = {name: aabb for name, aabb in aabbMap.items() if name in names}
+        jobs.append((region, regionAABBMap))
+
+    logger.info("fluka2Geant4> meshing %d regions over %d processes", len(jobs), workers)
+    with _ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(jobs) // (4 * workers))
+        return [
+            None if result is None else _CSG.fromArrays(*result)
+            for result in executor.map(_regionMeshSerialised, jobs, chunksize=chunksize)
+        ]
+
+
+def _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo, workers=None):
+    """
+    Convert a transformed fluka registry to a geant4 registry.  With workers > 1 the region
+    solids are meshed in a process pool first, the registry itself is always filled in
+    region order in this process so names and ordering do not depend on workers.
     """
     greg = _g4.Registry()
     f2g4mat = _makeFlukaToG4MaterialsMap(flukareg, greg)
     wlv = _makeWorldVolume(_getWorldDimensions(worldinfo.dimensions), worldinfo.material, greg)
+
+    regions = list(regions)
+    meshes = [None] * len(regions)
+    if workers is not None and workers > 1 and len(regions) > 1 and _config.doMeshing:
+        meshes = _regionMeshes(regions, aabbinfo.aabbMap, workers)
+
     regionNamesToLVs = {}
-    for region in regions:
+    for region, mesh in zip(regions, meshes):
         name = region.name
         region_solid = region.geant4Solid(greg, aabb=aabbinfo.aabbMap)
 
@@ -125,7 +177,7 @@ def _flukaRegistryToG4Registry(flukareg, regions, worldinfo, aabbinfo):
 
         material = f2g4mat[materialName[0]]
 
-        region_lv = _g4.LogicalVolume(region_solid, material, f"{name}_lv", greg)
+        region_lv = _g4.LogicalVolume(region_solid, material, f"{name}_lv", greg, localMesh=mesh)
 
         regionNamesToLVs[name] = region_lv
         # We reverse because rotations in the context of Booleans are
@@ -212,7 +264,11 @@ def _makeLengthSafetyRegistry(flukareg, regions):
 
 def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs):
     """Loop over the regions, and for each region, get all the aabbs
-    of the zones belonging to that region.  Don't do this for
+    of the zones belonging to that region.  These are computed
+    analytically from the bodies (Region.zoneAABBs) rather than by
+    meshing each zone, with None for zones found to be empty.  Only
+    zones whose emptiness the bounding boxes cannot decide, such as
+    those with curved subtractions, are meshed.  Don't do this for
     quadricRegionAABBs, instead, just continue to use the aabb
     provided by the user."""
 
@@ -240,7 +296,9 @@ def _getRegionZoneAABBs(flukareg, regions, quadricRegionAABBs):
         elif name not in regions:
             continue
         else:
-            regionZoneAABBs[name] = region.zoneAABBs(aabb=None)
+            regionZoneAABBs[name] = region.zoneAABBs(
+                aabb=None, checkNull=True, flukaregistry=flukareg
+            )
     return regionZoneAABBs
 
 
@@ -366,7 +424,9 @@ def _getContentsOfLatticeCells(flukaregistry, regionAABBs):
         cellContents[cellName] = []
         for regionName in overlappingExents:
             region = regions[regionName]
-            overlapping = _isTransformedCellRegionIntersectingWithRegion(region, lattice)
+            overlapping = _isTransformedCellRegionIntersectingWithRegion(
+                region, lattice, flukaregistry
+            )
             if overlapping:
                 cellContents[cellName].append(regionName)
 
@@ -392,7 +452,7 @@ def _getTransformedCellRegionAABB(lattice):
     return _fluka.AABB(lower, upper)
 
 
-def _isTransformedCellRegionIntersectingWithRegion(region, lattice):
+def _isTransformedCellRegionIntersectingWithRegion(region, lattice, flukaregistry=None):
     cellRegion = _deepcopy(lattice.cellRegion)
 
     transform = lattice.getTransform()
@@ -412,7 +472,7 @@ def _isTransformedCellRegionIntersectingWithRegion(region, lattice):
     cellRegion.rotation = _types.MethodType(rotation, cellRegion)
     cellRegion.centre = _types.MethodType(centre, cellRegion)
 
-    return _do_intersect(cellRegion.mesh(), region.mesh())
+    return _do_intersect(cellRegion.mesh(), region.mesh(flukaregistry=flukaregistry))
 
 
 def _checkQuadricRegionAABBs(flukareg, quadricRegionAABBs):
@@ -6,6 +6,9 @@ from ..pycgal.core import PolygonProcessing as _PolygonProcessing
 from ..fluka.directive import (
     rotoTranslationFromTra2 as _rotoTranslationFromTra2,
 )
+from collections import Counter as _Counter
+from collections import namedtuple as _namedtuple
+import logging as _logging
 import numpy as _np
 import copy as _copy
 import scipy.linalg as _la
@@ -15,14 +18,68 @@ from ..fluka.body import *
 
 # import matplotlib.pyplot as _plt
 
+_log = _logging.getLogger(__name__)
 
-def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False):
+# first (full) placement of a logical volume that later placements are LATTICE cells of
+_Prototype = _namedtuple("_Prototype", ["mtra", "tra", "nBodies"])
+
+
+class _LatticePlacements:
+    """
+    Bookkeeping for placing repeated logical volumes as FLUKA lattice cells. The
+    first placement of a logical volume placed more than once below the converted
+    one is converted in full (the prototype, with no lattices inside it as FLUKA
+    does not nest them) and every further placement becomes a LATTICE cell: a
+    region of just its outer solid with a ROT-DEFI back onto the prototype.
+    """
+
+    def __init__(self, logicalVolume):
+        self.repeated = _repeatedLogicalVolumes(logicalVolume)
+        self.prototypes = {}
+        self.nCells = 0
+        self.nBodiesSaved = 0
+
+    def isCandidate(self, logicalVolume, mtra):
+        """
+        Whether a placement with rotation matrix mtra can be a prototype or lattice cell.
+        """
+        return (
+            logicalVolume.name in self.repeated
+            and logicalVolume.type == "logical"
+            and logicalVolume.solid.type != "extruder"
+            and len(logicalVolume.daughterVolumes) > 0
+            and all(type(dv) is _geant4.PhysicalVolume for dv in logicalVolume.daughterVolumes)
+            and _np.linalg.det(mtra) > 0  # no reflections
+        )
+
+
+def _repeatedLogicalVolumes(logicalVolume):
+    """
+    Names of the logical volumes placed more than once in the tree below a logical volume.
+    """
+    subtreeCounts = {}
+
+    def counts(lv):
+        if lv.name not in subtreeCounts:
+            c = _Counter()
+            for dv in lv.daughterVolumes:
+                c[dv.logicalVolume.name] += 1
+                c.update(counts(dv.logicalVolume))
+            subtreeCounts[lv.name] = c
+        return subtreeCounts[lv.name]
+
+    return {name for name, n in counts(logicalVolume).items() if n > 1}
+
+
+def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False, deduplicate=False):
     """
     Convert a Geant4 model to a FLUKA one. This is done by handing over a complete
     pyg4ometry.geant4.Registry instance.
 
     :param greg: geant4 registry
     :type greg: pyg4ometry.geant4.Registry
+    :param deduplicate: convert repeated logical volumes once and place the other copies as FLUKA LATTICE cells, and remove identical bodies
+    :type deduplicate: bool
 
     returns:  pyg4ometry.fluka.FlukaRegistry
     """
@@ -34,14 +91,18 @@ def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False):
     else:
         logi = greg.logicalVolumeDict[logicalVolumeName]
     freg = geant4MaterialDict2Fluka(greg.materialDict, freg)
-    freg = geant4Logical2Fluka(logi, freg, bakeTransforms)
+    freg = geant4Logical2Fluka(logi, freg, bakeTransforms, deduplicate)
 
     return freg
 
 
-def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False):
+def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False, deduplicate=False):
     """
     Convert a single logical volume - not the main entry point for the conversion.
+
+    With deduplicate, logical volumes with daughters placed more than once are
+    converted once and their other placements written as LATTICE cells, and
+    bodies identical to another body are removed (FlukaRegistry.removeDuplicateBodies).
     """
     mtra = _np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
     tra = _np.array([0, 0, 0])
@@ -51,6 +112,10 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
 
     flukaNameCount = 0
 
+    lattice = None
+    if deduplicate:
+        lattice = _LatticePlacements(logicalVolume)
+
     # find extent of logical
     extent = logicalVolume.extent(includeBoundingSolid=True)
 
@@ -137,6 +202,7 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
             flukaRegistry,
             flukaNameCount,
             bakeTransforms=bakeTransforms,
+            lattice=lattice,
         )
 
         # subtract daughters from black body
@@ -173,6 +239,18 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
     elif logicalVolume.type == "assembly":
         flukaRegistry.addMaterialAssignments("AIR", flukaMotherRegion)
 
+    if deduplicate:
+        removed = flukaRegistry.removeDuplicateBodies()
+        _log.info(
+            "geant42Fluka> %d placements of %d logical volumes as LATTICE cells saving %d bodies,"
+            " %d duplicate bodies removed, %d bodies",
+            lattice.nCells,
+            len(lattice.prototypes),
+            lattice.nBodiesSaved,
+            len(removed),
+            len(flukaRegistry.bodyDict),
+        )
+
     return flukaRegistry
 
 
@@ -183,7 +261,31 @@ def geant4PhysicalVolume2Fluka(
     flukaRegistry=None,
     flukaNameCount=0,
     bakeTransforms=False,
+    lattice=None,
 ):
+    logicalVolume = physicalVolume.logicalVolume
+    if lattice is not None and lattice.isCandidate(logicalVolume, mtra):
+        if logicalVolume.name in lattice.prototypes:
+            return _geant4PhysicalVolume2FlukaLatticeCell(
+                physicalVolume,
+                mtra,
+                tra,
+                flukaRegistry,
+                flukaNameCount,
+                bakeTransforms,
+                lattice,
+            )
+
+        # first placement, the prototype, is converted in full without lattices inside
+        nBodies = len(flukaRegistry.bodyDict)
+        result = geant4PhysicalVolume2Fluka(
+            physicalVolume, mtra, tra, flukaRegistry, flukaNameCount, bakeTransforms
+        )
+        lattice.prototypes[logicalVolume.name] = _Prototype(
+            mtra, tra, len(flukaRegistry.bodyDict) - nBodies
+        )
+        return result
+
     # logical volume (outer and complete)
     if physicalVolume.logicalVolume.type == "logical":
         geant4LvOuterSolid = physicalVolume.logicalVolume.solid
@@ -246,6 +348,7 @@ def geant4PhysicalVolume2Fluka(
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
                 bakeTransforms=bakeTransforms,
+                lattice=lattice,
             )
 
         materialName = daughterVolumes[0].logicalVolume.material.name
@@ -275,6 +378,7 @@ def geant4PhysicalVolume2Fluka(
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
                 bakeTransforms=bakeTransforms,
+                lattice=lattice,
             )
             if physicalVolume.logicalVolume.type == "logical":
                 for motherZones in flukaMotherRegion.zones:
@@ -302,6 +406,47 @@ def geant4PhysicalVolume2Fluka(
     return flukaMotherOuterRegion, flukaNameCount
 
 
+def _geant4PhysicalVolume2FlukaLatticeCell(
+    physicalVolume, mtra, tra, flukaRegistry, flukaNameCount, bakeTransforms, lattice
+):
+    """
+    Convert a repeated placement as a LATTICE cell of the prototype (the first placement)
+    of its logical volume. Returns the cell region, which is cut out of the mother like
+    any other daughter.
+    """
+    logicalVolume = physicalVolume.logicalVolume
+    prototype = lattice.prototypes[logicalVolume.name]
+    name = format(flukaNameCount, "04")
+
+    nBodies = len(flukaRegistry.bodyDict)
+    flukaCellOuterRegion, flukaNameCount = geant4Solid2FlukaRegion(
+        flukaNameCount,
+        logicalVolume.solid,
+        mtra,
+        tra,
+        flukaRegistry,
+        commentName=physicalVolume.name,
+        bakeTransforms=bakeTransforms,
+    )
+    flukaCellRegion = _copy.deepcopy(flukaCellOuterRegion)
+    flukaCellRegion.comment = physicalVolume.name
+
+    # transformation taking points in the cell to the corresponding points in the prototype
+    cellToPrototype = prototype.mtra @ _np.linalg.inv(mtra)
+    cellToPrototypeTra = _np.array(prototype.tra) - cellToPrototype @ _np.array(tra)
+    rotoTranslation = _rotoTranslationFromTra2(
+        "L" + name,
+        [_transformation.matrix2tbxyz(cellToPrototype), cellToPrototypeTra],
+        flukaregistry=flukaRegistry,
+    )
+    _fluka.Lattice(flukaCellRegion, rotoTranslation, flukaregistry=flukaRegistry)
+
+    lattice.nCells += 1
+    lattice.nBodiesSaved += prototype.nBodies - (len(flukaRegistry.bodyDict) - nBodies)
+
+    return flukaCellOuterRegion, flukaNameCount
+
+
 def geant4Solid2FlukaRegion(
     flukaNameCount,
     solid,
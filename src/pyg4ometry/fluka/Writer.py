@@ -120,7 +120,16 @@ class Writer:
         # loop over regions
         for rk in self.flukaRegistry.regionDict.keys():
             f.write(self.flukaRegistry.regionDict[rk].flukaFreeString())
+
+        # lattice cells are regions too
+        for lattice in self.flukaRegistry.latticeDict.values():
+            f.write(lattice.cellRegion.flukaFreeString())
         f.write("END\n")
+
+        # loop over lattices
+        for lattice in self.flukaRegistry.latticeDict.values():
+            f.write(lattice.flukaFreeString() + "\n")
+            rotdefi[lattice.rotoTranslation.name] = lattice.rotoTranslation
         f.write("GEOEND\n")
 
         # loop over materials
@@ -28,7 +28,7 @@ from math import degrees
 from contextlib import contextmanager
 from copy import deepcopy
 import logging
-from itertools import chain
+from itertools import chain, product
 
 import numpy as np
 import vtk
@@ -132,6 +132,53 @@ class BodyMixin(vis.ViewableMixin):
         mesh.translate(self.centre(aabb=aabb))
         return mesh
 
+    def aabb(self, aabb=None):
+        """
+        Axis-aligned bounding box of the body as given by mesh(aabb), computed from
+        its parameters and transform without building the geant4 solid or its mesh.
+        Curved surfaces are bounded exactly, so the box can be marginally larger than
+        that of the faceted mesh.
+
+        :param aabb: Optional reference AABB, as for mesh.
+        :type aabb: AABB
+        """
+        rotation = np.asarray(self.rotation(), dtype=float)
+        centre = np.asarray(self.centre(aabb=aabb), dtype=float)
+        points, ellipsoids = self._localBounds(aabb)
+
+        lower = []
+        upper = []
+        if len(points) != 0:
+            points = np.asarray(points, dtype=float) @ rotation.T + centre
+            lower.append(points.min(axis=0))
+            upper.append(points.max(axis=0))
+        for ellipsoidCentre, axes in ellipsoids:
+            # extent of c + sum_i a_i t_i with |t| <= 1 along each world axis
+            ellipsoidCentre = rotation @ ellipsoidCentre + centre
+            halfSize = np.sqrt(((np.asarray(axes, dtype=float) @ rotation.T) ** 2).sum(axis=0))
+            lower.append(ellipsoidCentre - halfSize)
+            upper.append(ellipsoidCentre + halfSize)
+
+        return vector.AABB(np.min(lower, axis=0), np.max(upper, axis=0))
+
+    def _localBounds(self, aabb):
+        # Points and ellipses/ellipsoids, as (centre, axis vectors), enclosing the
+        # geant4Solid of this body in its own frame.
+        msg = f"No analytic bounding box for {type(self).__name__}"
+        raise NotImplementedError(msg)
+
+
+def _boxCorners(halfSize):
+    return np.array(list(product([-1, 1], repeat=3))) * halfSize
+
+
+def _ellipse(z, semiX, semiY):
+    return np.array([0, 0, z]), np.array([[semiX, 0, 0], [0, semiY, 0]])
+
+
+def _ellipticalTubeBounds(semiX, semiY, halfLength):
+    return [], [_ellipse(-halfLength, semiX, semiY), _ellipse(halfLength, semiX, semiY)]
+
 
 class _HalfSpaceMixin(BodyMixin):
     # Base class for XYP, XZP, YZP.
@@ -142,6 +189,9 @@ class _HalfSpaceMixin(BodyMixin):
         boxsize = self._boxFullSize(aabb)
         return g4.solid.Box(self.name, boxsize, boxsize, boxsize, registry)
 
+    def _localBounds(self, aabb):
+        return _boxCorners(0.5 * self._boxFullSize(aabb)), []
+
     def _boxFullSize(self, aabb):
         if aabb is None:
             return INFINITY
@@ -205,6 +255,11 @@ class _InfiniteCylinderMixin(BodyMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        r = exp * self.radius
+        return _ellipticalTubeBounds(r, r, 0.5 * exp * self._aabbToScaleFactor(aabb))
+
     def _infCylinderFreestringHelper(self, coord1, coord2, coord3):
         typename = type(self).__name__
         return f"{typename} {self.name} {coord1} {coord2} {coord3}"
@@ -285,6 +340,9 @@ class RPP(BodyMixin):
         v = self.transform.netExpansion() * (self.upper - self.lower)
         return g4.solid.Box(self.name, v.x, v.y, v.z, reg, lunit="mm")
 
+    def _localBounds(self, aabb):
+        return _boxCorners(0.5 * self.transform.netExpansion() * (self.upper - self.lower)), []
+
     def __repr__(self):
         l = self.lower
         u = self.upper
@@ -399,6 +457,9 @@ class BOX(BodyMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        return _boxCorners(0.5 * self.transform.netExpansion() * self.lengths()), []
+
     def __repr__(self):
         return f"<BOX: {self.name}, v={list(self.vertex)}, e1={list(self.edge1)}, e2={list(self.edge2)}, e3={list(self.edge3)}>"
 
@@ -483,6 +544,10 @@ class SPH(BodyMixin):
     def geant4Solid(self, reg, aabb=None):
         return g4.solid.Orb(self.name, self.transform.netExpansion() * self.radius, reg, lunit="mm")
 
+    def _localBounds(self, aabb):
+        r = self.transform.netExpansion() * self.radius
+        return [], [(np.zeros(3), r * np.identity(3))]
+
     def __repr__(self):
         return f"<SPH: {self.name}, point={list(self.point)}, r={self.radius}>"
 
@@ -566,6 +631,11 @@ class RCC(BodyMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        r = exp * self.radius
+        return _ellipticalTubeBounds(r, r, 0.5 * exp * self.direction.length())
+
     def __repr__(self):
         f = list(self.face)
         d = list(self.direction)
@@ -686,6 +756,15 @@ class REC(BodyMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        # EllipticalTube takes semi-axes and a half length, as given above
+        return _ellipticalTubeBounds(
+            2 * exp * self.semiminor.length(),
+            2 * exp * self.semimajor.length(),
+            exp * self.direction.length(),
+        )
+
     def __repr__(self):
         return f"<REC: {self.name}, face={list(self.face)}, dir={list(self.direction)}, semimin={list(self.semiminor)}, semimaj={list(self.semimajor)}>"
 
@@ -803,6 +882,13 @@ class TRC(BodyMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        rMajor = exp * self.major_radius
+        rMinor = exp * self.minor_radius
+        halfLength = 0.5 * exp * self.direction.length()
+        return [], [_ellipse(-halfLength, rMajor, rMajor), _ellipse(halfLength, rMinor, rMinor)]
+
     def __repr__(self):
         return f"<TRC: {self.name}, major={list(self.major_centre)} direction={list(self.direction)} rmaj={self.major_radius}, rmin={self.minor_radius}>"
 
@@ -925,6 +1011,11 @@ class ELL(BodyMixin):
             greg,
         )
 
+    def _localBounds(self, aabb):
+        semiminor = self._semiminor()
+        semimajor = 0.5 * self.transform.netExpansion() * self.length
+        return [], [(np.zeros(3), np.diag([semiminor, semiminor, semimajor]))]
+
     def __repr__(self):
         f1 = list(self.focus1)
         f2 = list(self.focus2)
@@ -1039,6 +1130,12 @@ class _WED_RAW(BodyMixin):
             registry=greg,
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        face = [[0, 0], [exp * self.edge1.length(), 0], [0, exp * self.edge2.length()]]
+        length = exp * self.edge3.length()
+        return [[x, y, z] for z in (0, length) for x, y in face], []
+
     def __repr__(self):
         return f"<{type(self).__name__}: {self.name}, v={list(self.vertex)}, e1={list(self.edge1)}, e2={list(self.edge2)}, e3={list(self.edge3)}>"
 
@@ -1235,6 +1332,10 @@ class ARB(BodyMixin):
         verticesAndPolygons = self._getVerticesAndPolygons()
         return self._toTesselatedSolid(verticesAndPolygons, greg, addRegistry=True)
 
+    def _localBounds(self, aabb):
+        vertices, _, _ = self._toVerticesAndPolygons(reverse=False)
+        return np.vstack(vertices), []
+
     def _toTesselatedSolid(self, verticesAndPolygons, greg, addRegistry):
         return g4.solid.TessellatedSolid(
             self.name, verticesAndPolygons, greg, addRegistry=addRegistry
@@ -1344,12 +1445,17 @@ class ARB(BodyMixin):
         )
 
     def hash(self):
-        # TODO check this is all that is required
-        h = hash("ARB")
-        for v in self.vertices:
-            h ^= hash((v[0], v[1], v[2]))
-
-        h ^= self.transform.hash()
+        # the vertex order and the face numbers together define the faces
+        return (
+            hash(
+                (
+                    "ARB",
+                    tuple((v[0], v[1], v[2]) for v in self.vertices),
+                    tuple(self.facenumbers),
+                )
+            )
+            ^ self.transform.hash()
+        )
 
 
 class XYP(_HalfSpaceMixin):
@@ -1784,6 +1890,13 @@ class XEC(BodyMixin, _ShiftableCylinderMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        # EllipticalTube takes semi-axes and a half length, as given above
+        return _ellipticalTubeBounds(
+            2 * exp * self.zsemi, 2 * exp * self.ysemi, self._aabbToScaleFactor(aabb)
+        )
+
     def __repr__(self):
         return f"<XEC: {self.name}, y={self.y}, z={self.z}, ysemi={self.ysemi}, zsemi={self.zsemi}>"
 
@@ -1859,6 +1972,13 @@ class YEC(BodyMixin, _ShiftableCylinderMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        # EllipticalTube takes semi-axes and a half length, as given above
+        return _ellipticalTubeBounds(
+            2 * exp * self.xsemi, 2 * exp * self.zsemi, self._aabbToScaleFactor(aabb)
+        )
+
     def __repr__(self):
         return f"<YEC: {self.name}, z={self.z}, x={self.x}, zsemi={self.zsemi}, xsemi={self.xsemi}>"
 
@@ -1934,6 +2054,13 @@ class ZEC(BodyMixin, _ShiftableCylinderMixin):
             lunit="mm",
         )
 
+    def _localBounds(self, aabb):
+        exp = self.transform.netExpansion()
+        # EllipticalTube takes semi-axes and a half length, as given above
+        return _ellipticalTubeBounds(
+            2 * exp * self.xsemi, 2 * exp * self.ysemi, self._aabbToScaleFactor(aabb)
+        )
+
     def __repr__(self):
         return f"<ZEC: {self.name}, x={self.x}, y={self.y}, xsemi={self.xsemi}, ysemi={self.ysemi}>"
 
@@ -2177,6 +2304,44 @@ class QUA(BodyMixin):
             g4.solid.TessellatedSolid.MeshType.Freecad,
         )
 
+    def aabb(self, aabb=None):
+        """
+        Axis-aligned bounding box of the quadric as given by mesh(aabb).  A quadric
+        whose inside is an ellipsoid is bounded exactly, clipped to the box it is
+        sampled in; any other quadric is bounded by that box, which without an aabb
+        extends to +/-INFINITY.
+
+        :param aabb: Optional reference AABB, as for geant4Solid.
+        :type aabb: AABB
+        """
+        if aabb is None:
+            lower = np.full(3, -INFINITY, dtype=float)
+            upper = np.full(3, INFINITY, dtype=float)
+        else:
+            scale = self._aabbToScaleFactor(aabb)
+            lower = np.asarray(aabb.lower, dtype=float) - scale
+            upper = np.asarray(aabb.upper, dtype=float) + scale
+
+        inv = np.linalg.inv(self.transform.to4DMatrix())
+        quadric = inv.T.dot(self.coefficientsMatrix()).dot(inv)
+        a = quadric[:3, :3]
+        b = quadric[:3, 3]
+        c = quadric[3, 3]
+
+        # x^T a x + 2 b.x + c <= 0 is an ellipsoid if a is positive definite
+        if np.all(np.linalg.eigvalsh(a) > 0):
+            aInv = np.linalg.inv(a)
+            k = b.dot(aInv).dot(b) - c
+            if k > 0:
+                centre = -aInv.dot(b)
+                halfSize = np.sqrt(k * np.diag(aInv))
+                clippedLower = np.maximum(lower, centre - halfSize)
+                clippedUpper = np.minimum(upper, centre + halfSize)
+                if np.all(clippedLower < clippedUpper):
+                    lower, upper = clippedLower, clippedUpper
+
+        return vector.AABB(lower, upper)
+
     def _withLengthSafety(self, safety, reg=None):
         return QUA(
             self.name,
@@ -1,14 +1,22 @@
 from collections import namedtuple as _namedtuple
+from itertools import chain as _chain
+import logging as _logging
+import math as _math
 
 import antlr4 as _antlr4
 import numpy as _np
 import sympy as _sympy
 
-from . import vector as _vector
 from . import region as _region
 from . import reader as _reader
 from .RegionExpression import RegionParserVisitor, RegionParser, RegionLexer
 from . import fluka_registry
+from ..exceptions import FLUKAError as _FLUKAError
+
+logger = _logging.getLogger(__name__)
+
+# number of partial DNF terms remembered per depth to skip repeated branches
+_maxVisitedTerms = 4096
 
 
 def expressionToZone(zone, zoneExpr):
@@ -32,24 +40,142 @@ def expressionToZone(zone, zoneExpr):
     return freg.regionDict["dummy"].zones[0]
 
 
-def zoneToDNFZones(zone):
-    dnf = _sympy.to_dnf(zoneToAlgebraicExpression(zone))
-    zones = []
-    if isinstance(dnf, _sympy.And):
-        zones.append(expressionToZone(zone, dnf))
-        return zones
-
-    assert isinstance(dnf, _sympy.Or)
-
-    for arg in dnf.args:
-        # print("original",arg)
-        # arg = _sympy.simplify_logic(arg)  # trivially solve a & ~a, etc..
-        # print("simplified",arg)
-        if not arg:
-            continue
-        zones.append(expressionToZone(zone, arg))
-
-    return zones
+def zoneToDNFZones(zone, aabb=None, maxZones=None):
+    """
+    The zones of the disjunctive normal form of a zone, see iterDNFZones.
+    """
+    return list(iterDNFZones(zone, aabb=aabb, maxZones=maxZones))
+
+
+def iterDNFZones(zone, aabb=None, maxZones=None):
+    """
+    Expand a zone with subzones into its disjunctive normal form, yielding
+    the resulting zones (intersections and subtractions of bodies only) one
+    at a time.  The expansion is depth first, so the whole expansion is
+    never held in memory, and terms are pruned as they are built: a term
+    with a body both intersected and subtracted or whose intersected
+    bodies have disjoint bounding boxes is empty and dropped, and
+    subtracted bodies whose bounding boxes miss the intersected bodies are
+    left out.  Duplicate zones are yielded once.  See nTermsDNF for the
+    number of zones before pruning.
+
+    :param zone: Zone to expand.
+    :type zone: Zone
+    :param aabb: Optional reference AABB for the body bounding boxes (see BodyMixin.aabb).
+    :type aabb: AABB
+    :param maxZones: Optional limit on the number of zones, beyond which a FLUKAError is raised.
+    :type maxZones: int
+    """
+    bodyAABBs = {}
+
+    def bodyAABB(body):
+        if body.name not in bodyAABBs:
+            bodyAABBs[body.name] = body.aabb(aabb=aabb)
+        return bodyAABBs[body.name]
+
+    nZones = 0
+    for intersections, subtractions in _dnfTerms(zone, False, bodyAABB, True):
+        nZones += 1
+        if maxZones is not None and nZones > maxZones:
+            msg = f"DNF expansion of zone exceeds {maxZones} zones: {zone.dumps()}"
+            raise _FLUKAError(msg)
+
+        result = _region.Zone()
+        for body in intersections:
+            result.addIntersection(body)
+        for body in subtractions:
+            result.addSubtraction(body)
+        yield result
+
+
+def _booleanTerms(boolean, negated, bodyAABB):
+    """
+    DNF terms, as tuples of (body, isIntersection) literals, of one part of a zone.
+    """
+    isSubtraction = isinstance(boolean, _region.Subtraction)
+    if isinstance(boolean.body, _region.Zone):
+        return _dnfTerms(boolean.body, negated != isSubtraction, bodyAABB)
+    return [((boolean.body, negated == isSubtraction),)]
+
+
+def _dnfTerms(zone, negated, bodyAABB, split=False):
+    """
+    DNF terms of a zone or, if negated, of its complement.  The complement
+    of a zone is the union of the complements of its parts and a zone is
+    the product of its parts, which is expanded depth first, pruning empty
+    terms as early as possible.  With split the merged terms are returned
+    as (intersected bodies, subtracted bodies) rather than as literals.
+    """
+    parts = zone.intersections + zone.subtractions
+    if negated:
+        return _chain.from_iterable(_booleanTerms(b, True, bodyAABB) for b in parts)
+
+    # parts with fewest alternatives first, so branching starts from the smallest box
+    factors = sorted((list(_booleanTerms(b, False, bodyAABB)) for b in parts), key=len)
+
+    # Partial terms reached by different branches are only expanded once.  The
+    # partial terms of each depth are remembered up to _maxVisitedTerms, then
+    # forgotten, so the memory used stays bounded; completed terms are all
+    # remembered so that none is yielded twice.
+    visited = [set() for _ in range(len(factors))]
+    completed = set()
+
+    def expand(k, intersections, subtractions, box):
+        key = (frozenset(intersections), frozenset(subtractions))
+        seen = completed if k == len(factors) else visited[k]
+        if key in seen:
+            return
+        if seen is not completed and len(seen) >= _maxVisitedTerms:
+            seen.clear()
+        seen.add(key)
+
+        if k == len(factors):
+            if split:
+                yield list(intersections.values()), list(subtractions.values())
+            else:
+                yield tuple((b, True) for b in intersections.values()) + tuple(
+                    (b, False) for b in subtractions.values()
+                )
+            return
+
+        for term in factors[k]:
+            extended = _extendTerm(term, intersections, subtractions, box, bodyAABB)
+            if extended is not None:
+                yield from expand(k + 1, *extended)
+
+    return expand(0, {}, {}, None)
+
+
+def _extendTerm(term, intersections, subtractions, box, bodyAABB):
+    """
+    AND a term onto the intersected and subtracted bodies (dicts by name)
+    of a partial term whose intersection lies in box.  Returns the new
+    (intersections, subtractions, box), or None if the result is empty.
+    """
+    intersections = dict(intersections)
+    subtractions = dict(subtractions)
+    for body, isIntersection in term:
+        if body.name in (subtractions if isIntersection else intersections):
+            return None  # A & ~A
+        if not isIntersection:
+            subtractions[body.name] = body
+        elif body.name not in intersections:
+            intersections[body.name] = body
+            thisAABB = bodyAABB(body)
+            if box is not None:
+                if not thisAABB.coplanarIntersects(box):
+                    return None  # disjoint intersection
+                thisAABB = thisAABB.intersect(box)
+            box = thisAABB
+
+    if box is not None:
+        # subtracting a body outside the intersection does nothing
+        subtractions = {
+            name: body
+            for name, body in subtractions.items()
+            if bodyAABB(body).coplanarIntersects(box)
+        }
+    return intersections, subtractions, box
 
 
 def regionToAlgebraicExpression(region):  # region or zone
@@ -71,11 +197,6 @@ def zoneToAlgebraicExpression(zone):
     return _sympy.sympify(s, locals=namespace)
 
 
-def _getMeshAndAABB(body, aabb=None):
-    mesh = body.mesh(aabb=aabb)
-    return mesh, _vector.AABB.fromMesh(mesh)
-
-
 def pruneRegion(reg, aabb=None):
     result = _region.Region(reg.name)
     for zone in reg.zones:
@@ -105,15 +226,14 @@ def pruneZone(zone, aabb0=None, aabb=None):
 
     if aabb0 is None:
         first = intersections[0].body
-        mesh0 = first.mesh()
-        aabb0 = _vector.AABB.fromMesh(mesh0)
+        aabb0 = first.aabb()
         intersections = intersections[1:]
         result.addIntersection(first)
 
     for intersect in intersections:
         body = intersect.body
 
-        _, thisAABB = _getMeshAndAABB(body, aabb=aabb)
+        thisAABB = body.aabb(aabb=aabb)
         if thisAABB.coplanarIntersects(aabb0):
             aabb0 = thisAABB.intersect(aabb0)
             result.addIntersection(body)
@@ -123,7 +243,7 @@ def pruneZone(zone, aabb0=None, aabb=None):
 
     for sub in zone.subtractions:
         body = sub.body
-        _, thisAABB = _getMeshAndAABB(body, aabb=aabb)
+        thisAABB = body.aabb(aabb=aabb)
         if thisAABB.coplanarIntersects(aabb0):
             result.addSubtraction(body)
 
@@ -224,18 +344,29 @@ def _filterRedundantZonesMetricCheck(zoneData):
 
 
 def nTermsDNF(expr):
-    # expr is a Zone instance or a Region instance
+    """
+    Number of zones in the disjunctive normal form of a zone or region
+    before any pruning, i.e. an upper bound on the number of zones from
+    iterDNFZones, counted without expanding it.
+
+    :param expr: Zone or Region instance
+    """
     try:
         return sum(_nTermsDNFZone(e) for e in expr.zones)
     except AttributeError:
         return _nTermsDNFZone(expr)
 
 
-def _nTermsDNFZone(zone):
-    total = 1
-    for arg in zone.subtractions:
-        if not isinstance(arg.body, _region.Zone):
-            continue
-        total *= len(zone.intersections + zone.subtractions)
+def _nTermsDNFZone(zone, negated=False):
+    # a zone is the product of its parts and its complement the sum of theirs
+    counts = []
+    for arg in zone.intersections + zone.subtractions:
+        if isinstance(arg.body, _region.Zone):
+            isSubtraction = isinstance(arg, _region.Subtraction)
+            counts.append(_nTermsDNFZone(arg.body, negated != isSubtraction))
+        else:
+            counts.append(1)
 
-    return total
+    if negated:
+        return sum(counts)
+    return _math.prod(counts)
@@ -6,6 +6,8 @@ import numpy as _np
 import pandas as _pd
 from .. import geant4 as _g4
 from .region import Region as _Region
+from .region import Subtraction as _Subtraction
+from .region import Zone as _Zone
 from .region import bracket_depth as _bracket_depth
 from .region import bracket_number as _bracket_number
 from .directive import RecursiveRotoTranslation as _RecursiveRotoTranslation
@@ -27,6 +29,8 @@ from . import card as _card
 from ..transformation import tbxyz2matrix as _tbxyz2matrix
 from ..transformation import matrix2tbxyz as _matrix2tbxyz
 
+from .. import config as _config
+
 import logging as _logging
 
 logger = _logging.getLogger(__name__)
@@ -69,6 +73,9 @@ class FlukaRegistry:
 
         self.PhysVolToRegionMap = {}
 
+        self.meshMemo = {}  # memo key : mesh of a body or zone, see bodyMesh and zoneMesh
+        self._meshMemoKeys = {}  # body name : memo keys of the meshes it is part of
+
     def addBody(self, body):
         if body.name in self.bodyDict:
             raise _IdenticalNameError(body.name)
@@ -81,6 +88,92 @@ class FlukaRegistry:
     def getDegenerateBody(self, body):
         return self.bodyDict.getDegenerateBody(body)
 
+    def bodyMesh(self, body, aabb=None):
+        """
+        Return body.mesh(aabb=aabb), memoised so that a body shared by many zones
+        and regions is only meshed once for each aabb.  A fresh copy is returned
+        every time so it may be transformed freely.  Entries are keyed by the name
+        and hash() of the body, so a body whose parameters or transform change is
+        meshed again; invalidateBodyMesh drops its stale entries.  Bodies not
+        stored in this registry are always meshed again.
+
+        :param body: The body to mesh.
+        :type body: BodyMixin
+        :param aabb: Optional reference AABB, as for body.mesh.
+        :type aabb: AABB
+        """
+        bodyKey = self._bodyMeshKey(body)
+        if bodyKey is None:
+            return body.mesh(aabb=aabb)
+        key = ("body", bodyKey, _aabbMeshKey(aabb))
+        return self._memoisedMesh(key, [body.name], lambda: body.mesh(aabb=aabb))
+
+    def zoneMesh(self, zone, aabb=None):
+        """
+        Return zone.mesh(aabb=aabb) built from memoised body meshes (see bodyMesh)
+        and memoised itself, keyed by the booleans of the zone and the keys of its
+        bodies.  A fresh copy is returned every time.  Zones with bodies not stored
+        in this registry are not memoised.
+
+        :param zone: The zone to mesh.
+        :type zone: Zone
+        :param aabb: Optional reference AABB, as for zone.mesh.
+        :type aabb: AABB
+        """
+        zoneKey = self._zoneMeshKey(zone)
+        if zoneKey is None:
+            return zone.mesh(aabb=aabb, flukaregistry=self)
+        key = ("zone", zoneKey, _aabbMeshKey(aabb))
+        bodyNames = [body.name for body in zone.bodies()]
+        return self._memoisedMesh(key, bodyNames, lambda: zone.mesh(aabb=aabb, flukaregistry=self))
+
+    def invalidateBodyMesh(self, body):
+        """
+        Forget the memoised meshes of a body and of all zones it is used in.
+        Call after modifying a body in place.
+
+        :param body: The body or its name.
+        :type body: BodyMixin or str
+        """
+        name = getattr(body, "name", body)
+        for key in self._meshMemoKeys.pop(name, ()):
+            self.meshMemo.pop(key, None)
+
+    def clearMeshMemo(self):
+        """Forget all memoised body and zone meshes."""
+        self.meshMemo.clear()
+        self._meshMemoKeys.clear()
+
+    def _bodyMeshKey(self, body):
+        if not _config.memoiseSolidMeshes or self.bodyDict.get(body.name) is not body:
+            return None
+        return (body.name, body.hash())
+
+    def _zoneMeshKey(self, zone):
+        # Nested tuple of (is subtraction, body or subzone key), None if any body
+        # cannot be memoised.
+        key = []
+        for boolean in zone.intersections + zone.subtractions:
+            if isinstance(boolean.body, _Zone):
+                bodyKey = self._zoneMeshKey(boolean.body)
+            else:
+                bodyKey = self._bodyMeshKey(boolean.body)
+            if bodyKey is None:
+                return None
+            key.append((isinstance(boolean, _Subtraction), bodyKey))
+        return tuple(key)
+
+    def _memoisedMesh(self, key, bodyNames, makeMesh):
+        mesh = self.meshMemo.get(key)
+        if mesh is None:
+            mesh = makeMesh()
+            if mesh is None:
+                return None
+            self.meshMemo[key] = mesh
+            for name in bodyNames:
+                self._meshMemoKeys.setdefault(name, set()).add(key)
+        return mesh.clone()
+
     def addRotoTranslation(self, rototrans):
         self.rotoTranslations.addRotoTranslation(rototrans)
 
@@ -94,9 +187,62 @@ class FlukaRegistry:
 
         self.regionDict[region.name] = region
 
-    def makeRegionsDNF(self):
+    def makeRegionsDNF(self, maxZones=None):
+        """
+        Convert every region to disjunctive normal form (see Region.toDNF).
+
+        :param maxZones: Optional limit on the number of zones of each region, beyond which a FLUKAError is raised.
+        :type maxZones: int
+        """
         for r in self.regionDict:
-            self.regionDict[r] = self.regionDict[r].toDNF(r)
+            self.regionDict[r] = self.regionDict[r].toDNF(r, maxZones=maxZones)
+
+    def removeDuplicateBodies(self):
+        """
+        Replace every body identical (same type, parameters and transform) to
+        a body defined before it by that body, in all regions and lattice
+        cells, and remove it from the registry.
+
+        returns: dict of the names of the removed bodies to the names of the bodies used instead
+        """
+        kept = {}
+        replacements = {}
+        for name in self.bodyDict.keys():
+            body = self.bodyDict[name]
+            key = _bodyDefinitionKey(body)
+            if key in kept:
+                replacements[name] = kept[key]
+            else:
+                kept[key] = body
+
+        if not replacements:
+            return {}
+
+        def replaceBodies(zone):
+            for boolean in zone.intersections + zone.subtractions:
+                if isinstance(boolean.body, _Zone):
+                    replaceBodies(boolean.body)
+                elif boolean.body.name in replacements:
+                    boolean.body = replacements[boolean.body.name]
+
+        regions = list(self.regionDict.values())
+        regions += [lattice.cellRegion for lattice in self.latticeDict.values()]
+        for region in regions:
+            for zone in region.zones:
+                replaceBodies(zone)
+
+        bodyDict = type(self.bodyDict)()
+        for body in kept.values():
+            bodyDict.addBody(body)
+        self.bodyDict = bodyDict
+
+        self._bodiesAndRegions = {}
+        for region in self.regionDict.values():
+            self.addRegion(region)
+        for name in replacements:
+            self.invalidateBodyMesh(name)
+
+        return {name: body.name for name, body in replacements.items()}
 
     def addLattice(self, lattice):
         if lattice.cellRegion.name in self.regionDict:
@@ -120,7 +266,7 @@ class FlukaRegistry:
     def regionAABBs(self, write=None):
         regionAABBs = {}
         for regionName, region in self.regionDict.items():
-            regionAABBs[regionName] = region.extent()
+            regionAABBs[regionName] = region.aabb()
 
         if write:
             import pickle
@@ -133,7 +279,7 @@ class FlukaRegistry:
     def latticeAABBs(self):
         latticeCellAABBs = {}
         for cellName, lattice in self.latticeDict.items():
-            latticeCellAABBs[cellName] = lattice.cellRegion.extent()
+            latticeCellAABBs[cellName] = lattice.cellRegion.aabb()
         return latticeCellAABBs
 
     def addMaterial(self, material, recursive=False):
@@ -566,6 +712,21 @@ class FlukaRegistry:
             self.iMergeRegions += 1
 
 
+def _bodyDefinitionKey(body):
+    # The free format definition without comment and name, so that only
+    # bodies with exactly the same parameters compare equal, and the transform.
+    lines = [line for line in body.flukaFreeString().splitlines() if not line.startswith("*")]
+    words = lines[0].split(maxsplit=2)
+    del words[1]
+    return (type(body), " ".join(words), *lines[1:], body.transform.hash())
+
+
+def _aabbMeshKey(aabb):
+    if aabb is None:
+        return None
+    return (tuple(aabb.lower), tuple(aabb.upper))
+
+
 class RotoTranslationStore(_MutableMapping):
     """only get by names."""
 
@@ -851,6 +1012,9 @@ class FlukaBodyStoreExact:
     def values(self):
         return self.nameBody.values()
 
+    def get(self, key, default=None):
+        return self.nameBody.get(key, default)
+
     def __setitem__(self, key, value):
         assert key == value.name
         self.addBody(value)
@@ -1,4 +1,3 @@
-import itertools
 import logging
 from copy import deepcopy
 from uuid import uuid4
@@ -12,18 +11,17 @@ from . import vis
 from ..exceptions import FLUKAError, NullMeshError
 from .. import geant4 as g4
 from ..transformation import matrix2tbxyz, tbxyz2matrix, reverse
-from .body import BodyMixin
-from .vector import Three, AABB, areAABBsOverlapping
+from .body import BodyMixin, RPP, BOX, _HalfSpaceMixin
+from .vector import Three, AABB
 from . import boolean_algebra
 from ..transformation import tbxyz2axisangle
 from .. import config as _config
+from ..meshutils import aabbSweepAndPrune as _aabbSweepAndPrune
 
 if _config.meshing == _config.meshingType.pycsg:
     from ..pycsg.core import CSG, do_intersect
 elif _config.meshing == _config.meshingType.cgal_sm:
-    pass
-    # TODO reinstate intersecting meshes
-    # from pyg4ometry.pycgal.core import CSG, do_intersect, intersecting_meshes
+    from ..pycgal.core import CSG, do_intersect
 
 from textwrap import wrap as _wrap
 
@@ -185,35 +183,10 @@ class Zone(vis.ViewableMixin):
         self.intersections.append(Intersection(body))
 
     def convertToDNF(self, fluka_registry):
-        zone = Zone()
-
-        paraToDNF = []
-        for op in self.intersections + self.subtractions:
-            if isinstance(op.body, Zone):
-                paraToDNF.append(op)
-            elif isinstance(op, Subtraction):
-                zone.addSubtraction(op.body)
-            elif isinstance(op, Intersection):
-                zone.addIntersection(op.body)
-
-        r = Region("temp")
-        r.addZone(zone)
-
-        for para, i in zip(paraToDNF, range(len(paraToDNF))):
-            zone.addSubtraction(para.body)
-            sympy_expr = region_to_sympy(r)
-            sympy_expr_dnf = _sympy.to_dnf(sympy_expr)
-            print("convertToDNF", i, len(sympy_expr.args), len(sympy_expr_dnf.args))
-            # print("raw",r.dumps())
-            # print("g4",sympy_expr)
-            # print("dnf",sympy_expr_dnf)
-
-            r_to_add = sympy_to_region(sympy_expr_dnf, fluka_registry)
-            r_to_add.removeNullZones()
-            if r_to_add is not None:
-                r.extend(r_to_add)
-
-        return r
+        """
+        Region of the zones of the disjunctive normal form of this zone (see toDNF).
+        """
+        return self.toDNF("temp")
 
     def centre(self, aabb=None):
         body_name = self.intersections[0].body.name
@@ -238,14 +211,22 @@ class Zone(vis.ViewableMixin):
             aabb = _getAxisAlignedBoundingBox(aabb, boolean)
             return boolean.body.geant4Solid(g4reg, aabb=aabb)
 
-    def mesh(self, aabb=None):
+    def mesh(self, aabb=None, flukaregistry=None):
+        """
+        Mesh of this zone.
+
+        :param aabb: Optional reference AABB the bodies are meshed with respect to.
+        :type aabb: AABB
+        :param flukaregistry: Optional FlukaRegistry whose memoised body and subzone meshes are used (see FlukaRegistry.bodyMesh).
+        :type flukaregistry: FlukaRegistry
+        """
         if len(self.intersections) == 0:
             print(self.dumpsDebug())
             return None
 
-        result = self.intersections[0].body.mesh(aabb=aabb)
+        result = _booleanMesh(self.intersections[0], aabb, flukaregistry)
         for boolean in self.intersections[1:] + self.subtractions:
-            mesh = boolean.body.mesh(aabb=aabb)
+            mesh = _booleanMesh(boolean, aabb, flukaregistry)
             # TODOprint(boolean.body)
             if isinstance(boolean, Intersection):
                 result = result.intersect(mesh)
@@ -253,6 +234,52 @@ class Zone(vis.ViewableMixin):
                 result = result.subtract(mesh)
         return result
 
+    def aabb(self, aabb=None):
+        """
+        Axis-aligned bounding box of this zone from the analytic bounding boxes
+        of its bodies (see BodyMixin.aabb), without meshing.  The box of the
+        intersections is cut back by any subtracted axis-aligned box or
+        half-space covering one of its faces.  Returns None if the zone is
+        found to be empty.
+
+        :param aabb: Optional reference AABB, as for mesh.
+        :type aabb: AABB
+        """
+        if not self.intersections:
+            return None
+
+        lower = np.full(3, -np.inf)
+        upper = np.full(3, np.inf)
+        for boolean in self.intersections:
+            bodyAABB = boolean.body.aabb(aabb=aabb)
+            if bodyAABB is None:  # empty subzone
+                return None
+            lower = np.maximum(lower, np.asarray(bodyAABB.lower))
+            upper = np.minimum(upper, np.asarray(bodyAABB.upper))
+            if np.any(lower >= upper):
+                return None
+
+        for boolean in self.subtractions:
+            if not _isAxisAlignedBox(boolean.body):
+                continue
+            bodyAABB = boolean.body.aabb(aabb=aabb)
+            bodyLower = np.asarray(bodyAABB.lower)
+            bodyUpper = np.asarray(bodyAABB.upper)
+            below = bodyLower <= lower
+            above = bodyUpper >= upper
+            covered = below & above
+            if covered.all():
+                return None
+            if covered.sum() != 2:  # only a box covering a whole face can be cut off
+                continue
+            axis = np.argmin(covered)
+            if below[axis] and bodyUpper[axis] > lower[axis]:
+                lower[axis] = bodyUpper[axis]
+            elif above[axis] and bodyLower[axis] < upper[axis]:
+                upper[axis] = bodyLower[axis]
+
+        return AABB(lower, upper)
+
     def geant4Solid(self, reg, aabb=None):
         """
         Translate this zone to a geant4solid, adding the
@@ -514,9 +541,20 @@ class Zone(vis.ViewableMixin):
     def isNull(self, aabb=None):
         return self.mesh(aabb=aabb).isNull()
 
-    def toDNF(self, name):
+    def toDNF(self, name, aabb=None, maxZones=None):
+        """
+        Region of the zones of the disjunctive normal form of this zone,
+        see boolean_algebra.iterDNFZones.
+
+        :param name: Name of the resulting region.
+        :type name: str
+        :param aabb: Optional reference AABB for the body bounding boxes used to prune empty zones.
+        :type aabb: AABB
+        :param maxZones: Optional limit on the number of zones, beyond which a FLUKAError is raised.
+        :type maxZones: int
+        """
         r = Region(name)
-        r.zones = boolean_algebra.zoneToDNFZones(self)
+        r.zones = boolean_algebra.zoneToDNFZones(self, aabb=aabb, maxZones=maxZones)
         return r
 
     def isDNF(self):
@@ -621,10 +659,23 @@ class Region(vis.ViewableMixin):
             bodies = bodies.union(zone.bodies())
         return bodies
 
-    def mesh(self, aabb=None):
-        result = self.zones[0].mesh(aabb=aabb)
+    def mesh(self, aabb=None, flukaregistry=None):
+        """
+        Mesh of this region, the union of its zones.
+
+        :param aabb: Optional reference AABB the bodies are meshed with respect to.
+        :type aabb: AABB
+        :param flukaregistry: Optional FlukaRegistry whose memoised zone and body meshes are used (see FlukaRegistry.zoneMesh).
+        :type flukaregistry: FlukaRegistry
+        """
+        if flukaregistry is None:
+            zoneMesh = Zone.mesh
+        else:
+            zoneMesh = flukaregistry.zoneMesh
+
+        result = zoneMesh(self.zones[0], aabb=aabb)
         for zone in self.zones[1:]:
-            mesh = zone.mesh(aabb=aabb)
+            mesh = zoneMesh(zone, aabb=aabb)
             result = result.union(mesh)
         return result
 
@@ -688,19 +739,28 @@ class Region(vis.ViewableMixin):
         for zone in self.zones:
             zone.allBodiesToRegistry(registry)
 
-    def zoneGraph(self, zoneAABBs=None, aabb=None):
-        if _config.meshing == _config.meshingType.cgal_sm:
-            return self._zoneGraphPycgal()
-
+    def zoneGraph(self, zoneAABBs=None, aabb=None, flukaregistry=None):
+        """
+        Graph with a node for each zone and edges between intersecting zones, so that its
+        connected components are the groups of connected zones.  Candidate pairs are found
+        by sweep-and-prune on the zone AABBs and only pairs of zones not already known to
+        be connected are intersected, each zone being meshed at most once.
+
+        :param zoneAABBs: Optional precomputed zone AABBs (see zoneAABBs), None for empty zones.
+        :type zoneAABBs: list
+        :param aabb: Optional reference AABB the bodies are meshed with respect to.
+        :type aabb: AABB
+        :param flukaregistry: Optional FlukaRegistry whose memoised zone meshes are used.
+        :type flukaregistry: FlukaRegistry
+        """
         zones = self.zones
         n_zones = len(zones)
 
-        tried = []
         # Build undirected graph, and add nodes corresponding to each zone.
         graph = nx.Graph()
         graph.add_nodes_from(range(n_zones))
         if n_zones == 1:  # return here if there's only one zone.
-            return nx.connected_components(graph)
+            return graph
 
         # We allow the user to provide a list of zoneAABBs as an
         # optimisation, but if they have not been provided, then we
@@ -708,54 +768,93 @@ class Region(vis.ViewableMixin):
         if zoneAABBs is None:
             zoneAABBs = self.zoneAABBs(aabb=aabb)
 
-        # Loop over all combinations of zone numbers within this region
-        for i, j in itertools.product(range(n_zones), range(n_zones)):
-            # Trivially connected to self or tried this combination.
-            if i == j or {i, j} in tried:
-                continue
-            tried.append({i, j})
+        # Zones found to be empty are connected to nothing.
+        indices = [i for i, zoneAABB in enumerate(zoneAABBs) if zoneAABB is not None]
+        if len(indices) < 2:
+            return graph
+        lower = [zoneAABBs[i].lower for i in indices]
+        upper = [zoneAABBs[i].upper for i in indices]
+        candidates = _aabbSweepAndPrune(lower, upper)
 
-            # Check if the bounding boxes overlap.  Cheaper than intersecting.
-            if not areAABBsOverlapping(zoneAABBs[i], zoneAABBs[j]):
-                continue
+        if flukaregistry is None:
+            zoneMesh = Zone.mesh
+        else:
+            zoneMesh = flukaregistry.zoneMesh
 
-            # Check if a path already exists.  Not sure how often this
-            # arises but should at least occasionally save some time.
-            if nx.has_path(graph, i, j):
-                graph.add_edge(i, j)
+        meshes = {}
+
+        def mesh(i):
+            if i not in meshes:
+                meshes[i] = zoneMesh(zones[i], aabb=aabb)
+            return meshes[i]
+
+        # union-find over the zones, with path halving
+        parent = list(range(n_zones))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for k, l in candidates:
+            i, j = indices[k], indices[l]
+            ri, rj = find(i), find(j)
+            # Already connected through other zones, no need to intersect.
+            if ri == rj:
                 continue
 
-            # Finally: we must do the intersection op.
             logger.debug("Region = %s, int zone %d with %d", self.name, i, j)
-            if do_intersect(zones[i].mesh(aabb=aabb), zones[j].mesh(aabb=aabb)):
+            if do_intersect(mesh(i), mesh(j)):
                 graph.add_edge(i, j)
+                parent[max(ri, rj)] = min(ri, rj)
 
         return graph
 
-    def _zoneGraphPycgal(self):
-        meshes = [z.mesh() for z in self.zones]
-        intersections = intersecting_meshes(meshes)
-        graph = nx.Graph()
-        graph.add_nodes_from(range(len(self.zones)))
-        graph.add_edges_from(intersections)
-        return graph
+    def connectedZones(self, zoneAABBs=None, aabb=None, flukaregistry=None):
+        graph = self.zoneGraph(zoneAABBs=zoneAABBs, aabb=aabb, flukaregistry=flukaregistry)
+        return list(nx.connected_components(graph))
 
-    def connectedZones(self, zoneAABBs=None, aabb=None):
-        return list(nx.connected_components(self.zoneGraph(zoneAABBs=zoneAABBs, aabb=aabb)))
+    def zoneAABBs(self, aabb=None, checkNull=False, flukaregistry=None):
+        """
+        Analytic axis-aligned bounding boxes of the zones (see Zone.aabb), None
+        for zones found to be empty.
+
+        :param aabb: Optional reference AABB, as for mesh.
+        :type aabb: AABB
+        :param checkNull: Mesh the zones whose emptiness cannot be decided from the bounding boxes alone (e.g. +SPH -SPH) to find the empty ones.
+        :type checkNull: bool
+        :param flukaregistry: Optional FlukaRegistry whose memoised zone meshes are used for checkNull.
+        :type flukaregistry: FlukaRegistry
+        """
+        if flukaregistry is None:
+            zoneMesh = Zone.mesh
+        else:
+            zoneMesh = flukaregistry.zoneMesh
 
-    def zoneAABBs(self, aabb=None):
-        extents = []
+        zoneAABBs = []
         for zone in self.zones:
-            try:
-                zoneExtent = AABB.fromMesh(zone.mesh(aabb=aabb))
-            except ValueError:
-                zoneExtent = None
-            extents.append(zoneExtent)
-
-        return extents
+            zoneAABB = zone.aabb(aabb=aabb)
+            if zoneAABB is not None and checkNull and not _isAABBExact(zone):
+                try:
+                    AABB.fromMesh(zoneMesh(zone, aabb=aabb))
+                except (ValueError, NullMeshError):
+                    zoneAABB = None
+            zoneAABBs.append(zoneAABB)
+        return zoneAABBs
 
     def aabb(self, aabb=None):
-        return AABB.fromMesh(self.mesh(aabb=aabb))
+        """
+        Analytic axis-aligned bounding box of this region, the union of the
+        bounding boxes of its zones, or None if all zones are found to be empty.
+        """
+        zoneAABBs = [a for a in self.zoneAABBs(aabb=aabb) if a is not None]
+        if not zoneAABBs:
+            return None
+        result = zoneAABBs[0]
+        for zoneAABB in zoneAABBs[1:]:
+            result = result.union(zoneAABB)
+        return result
 
     def removeBody(self, name):
         """
@@ -785,14 +884,36 @@ class Region(vis.ViewableMixin):
     def isNull(self, aabb=None):
         return all(z.isNull(aabb=aabb) for z in self.zones)
 
-    def toDNF(self, name):
+    def toDNF(self, name, aabb=None, maxZones=None):
+        """
+        Region with the zones of this region in disjunctive normal form,
+        zones with subzones being expanded incrementally with
+        boolean_algebra.iterDNFZones.
+
+        :param name: Name of the resulting region.
+        :type name: str
+        :param aabb: Optional reference AABB for the body bounding boxes used to prune empty zones.
+        :type aabb: AABB
+        :param maxZones: Optional limit on the number of zones, beyond which a FLUKAError is raised.
+        :type maxZones: int
+        """
         result = Region(name)
         for zone in self.zones:
             if zone.isDNF():
-                result.zones.append(zone)
+                zones = [zone]
             else:
-                # result.zones.extend(boolean_algebra.zoneToDNFZones(zone))
-                result.zones.extend(boolean_algebra.zoneToDNFZonesInremental(zone))
+                logger.debug(
+                    "Region = %s, expanding zone of up to %d DNF terms",
+                    self.name,
+                    boolean_algebra.nTermsDNF(zone),
+                )
+                zones = boolean_algebra.iterDNFZones(zone, aabb=aabb)
+
+            for dnfZone in zones:
+                result.zones.append(dnfZone)
+                if maxZones is not None and len(result.zones) > maxZones:
+                    msg = f"DNF of region {self.name} exceeds {maxZones} zones."
+                    raise FLUKAError(msg)
         return result
 
     def isDNF(self):
@@ -871,6 +992,37 @@ def _randomName():
     return f"a{uuid4()}".replace("-", "")
 
 
+def _booleanMesh(boolean, aabb, flukaregistry):
+    # Mesh of the body or subzone of a boolean, memoised by flukaregistry if given.
+    body = boolean.body
+    if flukaregistry is None:
+        return body.mesh(aabb=aabb)
+    elif isinstance(body, Zone):
+        return flukaregistry.zoneMesh(body, aabb=aabb)
+    return flukaregistry.bodyMesh(body, aabb=aabb)
+
+
+def _isAxisAlignedBox(body):
+    # Bodies meshed as boxes with faces parallel to the axes are equal to
+    # their bounding box, so it can be subtracted from other bounding boxes.
+    if not isinstance(body, (RPP, BOX, _HalfSpaceMixin)):
+        return False
+    rotation = np.abs(np.asarray(body.rotation(), dtype=float))
+    return np.allclose(rotation, np.round(rotation))
+
+
+def _isAABBExact(zone):
+    # Zone.aabb is None for every empty zone only if all subtractions are
+    # axis-aligned boxes and the intersection is either a single body or of
+    # axis-aligned boxes only.  Otherwise, e.g. +SPH -SPH, the zone may be empty
+    # although its bounding box is not.
+    if not all(_isAxisAlignedBox(boolean.body) for boolean in zone.subtractions):
+        return False
+    if len(zone.intersections) == 1:
+        return not isinstance(zone.intersections[0].body, Zone)
+    return all(_isAxisAlignedBox(boolean.body) for boolean in zone.intersections)
+
+
 def _makeWorldLogicalVolume(reg):
     world_material = g4.MaterialPredefined("G4_Galactic")
     world_solid = g4.solid.Box("world_box", 100, 100, 100, reg, "mm")
@@ -1,11 +1,13 @@
 import numbers as _numbers
 import numpy as _np
-import re as _re
 import logging as _log
 from . import Units as _Units
 
 _log = _log.getLogger(__name__)
 
+# parser for expressions without a registry, see BasicExpression.eval
+_expressionParser = None
+
 
 class BasicExpression:
     """
@@ -27,33 +29,37 @@ class BasicExpression:
 
     def __init__(self, name, expressionString, registry):
         self.name = name
-        self.expressionString = expressionString
+        self._expressionString = expressionString
         self.parseTree = None
         self.registry = registry
 
+    @property
+    def expressionString(self):
+        return self._expressionString
+
+    @expressionString.setter
+    def expressionString(self, expressionString):
+        self._expressionString = expressionString
+        # this may be the expression of a define other expressions depend on
+        if self.registry is not None:
+            self.registry.registerDefineEdit()
+
     def eval(self):
-        # short-cut for expressions only having a numeric part.
-        num_re = r"-?[0-9]+(?:\.[0-9]+)?(?:e-?[0-9]{1,2})?"
-        if _re.match(num_re + "$", self.expressionString):
-            return float(self.expressionString)
-
-        # short-cut for expressions only having a numeric part and a unit.
-        num_w_unit_re = "(" + num_re + r")(?:\*([a-zA-Z]+))?$"
-        match_w_unit = _re.match(num_w_unit_re, self.expressionString)
-        if match_w_unit:
-            unit = _Units.unit(match_w_unit.group(2))
-            if unit is not None:
-                return float(match_w_unit.group(1)) * unit
+        if self.registry is None:
+            # no defines to refer to and no registry to memoise the value in
+            global _expressionParser
+            if _expressionParser is None:
+                from .GdmlExpression import ExpressionParser
 
-        expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        value = expressionParser.evaluate(self.parseTree, self.registry.defineDict)
-        return value
+                _expressionParser = ExpressionParser()
+            return _expressionParser.compile(self._expressionString)({})
+
+        # parsed once per distinct string and memoised in the registry until a define changes
+        return self.registry.evaluateExpression(self._expressionString)
 
     def variables(self, allDependents=False):
         expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        variables = expressionParser.get_variables(self.parseTree)
+        variables = expressionParser.variables(self._expressionString)
         if allDependents:
             dependents = []
             for v in variables:
@@ -132,8 +138,7 @@ def evaluateToFloat(reg, obj):
         elif isinstance(obj, ScalarBase) or isinstance(obj, VectorBase):
             return obj.eval()
         else:
-            evaluatable = BasicExpression("", obj, reg)
-        ans = float(evaluatable.eval())
+            ans = float(reg.evaluateExpression(obj))
     return ans
 
 
@@ -375,6 +380,8 @@ class ScalarBase(DefineBase):
             upgradeToStringExpression(self.registry, expressionString),
             self.registry,
         )
+        if self.registry is not None:
+            self.registry.registerDefineEdit()
 
     def setRegistry(self, registry):
         super().setRegistry(registry)
@@ -5,10 +5,22 @@ from .GdmlExpressionParser import GdmlExpressionParser
 from .GdmlExpressionVisitor import GdmlExpressionVisitor
 
 from ..Units import units as _units
+from ..Units import unit as _unit
 
 import math
 import numpy
 import builtins
+import re
+from collections import OrderedDict
+
+# expressions that are only a number, optionally times a unit, are evaluated without ANTLR
+_number_re = re.compile(r"-?[0-9]+(?:\.[0-9]+)?(?:e-?[0-9]{1,2})?$")
+_number_with_unit_re = re.compile(r"(-?[0-9]+(?:\.[0-9]+)?(?:e-?[0-9]{1,2})?)(?:\*([a-zA-Z]+))?$")
+
+# expression string : compiled function of the define dictionary, shared by all parsers and
+# bounded to the _compiledMaxSize most recently used expressions
+_compiled = OrderedDict()
+_compiledMaxSize = 100000
 
 
 class GdmlExpressionEvalVisitor(GdmlExpressionVisitor):
@@ -167,10 +179,165 @@ class GdmlExpressionEvalVisitor(GdmlExpressionVisitor):
                 return getattr(math, constant().getText())
 
 
+def _lookup_variable(defines, name):
+    try:
+        return defines[name]
+    except KeyError:
+        try:
+            return _units[name]
+        except KeyError as err:
+            msg = f"<= Undefined variable : {name}"
+            if not err.args:
+                err.args = ("",)
+            err.args = (*err.args, msg)
+            raise
+
+
+class GdmlExpressionCompileVisitor(GdmlExpressionEvalVisitor):
+    """
+    Translates a parse tree into a Python closure taking the define dictionary. The
+    closures perform the same operations in the same order as GdmlExpressionEvalVisitor,
+    so an expression only has to be lexed and parsed once however often it is evaluated.
+    """
+
+    def visitVariable(self, ctx):
+        name = ctx.VARIABLE().getText()
+        return lambda defines: _lookup_variable(defines, name)
+
+    def visitScientific(self, ctx):
+        value = float(ctx.SCIENTIFIC_NUMBER().getText())
+        return lambda defines: value
+
+    def visitMultiplyingExpression(self, ctx):
+        first = self.visit(ctx.powExpression(0))
+        rest = [
+            (bool(ctx.operatorMulDiv(i).TIMES()), self.visit(ctx.powExpression(i + 1)))
+            for i in range(len(ctx.operatorMulDiv()))
+        ]
+
+        def multiplying(defines):
+            left = float(first(defines))
+            for times, right in rest:
+                if times:
+                    left *= float(right(defines))
+                else:
+                    left /= float(right(defines))
+            return left
+
+        return multiplying
+
+    def visitExpression(self, ctx):
+        first = self.visit(ctx.multiplyingExpression(0))
+        rest = [
+            (bool(ctx.operatorAddSub(i).PLUS()), self.visit(ctx.multiplyingExpression(i + 1)))
+            for i in range(len(ctx.operatorAddSub()))
+        ]
+
+        def adding(defines):
+            left = float(first(defines))
+            for plus, right in rest:
+                if plus:
+                    left += float(right(defines))
+                else:
+                    left -= float(right(defines))
+            return left
+
+        return adding
+
+    def visitPowExpression(self, ctx):
+        first = self.visit(ctx.signedAtom(0))
+        powers = [self.visit(ctx.signedAtom(i + 1)) for i in range(len(ctx.POW()))]
+
+        def power(defines):
+            base = float(first(defines))
+            for p in powers:
+                base = base ** float(p(defines))
+            return base
+
+        return power
+
+    def visitMinExpression(self, ctx):
+        v1 = self.visit(ctx.signedAtom(0))
+        v2 = self.visit(ctx.signedAtom(1))
+        return lambda defines: min(float(v1(defines)), float(v2(defines)))
+
+    def visitMaxExpression(self, ctx):
+        v1 = self.visit(ctx.signedAtom(0))
+        v2 = self.visit(ctx.signedAtom(1))
+        return lambda defines: max(float(v1(defines)), float(v2(defines)))
+
+    def visitMatrixElement(self, ctx):
+        matrix = self.visit(ctx.variable())
+        indices = [self.visit(ctx.expression(i)) for i in range(len(ctx.COMMA()) + 1)]
+
+        def element(defines):
+            m = matrix(defines)
+            return m.values_asarray[tuple(int(index(defines)) - 1 for index in indices)]
+
+        return element
+
+    def visitParens(self, ctx):
+        return self.visit(ctx.expression())
+
+    def visitSignedAtom(self, ctx):
+        sign = -1 if ctx.MINUS() else 1
+        if ctx.func():
+            value = self.visit(ctx.func())
+        elif ctx.atom():
+            value = self.visit(ctx.atom())
+        elif ctx.signedAtom():
+            value = self.visit(ctx.signedAtom())
+        else:
+            return lambda defines: sign * 0.0
+
+        return lambda defines: sign * float(value(defines))
+
+    def visitAtom(self, ctx):
+        if ctx.constant():
+            value = self.visit(ctx.constant())
+        elif ctx.variable():
+            value = self.visit(ctx.variable())
+        elif ctx.expression():  # This handles expr with and without parens
+            value = self.visit(ctx.expression())
+        elif ctx.scientific():
+            value = self.visit(ctx.scientific())
+        elif ctx.matrixElement():
+            value = self.visit(ctx.matrixElement())
+        else:
+            msg = "Invalid atom."
+            raise SystemExit(msg)  ##DEBUG####
+
+        return lambda defines: float(value(defines))
+
+    def visitFunc(self, ctx):
+        function_name = str(self.visit(ctx.funcname()))
+        if hasattr(builtins, function_name):
+            function = getattr(builtins, function_name)
+        elif hasattr(math, function_name):
+            function = getattr(math, function_name)
+        elif hasattr(numpy, function_name):
+            function = getattr(numpy, function_name)
+        else:
+            msg = f"Function {function_name} not found in 'builtins', 'numpy' or 'math'"
+            raise ValueError(msg)
+
+        arguments = [self.visit(expr) for expr in ctx.expression()]
+        return lambda defines: function(*[a(defines) for a in arguments])
+
+    def visitConstant(self, ctx):
+        for c in ["PI", "EULER", "I"]:
+            constant = getattr(ctx, c)
+            if constant():
+                name = constant().getText()
+                return lambda defines: getattr(math, name)
+
+
 class ExpressionParser:
     def __init__(self):
         self.visitor = GdmlExpressionEvalVisitor()
+        self.compiler = GdmlExpressionCompileVisitor()
         self.defines_dict = {}
+        self.variables_cache = {}
 
     def parse(self, expression):
         # Make a char stream out of the expression
@@ -193,6 +360,51 @@ class ExpressionParser:
 
         return result
 
+    def compile(self, expression):
+        """
+        Return a function of the define dictionary evaluating expression. Each distinct
+        expression string is only parsed once.
+
+        :param expression: expression to compile e.g. "2*a+3"
+        :type expression: str
+        """
+        try:
+            function = _compiled[expression]
+            _compiled.move_to_end(expression)
+            return function
+        except KeyError:
+            pass
+
+        # plain numbers are cheap to convert, so are not kept in the cache
+        if _number_re.match(expression):
+            value = float(expression)
+            return lambda defines: value
+
+        match = _number_with_unit_re.match(expression)
+        if match:
+            unit = _unit(match.group(2))
+            if unit is not None:
+                value = float(match.group(1)) * unit
+                return lambda defines: value
+
+        function = self.compiler.visit(self.parse(expression))
+        _compiled[expression] = function
+        while len(_compiled) > _compiledMaxSize:
+            _compiled.popitem(last=False)
+        return function
+
+    def variables(self, expression):
+        """
+        Return the names of the variables used in expression, parsing each distinct
+        expression string only once.
+        """
+        try:
+            return list(self.variables_cache[expression])
+        except KeyError:
+            variables = self.get_variables(self.parse(expression))
+            self.variables_cache[expression] = variables
+            return list(variables)
+
     def get_variables(self, parse_tree):
         variables = []
         if hasattr(parse_tree, "children"):
@@ -1,7 +1,9 @@
 from collections import defaultdict as _defaultdict
 import re as _re
 from xml.dom import minidom as _minidom
+from xml.dom import pulldom as _pulldom
 import xml.parsers.expat as _expat
+import xml.sax as _sax
 from . import Defines as _defines
 import logging as _log
 from .. import geant4 as _g4
@@ -28,6 +30,8 @@ class Reader:
     :type reduceNISTMaterialsToPredefined: bool
     :param makeAllVisible: loaded volumes with aux info to make them invisible will be ignored and made visible
     :type makeAllVisible: bool
+    :param streaming: parse the file incrementally, see loadStreaming
+    :type streaming: bool
 
     When loading a GDML file that was exported by Geant4, the NIST materials may be
     fully expanded to include their full element / isotope composition. With the
@@ -43,9 +47,11 @@ class Reader:
         skipMaterials=False,
         reduceNISTMaterialsToPredefined=False,
         makeAllVisible=False,
+        streaming=False,
     ):
         super().__init__()
         self.filename = fileName
+        self._streaming = streaming
         self.registryOn = registryOn
         self._reduceNISTMaterialsToPredefined = reduceNISTMaterialsToPredefined
         self._makeAllVisible = makeAllVisible
@@ -58,27 +64,26 @@ class Reader:
         self._physVolumeNameCount = _defaultdict(int)
 
         # load file
-        self.load()
-
-    def load(self):
-        _log.info("Reader.load>")
-        self._physVolumeNameCount.clear()
-
-        # open file
-        data = open(self.filename)
+        if self._streaming:
+            self.loadStreaming()
+        else:
+            self.load()
 
-        # Render out the ENTITY includes
+    def _entityFiles(self):
+        """
+        Return a dictionary of entity name : file name for the ENTITY includes declared
+        in the DOCTYPE block at the start of the file.
+        """
         # Only look at the starting block - no need to iterate over the whole file
-        start_block = ""
-        for line in data:
-            if line.startswith("<gdml"):
-                break
-            start_block += line
-        data.seek(0)  # Reset the file iterator
-
-        # Extract the information from entities and store in a dict
+        start_block = []
+        with open(self.filename) as data:
+            for line in data:
+                if line.startswith("<gdml"):
+                    break
+                start_block.append(line)
+
         entities = {}
-        en_block = _re.search("<!DOCTYPE(\\s+)gdml([\\s\\S]*)>", start_block)
+        en_block = _re.search("<!DOCTYPE(\\s+)gdml([\\s\\S]*)>", "".join(start_block))
 
         try:
             ents = en_block.group(0).split("<")
@@ -89,37 +94,42 @@ class Reader:
             if "ENTITY" in en:
                 name = en.split()[1]
                 filename = _re.search(r"[^\"]+", " ".join(en.split()[3:])).group(0)
-                filename = _os.path.dirname(self.filename) + "/" + filename
-
-                with open(filename) as content_file:
-                    # ensure the contents are properly prepared for parsing
-                    contents = ""
-                    for l in content_file:
-                        l = l.strip()
-                        if l.endswith(">"):
-                            end = ""
-                        else:
-                            end = " "
-                        if len(l) != 0:
-                            contents += l + end
-                entities[name] = (filename, contents)
+                entities[name] = _os.path.dirname(self.filename) + "/" + filename
+
+        return entities
+
+    def load(self):
+        _log.info("Reader.load>")
+        self._physVolumeNameCount.clear()
+
+        # open file
+        data = open(self.filename)
+
+        # Render out the ENTITY includes
+        entities = {}
+        for name, filename in self._entityFiles().items():
+            with open(filename) as content_file:
+                # ensure the contents are properly prepared for parsing
+                contents = []
+                for l in content_file:
+                    l = l.strip()
+                    if len(l) != 0:
+                        contents.append(l if l.endswith(">") else l + " ")
+            entities[name] = (filename, "".join(contents))
 
         # remove all newline charecters and whitespaces outside tags
-        fs = ""
+        fs = []
         for l in data:
             l = l.strip()
             # Render out entities in those lines
             if l.startswith("&"):
                 name = _re.search(r"&([\s\S]+)\;", l).group(1)
-                fs += entities[name][1]
+                fs.append(entities[name][1])
                 continue
 
-            if l.endswith(">"):
-                end = ""
-            else:
-                end = " "
             if len(l) != 0:
-                fs += l + end
+                fs.append(l if l.endswith(">") else l + " ")
+        fs = "".join(fs)
 
         # parse xml
         _log.debug("Reader.load> minidom parse")
@@ -146,6 +156,65 @@ class Reader:
 
         data.close()
 
+    def loadStreaming(self):
+        """
+        Parse the file incrementally instead of building a DOM of the whole document.
+        Every child element of the define, materials, solids, structure and userinfo
+        sections is expanded on its own, passed to the same parse functions as used by
+        load and then dropped, so the memory needed is proportional to the largest element
+        rather than to the file. The sections must be in the standard GDML order.
+        """
+        _log.info("Reader.loadStreaming>")
+        self._physVolumeNameCount.clear()
+
+        materials = []
+        elements = []
+        isotopes = []
+        materialSubstitutionNames = None
+        setupFound = False
+
+        stream = _GdmlStream(self.filename, self._entityFiles())
+        events = _pulldom.parse(stream, bufsize=2**16)
+        depth = 0
+        section = None
+        try:
+            for event, node in events:
+                if event == _pulldom.START_ELEMENT:
+                    depth += 1
+                    if depth == 2:
+                        section = node.tagName
+                        if section == "setup":
+                            _expandNode(events, node)
+                            depth -= 1
+                            if not setupFound:
+                                self.parseSetup(node)
+                                setupFound = True
+                    elif depth == 3:
+                        _expandNode(events, node)
+                        depth -= 1
+                        if section == "define":
+                            self.parseDefine(node)
+                        elif section == "materials" and not self._skipMaterials:
+                            self._parseMaterialNode(node, materials, elements, isotopes)
+                        elif section == "solids":
+                            self.parseSolid(node)
+                        elif section == "structure":
+                            self.extractStructureNodeData(node, materialSubstitutionNames)
+                        elif section == "userinfo":
+                            self._parseAuxiliary(node)
+
+                elif event == _pulldom.END_ELEMENT:
+                    if depth == 2 and section == "materials" and not self._skipMaterials:
+                        materialSubstitutionNames = self._makeMaterials(
+                            materials, elements, isotopes
+                        )
+                    depth -= 1
+        except _sax.SAXParseException as err:
+            _log.error(err)
+            raise
+        finally:
+            stream.close()
+
     def getRegistry(self):
         return self._registry
 
@@ -158,73 +227,76 @@ class Reader:
             return
 
         for df in self.xmldefines.childNodes:
-            try:
-                define_type = df.tagName
-            except AttributeError:
-                # comment so continue
-                continue
+            self.parseDefine(df)
 
-            name = df.attributes["name"].value
-            attrs = df.attributes
+    def parseDefine(self, df):
+        try:
+            define_type = df.tagName
+        except AttributeError:
+            # comment so continue
+            return
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        name = df.attributes["name"].value
+        attrs = df.attributes
 
-            # parse positions and rotations
-            def getXYZ(def_attrs):
-                x = def_attrs.get("x", "0.0")
-                y = def_attrs.get("y", "0.0")
-                z = def_attrs.get("z", "0.0")
-                u = def_attrs.get("unit", None)
-                return (x, y, z, u)
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-            # parse matrices
-            def getMatrix(def_attrs):
-                try:
-                    coldim = def_attrs["coldim"]
-                except KeyError:
-                    coldim = 0
-                values = def_attrs["values"].split()
-                return (coldim, values)
-
-            if define_type == "constant":
-                value = def_attrs["value"]
-                _defines.Constant(name, value, self._registry, True)
-            elif define_type == "quantity":
-                value = def_attrs["value"]
-                try:
-                    unit = def_attrs["unit"]
-                except KeyError:
-                    unit = None
-                try:
-                    qtype = def_attrs["type"]
-                except KeyError:
-                    qtype = None
-                _defines.Quantity(name, value, unit, qtype, self._registry, True)
-            elif define_type == "variable":
-                value = def_attrs["value"]
-                _defines.Variable(name, value, self._registry, True)
-            elif define_type == "expression":
-                value = df.childNodes[0].nodeValue
-                _defines.Expression(name, value, self._registry, True)
-            elif define_type == "position":
-                x, y, z, u = getXYZ(def_attrs)
-                unit = u if u else "mm"
-                _defines.Position(name, x, y, z, unit, self._registry, True)
-            elif define_type == "rotation":
-                x, y, z, u = getXYZ(def_attrs)
-                unit = u if u else "rad"
-                _defines.Rotation(name, x, y, z, unit, self._registry, True)
-            elif define_type == "scale":
-                x, y, z, u = getXYZ(def_attrs)
-                unit = u if u else "none"
-                _defines.Scale(name, x, y, z, unit, self._registry, True)
-            elif define_type == "matrix":
-                coldim, values = getMatrix(def_attrs)
-                _defines.Matrix(name, coldim, values, self._registry, True)
-            else:
-                _log.warning("unrecognised define: %s", define_type)
+        # parse positions and rotations
+        def getXYZ(def_attrs):
+            x = def_attrs.get("x", "0.0")
+            y = def_attrs.get("y", "0.0")
+            z = def_attrs.get("z", "0.0")
+            u = def_attrs.get("unit", None)
+            return (x, y, z, u)
+
+        # parse matrices
+        def getMatrix(def_attrs):
+            try:
+                coldim = def_attrs["coldim"]
+            except KeyError:
+                coldim = 0
+            values = def_attrs["values"].split()
+            return (coldim, values)
+
+        if define_type == "constant":
+            value = def_attrs["value"]
+            _defines.Constant(name, value, self._registry, True)
+        elif define_type == "quantity":
+            value = def_attrs["value"]
+            try:
+                unit = def_attrs["unit"]
+            except KeyError:
+                unit = None
+            try:
+                qtype = def_attrs["type"]
+            except KeyError:
+                qtype = None
+            _defines.Quantity(name, value, unit, qtype, self._registry, True)
+        elif define_type == "variable":
+            value = def_attrs["value"]
+            _defines.Variable(name, value, self._registry, True)
+        elif define_type == "expression":
+            value = df.childNodes[0].nodeValue
+            _defines.Expression(name, value, self._registry, True)
+        elif define_type == "position":
+            x, y, z, u = getXYZ(def_attrs)
+            unit = u if u else "mm"
+            _defines.Position(name, x, y, z, unit, self._registry, True)
+        elif define_type == "rotation":
+            x, y, z, u = getXYZ(def_attrs)
+            unit = u if u else "rad"
+            _defines.Rotation(name, x, y, z, unit, self._registry, True)
+        elif define_type == "scale":
+            x, y, z, u = getXYZ(def_attrs)
+            unit = u if u else "none"
+            _defines.Scale(name, x, y, z, unit, self._registry, True)
+        elif define_type == "matrix":
+            coldim, values = getMatrix(def_attrs)
+            _defines.Matrix(name, coldim, values, self._registry, True)
+        else:
+            _log.warning("unrecognised define: %s", define_type)
 
     def parseVector(self, node, type="position", addRegistry=True):
         try:
@@ -275,118 +347,123 @@ class Reader:
         self.materialdef = xmldoc.getElementsByTagName("materials")[0]
 
         for node in self.materialdef.childNodes:
-            if node.nodeType != node.ELEMENT_NODE:
-                # probably a comment node, skip
-                continue
+            self._parseMaterialNode(node, materials, elements, isotopes)
+
+        materialSubstitutionNames = self._makeMaterials(materials, elements, isotopes)
+        return materialSubstitutionNames
 
-            mat_type = node.tagName
+    def _parseMaterialNode(self, node, materials, elements, isotopes):
+        """
+        Collect the attributes of an isotope, element or material node. The objects are
+        made by _makeMaterials once all of them are known.
+        """
+        if node.nodeType != node.ELEMENT_NODE:
+            # probably a comment node, skip
+            return
 
-            name = node.attributes["name"].value
-            attrs = node.attributes
+        mat_type = node.tagName
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        name = node.attributes["name"].value
+        attrs = node.attributes
 
-            if mat_type == "isotope":
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-                    if chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
+        if mat_type == "isotope":
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-                isotopes.append(def_attrs)
+                if chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
 
-            elif mat_type == "element":
-                components = []
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
+            isotopes.append(def_attrs)
 
-                    if chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
+        elif mat_type == "element":
+            components = []
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-                    elif chNode.tagName == "fraction":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "fraction"
-                        components.append(comp)
+                if chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
 
-                def_attrs["components"] = components
-                elements.append(def_attrs)
+                elif chNode.tagName == "fraction":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "fraction"
+                    components.append(comp)
 
-            elif mat_type == "material":
-                components = []
-                properties = {}
+            def_attrs["components"] = components
+            elements.append(def_attrs)
 
-                try:
-                    state = node.attributes["state"].value
-                except:
-                    state = None
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
-
-                    if chNode.tagName == "D":
-                        def_attrs["density"] = chNode.attributes["value"].value
-
-                    elif chNode.tagName == "T":
-                        def_attrs["temperature"] = chNode.attributes["value"].value
-                        try:
-                            def_attrs["temperature_unit"] = chNode.attributes["unit"].value
-                        except KeyError:
-                            def_attrs["temperature_unit"] = "K"
+        elif mat_type == "material":
+            components = []
+            properties = {}
 
-                    elif chNode.tagName == "P":
-                        def_attrs["pressure"] = chNode.attributes["value"].value
-                        try:
-                            def_attrs["pressure_unit"] = chNode.attributes["unit"].value
-                        except KeyError:
-                            def_attrs["pressure_unit"] = "pascal"
-
-                    elif chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
-
-                    elif chNode.tagName == "composite":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "composite"
-                        components.append(comp)
-
-                    elif chNode.tagName == "fraction":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "fraction"
-                        components.append(comp)
-
-                    elif chNode.tagName == "property":
-                        try:
-                            properties[chNode.attributes["name"].value] = chNode.attributes[
-                                "value"
-                            ].value
-                        except KeyError:
-                            pass
+            try:
+                state = node.attributes["state"].value
+            except:
+                state = None
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-                        try:
-                            properties[chNode.attributes["name"].value] = chNode.attributes[
-                                "ref"
-                            ].value
-                        except KeyError:
-                            pass
+                if chNode.tagName == "D":
+                    def_attrs["density"] = chNode.attributes["value"].value
+
+                elif chNode.tagName == "T":
+                    def_attrs["temperature"] = chNode.attributes["value"].value
+                    try:
+                        def_attrs["temperature_unit"] = chNode.attributes["unit"].value
+                    except KeyError:
+                        def_attrs["temperature_unit"] = "K"
 
-                def_attrs["components"] = components
-                def_attrs["properties"] = properties
-                materials.append(def_attrs)
+                elif chNode.tagName == "P":
+                    def_attrs["pressure"] = chNode.attributes["value"].value
+                    try:
+                        def_attrs["pressure_unit"] = chNode.attributes["unit"].value
+                    except KeyError:
+                        def_attrs["pressure_unit"] = "pascal"
+
+                elif chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
+
+                elif chNode.tagName == "composite":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "composite"
+                    components.append(comp)
+
+                elif chNode.tagName == "fraction":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "fraction"
+                    components.append(comp)
+
+                elif chNode.tagName == "property":
+                    try:
+                        properties[chNode.attributes["name"].value] = chNode.attributes[
+                            "value"
+                        ].value
+                    except KeyError:
+                        pass
 
-            else:
-                _log.warning("Unrecognised define: %s", mat_type)
+                    try:
+                        properties[chNode.attributes["name"].value] = chNode.attributes["ref"].value
+                    except KeyError:
+                        pass
 
-        materialSubstitutionNames = self._makeMaterials(materials, elements, isotopes)
-        return materialSubstitutionNames
+            def_attrs["components"] = components
+            def_attrs["properties"] = properties
+            materials.append(def_attrs)
+
+        else:
+            _log.warning("Unrecognised define: %s", mat_type)
 
     def _makeMaterials(self, materials, elements, isotopes):
         """
@@ -557,86 +634,89 @@ class Reader:
         self.xmlsolids = xmldoc.getElementsByTagName("solids")[0]
 
         for node in self.xmlsolids.childNodes:
-            try:
-                solid_type = node.tagName
-            except AttributeError:
-                continue  # node is probably a comment so continue
-
-            if solid_type == "box":  # solid test 001
-                self.parseBox(node)
-            elif solid_type == "tube":  # solid test 002
-                self.parseTube(node)
-            elif solid_type == "cutTube":  # solid test 003
-                self.parseCutTube(node)
-            elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
-                self.parseCone(node)
-            elif solid_type == "para":  # solid test 005
-                self.parsePara(node)
-            elif solid_type == "trd":  # solid test 006
-                self.parseTrd(node)
-            elif solid_type == "trap":  # solid test 007
-                self.parseTrap(node)
-            elif solid_type == "sphere":  # solid test 008
-                self.parseSphere(node)
-            elif solid_type == "orb":  # solid test 009
-                self.parseOrb(node)
-            elif solid_type == "torus":  # solid test 010
-                self.parseTorus(node)
-            elif solid_type == "polycone":  # solid test 011
-                self.parsePolycone(node)
-            elif solid_type == "genericPolycone":  # solid test 012
-                self.parseGenericPolycone(node)
-            elif solid_type == "polyhedra":  # solid test 013
-                self.parsePolyhedra(node)
-            elif solid_type == "genericPolyhedra":  # solid test 014
-                self.parseGenericPolyhedra(node)
-            elif solid_type == "eltube":  # solid test 015
-                self.parseEllipticalTube(node)
-            elif solid_type == "ellipsoid":  # solid test 016
-                self.parseEllipsoid(node)
-            elif solid_type == "elcone":  # solid test 017
-                self.parseEllipticalCone(node)
-            elif solid_type == "paraboloid":  # solid test 018
-                self.parseParaboloid(node)
-            elif solid_type == "hype":  # solid test 019
-                self.parseHype(node)
-            elif solid_type == "tet":  # solid test 020
-                self.parseTet(node)
-            elif solid_type == "xtru":  # solid test 021
-                self.parseExtrudedSolid(node)
-            elif solid_type == "twistedbox":  # solid test 022
-                self.parseTwistedBox(node)
-            elif solid_type == "twistedtrap":  # solid test 023
-                self.parseTwistedTrap(node)
-            elif solid_type == "twistedtrd":  # solid test 024
-                self.parseTwistedTrd(node)
-            elif solid_type == "twistedtubs":  # solid test 025
-                self.parseTwistedTubs(node)
-            elif solid_type == "arb8":  # solid test 026
-                self.parseGenericTrap(node)
-            elif solid_type == "tessellated":  # solid test 027
-                self.parseTessellatedSolid(node)
-            elif solid_type == "union":  # solid test 028
-                self.parseUnion(node)
-            elif solid_type == "subtraction":  # solid test 029
-                self.parseSubtraction(node)
-            elif solid_type == "intersection":  # solid test 030
-                self.parseIntersection(node)
-            elif solid_type == "multiUnion":  # solid test 031
-                self.parseMultiUnion(node)
-            elif solid_type == "opticalsurface":
-                self.parseOpticalSurface(node)
-            elif solid_type == "scaledSolid":
-                self.parseScaledSolid(node)
-            elif solid_type == "loop":
-                pass
-                # self.parseSolidLoop(node)
-            else:
-                _log.warning(
-                    "unrecognized solid %s (name=%s)",
-                    solid_type,
-                    node.attributes["name"].value,
-                )
+            self.parseSolid(node)
+
+    def parseSolid(self, node):
+        try:
+            solid_type = node.tagName
+        except AttributeError:
+            return  # node is probably a comment so continue
+
+        if solid_type == "box":  # solid test 001
+            self.parseBox(node)
+        elif solid_type == "tube":  # solid test 002
+            self.parseTube(node)
+        elif solid_type == "cutTube":  # solid test 003
+            self.parseCutTube(node)
+        elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
+            self.parseCone(node)
+        elif solid_type == "para":  # solid test 005
+            self.parsePara(node)
+        elif solid_type == "trd":  # solid test 006
+            self.parseTrd(node)
+        elif solid_type == "trap":  # solid test 007
+            self.parseTrap(node)
+        elif solid_type == "sphere":  # solid test 008
+            self.parseSphere(node)
+        elif solid_type == "orb":  # solid test 009
+            self.parseOrb(node)
+        elif solid_type == "torus":  # solid test 010
+            self.parseTorus(node)
+        elif solid_type == "polycone":  # solid test 011
+            self.parsePolycone(node)
+        elif solid_type == "genericPolycone":  # solid test 012
+            self.parseGenericPolycone(node)
+        elif solid_type == "polyhedra":  # solid test 013
+            self.parsePolyhedra(node)
+        elif solid_type == "genericPolyhedra":  # solid test 014
+            self.parseGenericPolyhedra(node)
+        elif solid_type == "eltube":  # solid test 015
+            self.parseEllipticalTube(node)
+        elif solid_type == "ellipsoid":  # solid test 016
+            self.parseEllipsoid(node)
+        elif solid_type == "elcone":  # solid test 017
+            self.parseEllipticalCone(node)
+        elif solid_type == "paraboloid":  # solid test 018
+            self.parseParaboloid(node)
+        elif solid_type == "hype":  # solid test 019
+            self.parseHype(node)
+        elif solid_type == "tet":  # solid test 020
+            self.parseTet(node)
+        elif solid_type == "xtru":  # solid test 021
+            self.parseExtrudedSolid(node)
+        elif solid_type == "twistedbox":  # solid test 022
+            self.parseTwistedBox(node)
+        elif solid_type == "twistedtrap":  # solid test 023
+            self.parseTwistedTrap(node)
+        elif solid_type == "twistedtrd":  # solid test 024
+            self.parseTwistedTrd(node)
+        elif solid_type == "twistedtubs":  # solid test 025
+            self.parseTwistedTubs(node)
+        elif solid_type == "arb8":  # solid test 026
+            self.parseGenericTrap(node)
+        elif solid_type == "tessellated":  # solid test 027
+            self.parseTessellatedSolid(node)
+        elif solid_type == "union":  # solid test 028
+            self.parseUnion(node)
+        elif solid_type == "subtraction":  # solid test 029
+            self.parseSubtraction(node)
+        elif solid_type == "intersection":  # solid test 030
+            self.parseIntersection(node)
+        elif solid_type == "multiUnion":  # solid test 031
+            self.parseMultiUnion(node)
+        elif solid_type == "opticalsurface":
+            self.parseOpticalSurface(node)
+        elif solid_type == "scaledSolid":
+            self.parseScaledSolid(node)
+        elif solid_type == "loop":
+            pass
+            # self.parseSolidLoop(node)
+        else:
+            _log.warning(
+                "unrecognized solid %s (name=%s)",
+                solid_type,
+                node.attributes["name"].value,
+            )
 
     def parseBox(self, node):
         solid_name = node.attributes["name"].value
@@ -1617,20 +1697,29 @@ class Reader:
     def parseTessellatedSolid(self, node):
         solid_name = node.attributes["name"].value
 
+        # solids may have millions of facets so read attributes directly
         facet_list = []
-
         for chNode in node.childNodes:
-            if chNode.tagName == "triangular":
-                v1 = chNode.attributes["vertex1"].value
-                v2 = chNode.attributes["vertex2"].value
-                v3 = chNode.attributes["vertex3"].value
-                facet_list.append([v1, v2, v3])
-            elif chNode.tagName == "quadrangular":
-                v1 = chNode.attributes["vertex1"].value
-                v2 = chNode.attributes["vertex2"].value
-                v3 = chNode.attributes["vertex3"].value
-                v4 = chNode.attributes["vertex4"].value
-                facet_list.append([v1, v2, v3, v4])
+            if chNode.nodeType != chNode.ELEMENT_NODE:
+                continue  # comment
+            tagName = chNode.tagName
+            if tagName == "triangular":
+                facet_list.append(
+                    [
+                        chNode.getAttribute("vertex1"),
+                        chNode.getAttribute("vertex2"),
+                        chNode.getAttribute("vertex3"),
+                    ]
+                )
+            elif tagName == "quadrangular":
+                facet_list.append(
+                    [
+                        chNode.getAttribute("vertex1"),
+                        chNode.getAttribute("vertex2"),
+                        chNode.getAttribute("vertex3"),
+                        chNode.getAttribute("vertex4"),
+                    ]
+                )
 
         _g4.solid.TessellatedSolid(
             solid_name,
@@ -1849,7 +1938,10 @@ class Reader:
 
         # find world logical volume
         self.xmlsetup = xmldoc.getElementsByTagName("setup")[0]
-        worldLvName = self.xmlsetup.childNodes[0].attributes["ref"].value
+        self.parseSetup(self.xmlsetup)
+
+    def parseSetup(self, node):
+        worldLvName = node.childNodes[0].attributes["ref"].value
         self._registry.orderLogicalVolumes(worldLvName)
         self._registry.setWorld(worldLvName)
 
@@ -1957,7 +2049,9 @@ class Reader:
                 except IndexError:
                     fileref = chNode.getElementsByTagName("file")[0].attributes["name"].value
                     _log.debug("got filref %s", fileref)
-                    r = Reader(fileref, skipMaterials=self._skipMaterials)
+                    r = Reader(
+                        fileref, skipMaterials=self._skipMaterials, streaming=self._streaming
+                    )
                     fileReg = r.getRegistry()
                     fileReg.name = fileref
                     fileLV = r.getRegistry().getWorldVolume()
@@ -2955,6 +3049,68 @@ class Reader:
                 )
 
 
+class _GdmlStream:
+    """
+    Read only binary file object over a GDML file, in which lines that are only an entity
+    reference (&name;) are replaced by the contents of the file declared for the entity.
+    """
+
+    def __init__(self, fileName, entityFiles):
+        self._entityFiles = entityFiles
+        self._files = [open(fileName, "rb")]
+
+    def read(self, size=-1):
+        chunks = []
+        n = 0
+        while self._files and (size < 0 or n < size):
+            line = self._files[-1].readline()
+            if not line:
+                self._files.pop().close()
+                continue
+
+            stripped = line.strip()
+            if stripped.startswith(b"&"):
+                name = _re.search(rb"&([\s\S]+)\;", stripped).group(1).decode()
+                self._files.append(open(self._entityFiles[name], "rb"))
+                continue
+
+            chunks.append(line)
+            n += len(line)
+        return b"".join(chunks)
+
+    def close(self):
+        while self._files:
+            self._files.pop().close()
+
+
+def _expandNode(events, node):
+    """
+    Attach the children of node from a pulldom event stream, like
+    DOMEventStream.expandNode, but dropping comments and whitespace only text and
+    joining the lines of text, as load does.
+    """
+    parents = [node]
+    for event, child in events:
+        if event == _pulldom.START_ELEMENT:
+            parents[-1].appendChild(child)
+            parents.append(child)
+        elif event == _pulldom.END_ELEMENT:
+            element = parents.pop()
+            for c in list(element.childNodes):
+                if c.nodeType == c.TEXT_NODE:
+                    c.data = " ".join(c.data.split())
+                    if not c.data:
+                        element.removeChild(c)
+            if not parents:
+                return
+        elif event == _pulldom.CHARACTERS:
+            last = parents[-1].lastChild
+            if last is not None and last.nodeType == last.TEXT_NODE:
+                last.data += child.data  # text may arrive in several pieces
+            else:
+                parents[-1].appendChild(child)
+
+
 def _StripPointer(name):
     pattern = r"(0x\w{7,})"
     rNameToObject = _re.sub(pattern, "", name)
@@ -4,7 +4,13 @@ from ..geant4._Material import Element as _Element
 from ..geant4._Material import Isotope as _Isotope
 from ..gdml import Defines as _Defines
 from .. import geant4 as _g4
+from .. import meshutils as _meshutils
+import gzip as _gzip
+import io as _io
 import logging as _log
+import numpy as _np
+import shutil as _shutil
+import tempfile as _tempfile
 
 _log = _log.getLogger(__name__)
 
@@ -13,13 +19,36 @@ class Writer:
     """
     :param writeColour: whether to write the VisOptions of each LogicalVolume.
     :type writeColour: bool
+    :param streaming: write the elements of each section to a temporary file as soon as they
+                      are made, so the document is never held in memory as a whole. The
+                      output is the same. The temporary files are closed by write, so a
+                      streaming Writer can only be written once.
+    :type streaming: bool
+    :param compactTessellated: write every distinct vertex of a Freecad or Stl type tessellated
+                               solid once, instead of one position per vertex or per facet corner.
+    :type compactTessellated: bool
+    :param tessellatedDecimals: number of decimals (in mm) vertices are rounded to when finding
+                                duplicates for compactTessellated.
+    :type tessellatedDecimals: int
 
     """
 
-    def __init__(self, prepend="", writeColour=True):
+    def __init__(
+        self,
+        prepend="",
+        writeColour=True,
+        streaming=False,
+        compactTessellated=False,
+        tessellatedDecimals=9,
+    ):
         super().__init__()
         self.prepend = prepend
         self._writeColour = writeColour
+        self._compactTessellated = compactTessellated
+        self._tessellatedDecimals = tessellatedDecimals
+        self._streaming = streaming
+        self._sectionFiles = {}  # section tag name : temporary file, when streaming
+        self._streamWritten = False
 
         self.imp = getDOMImplementation()
         self.doc = self.imp.createDocument(None, "gdml", None)
@@ -37,8 +66,8 @@ class Writer:
         self.userinfo = self.top.appendChild(self.doc.createElement("userinfo"))
         self.setup = self.top.appendChild(self.doc.createElement("setup"))
 
-        self.materials_written = []
-        self.solids_written = []
+        self.materials_written = set()
+        self.solids_written = set()
 
         self.defineList = []
         self.materialList = []
@@ -64,18 +93,21 @@ class Writer:
             _log.info("gdml.Writer.addDetector> define " + definition)
             define = self.registry.defineDict[definition]
             self.writeDefine(define)
+            self._flushSections()
 
         # loop over materials
         for mat in registry.materialDict:
             _log.info("gdml.Writer.addDetector> material " + mat)
             material = self.registry.materialDict[mat]
             self.writeMaterial(material)
+            self._flushSections()
 
         # loop over solids
         for solidId in registry.solidDict.keys():
             _log.info("gdml.Writer.addDetector> solid " + solidId)
             solid = registry.solidDict[solidId]
             self.writeSolid(solid)
+            self._flushSections()
 
         # loop over logical volumes
         for logicalName in registry.logicalVolumeList:
@@ -86,6 +118,7 @@ class Writer:
                 self.writeMaterial(logical.material)
             elif logical.type == "assembly":
                 self.writeAssemblyVolume(logical)
+            self._flushSections()
 
         # loop over surfaces
         for surfaceName in registry.surfaceDict:
@@ -95,9 +128,11 @@ class Writer:
                 self.writeBorderSurface(surface)
             elif surface.type == "skinsurface":
                 self.writeSkinSurface(surface)
+            self._flushSections()
 
         for auxiliary in registry.userInfo:
             self.writeAuxiliary(auxiliary)
+            self._flushSections()
 
         self.setup.setAttribute("name", "Default")
         self.setup.setAttribute("version", "1.0")
@@ -105,12 +140,90 @@ class Writer:
         # we.setAttribute("ref",self.prepend + registry.worldName+"_lv")
         we.setAttribute("ref", self.prepend + registry.worldName)
         self.setup.appendChild(we)
+        self._flushSections()
 
-    def write(self, filename):
-        f = open(filename, "w")
-        xmlString = self.doc.toprettyxml()
-        f.write(xmlString)
-        f.close()
+    def _flushSections(self):
+        """
+        When streaming, write the finished children of every section to the temporary file
+        of that section, formatted as by toprettyxml, and remove them from the document.
+        """
+        if not self._streaming:
+            return
+        if self._streamWritten:
+            msg = "streaming gdml.Writer has already been written, elements cannot be added"
+            raise RuntimeError(msg)
+
+        for section in self.top.childNodes:
+            nodes = section.childNodes
+            if not nodes:
+                continue
+
+            f = self._sectionFiles.get(section.tagName)
+            if f is None:
+                f = _tempfile.TemporaryFile("w+")
+                self._sectionFiles[section.tagName] = f
+
+            for node in nodes:
+                node.writexml(f, "\t\t", "\t", "\n")
+            for node in nodes:
+                node.unlink()
+            del nodes[:]
+
+    def write(self, filename, compress=None):
+        """
+        Write the GDML document.
+
+        :param filename: path of the file to write or an open text file
+        :type filename: str, pathlib.Path, file object
+        :param compress: gzip compress the file, by default if filename ends with .gz
+        :type compress: bool
+        """
+        if hasattr(filename, "write"):
+            self._write(filename)
+            return
+
+        if compress is None:
+            compress = str(filename).endswith(".gz")
+
+        if compress:
+            f = _gzip.open(filename, "wt")
+        else:
+            f = open(filename, "w")
+        with f:
+            self._write(f)
+
+    def _write(self, f):
+        if not self._streaming:
+            f.write(self.doc.toprettyxml())
+            return
+
+        if self._streamWritten:
+            msg = "streaming gdml.Writer has already been written"
+            raise RuntimeError(msg)
+
+        try:
+            # include elements written directly (e.g. writeSolid) since the last flush
+            self._flushSections()
+
+            # the same as toprettyxml, with the children of each section from its temporary file
+            f.write('<?xml version="1.0" ?>\n')
+            f.write(_openingTag(self.top, ""))
+            for section in self.top.childNodes:
+                sectionFile = self._sectionFiles.get(section.tagName)
+                if sectionFile is None:
+                    section.writexml(f, "\t", "\t", "\n")
+                    continue
+
+                f.write(_openingTag(section, "\t"))
+                sectionFile.seek(0)
+                _shutil.copyfileobj(sectionFile, f)
+                f.write(f"\t</{section.tagName}>\n")
+            f.write("</gdml>\n")
+        finally:
+            self._streamWritten = True
+            for sectionFile in self._sectionFiles.values():
+                sectionFile.close()
+            self._sectionFiles.clear()
 
     def writeGMADTesterNoBeamline(self, gmad, gdml):
         text = f"""test: placement, geometryFile="gdml:{gdml}";
@@ -364,7 +477,7 @@ option, physicsList="em";
             self.materials.appendChild(oe)
 
         if material.name not in self.materials_written:
-            self.materials_written.append(material.name)
+            self.materials_written.add(material.name)
 
     def writeLogicalVolume(self, lv):
         we = self.doc.createElement("volume")
@@ -702,7 +815,7 @@ option, physicsList="em";
         if hasattr(self, "write" + solid.type):
             func = getattr(self, "write" + solid.type)  # get the member function
             func(solid)  # call it with the solid instance as an argument
-            self.solids_written.append(solid.name)
+            self.solids_written.add(solid.name)
         else:
             raise ValueError("No such solid " + solid.type)
 
@@ -912,9 +1025,27 @@ option, physicsList="em";
             for f in instance.meshtess:
                 oe.appendChild(facet_makers[len(f)](*f))
 
+        elif self._compactTessellated:
+            verts, faces = instance.toArrays()
+            verts, index = _meshutils.uniqueVertices(verts, self._tessellatedDecimals)
+            vert_names = [f"{name}_v{i}" for i in range(len(verts))]
+            for vn, v in zip(vert_names, verts):
+                # same formatting as a Position define in mm
+                p = self.createPosition(vn, *(f"{c:.15f}" for c in v))
+                p.setAttribute("unit", "mm")
+                self.defines.appendChild(p)
+
+            # triangles are padded with -1 when there are also quadrangular facets
+            for f in faces.tolist():
+                f = [vert_names[index[fi]] for fi in f if fi >= 0]
+                oe.appendChild(facet_makers[len(f)](*f))
+
         elif instance.meshtype == instance.MeshType.Freecad:
             verts = instance.meshtess[0]
             facet = instance.meshtess[1]
+            if isinstance(verts, _np.ndarray):
+                verts = verts.tolist()
+                facet = [[fi for fi in f if fi >= 0] for f in facet.tolist()]
 
             vert_names = []
             for vertex_id, v in enumerate(verts):
@@ -1394,6 +1525,15 @@ option, physicsList="em";
         self.solids.appendChild(oe)
 
 
+def _openingTag(element, indent):
+    """
+    Opening tag of element, with its attributes, as written by toprettyxml.
+    """
+    s = _io.StringIO()
+    element.cloneNode(False).writexml(s, indent, "", "\n")
+    return s.getvalue()[: -len("/>\n")] + ">\n"
+
+
 def VisOptionsToAuxiliary(visOptions):
     result = _Defines.Auxiliary("bds_vrgba", visOptions.getBDSIMVRGBA())
     return result
@@ -1,6 +1,6 @@
 from .PhysicalVolume import PhysicalVolume as _PhysicalVolume
 from . import solid as _solid
-from ..visualisation import Mesh as _Mesh
+from ..visualisation import LazyMeshList as _LazyMeshList
 from ..visualisation import VisualisationOptions as _VisOptions
 from .. import transformation as _trans
 
@@ -11,6 +11,25 @@ import logging as _log
 _log = _log.getLogger(__name__)
 
 
+def _evaluatedParameters(solid):
+    """
+    Replace the define parameters of a division solid by their current values. The division
+    solids share the expressions of the mother solid, which are changed for every division,
+    and are only meshed later on first use (see LazyMeshList). The values are stored without
+    the setters, so the registry shared with the mother is not notified of an edit.
+    """
+    from ..gdml import Defines as _Defines
+
+    for varName in solid.varNames:
+        value = getattr(solid, varName)
+        if isinstance(value, (_Defines.ScalarBase, _Defines.BasicExpression, list)):
+            value = solid.evaluateParameter(value)
+            if isinstance(getattr(type(solid), varName, None), property):
+                varName = "_" + varName
+            solid.__dict__[varName] = value
+    return solid
+
+
 class DivisionVolume(_PhysicalVolume):
     """
     DivisionVolume: G4PVDivision
@@ -147,7 +166,7 @@ class DivisionVolume(_PhysicalVolume):
         allowed_axes = [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -180,14 +199,14 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pZ.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, v]])
 
-            meshes.append(_Mesh(solid))
-        return meshes, transforms
+            solids.append(_evaluatedParameters(solid))
+        return _LazyMeshList(solids), transforms
 
     def divideTubs(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         if self.axis == self.Axis.kPhi:
@@ -240,15 +259,15 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pDPhi.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(_evaluatedParameters(solid))
 
-        return meshes, transforms
+        return _LazyMeshList(solids), transforms
 
     def divideCons(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -326,15 +345,15 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pDPhi.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(_evaluatedParameters(solid))
 
-        return meshes, transforms
+        return _LazyMeshList(solids), transforms
 
     def dividePara(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -378,15 +397,15 @@ class DivisionVolume(_PhysicalVolume):
                     ]
                 )
 
-            meshes.append(_Mesh(solid))
+            solids.append(_evaluatedParameters(solid))
 
-        return meshes, transforms
+        return _LazyMeshList(solids), transforms
 
     def divideTrd(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kXAxis, self.Axis.kYAxis, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -440,15 +459,15 @@ class DivisionVolume(_PhysicalVolume):
                 solid.pZ.expression.expressionString = str(width)
                 transforms.append([[0, 0, 0], [0, 0, v]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(_evaluatedParameters(solid))
 
-        return meshes, transforms
+        return _LazyMeshList(solids), transforms
 
     def dividePolycone(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -563,15 +582,15 @@ class DivisionVolume(_PhysicalVolume):
                     solid.pZpl = [v, v + width]
                     transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(_evaluatedParameters(solid))
 
-        return meshes, transforms
+        return _LazyMeshList(solids), transforms
 
     def dividePolyhedra(self, offset, width, ndiv):
         allowed_axes = [self.Axis.kRho, self.Axis.kPhi, self.Axis.kZAxis]
         self.checkAxis(allowed_axes)
 
-        meshes = []
+        solids = []
         transforms = []
 
         msize = self.getMotherSize()
@@ -688,9 +707,9 @@ class DivisionVolume(_PhysicalVolume):
                     solid.zPlane = [v, v + width]
                     transforms.append([[0, 0, 0], [0, 0, 0]])
 
-            meshes.append(_Mesh(solid))
+            solids.append(_evaluatedParameters(solid))
 
-        return meshes, transforms
+        return _LazyMeshList(solids), transforms
 
     def createDivisionMeshes(self):
         ndivisions = int(
@@ -1,10 +1,15 @@
 from .. import config as _config
 from ..visualisation import Mesh as _Mesh
 from ..visualisation import OverlapType as _OverlapType
+from ..visualisation import _getBoundingBox
+from ..meshutils import aabbSweepAndPrune as _aabbSweepAndPrune
+from ..meshutils import aabbContained as _aabbContained
 from . import solid as _solid
 from . import _Material as _mat
 from .. import transformation as _trans
 from .AssemblyVolume import AssemblyVolume as _AssemblyVolume
+from .OverlapReport import Overlap as _Overlap
+from .OverlapReport import OverlapReport as _OverlapReport
 from ..gdml import Constant as _Constant
 from .. import convert as _convert
 
@@ -14,9 +19,17 @@ from .. import exceptions as _exceptions
 
 
 from collections import defaultdict as _defaultdict
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 import numpy as _np
 import logging as _logging
 import copy as _copy
+import itertools as _itertools
+import time as _time
+
+if _config.meshing == _config.meshingType.pycsg:
+    from ..pycsg.core import CSG as _CSG
+elif _config.meshing == _config.meshingType.cgal_sm:
+    from ..pycgal.core import CSG as _CSG
 
 _log = _logging.getLogger(__name__)
 
@@ -48,6 +61,130 @@ def _solid2tessellated(solid):
     return tesselated_solid
 
 
+class _OverlapTest:
+    daughter = 1
+    daughterCoplanar = 2
+    mother = 3
+    motherCoplanar = 4
+
+    overlapType = {
+        daughter: _OverlapType.overlap,
+        daughterCoplanar: _OverlapType.coplanar,
+        mother: _OverlapType.protrusion,
+        motherCoplanar: _OverlapType.coplanar,
+    }
+
+
+def _overlapTest(kind, mesh1, boundingMesh1, mesh2, boundingMesh2):
+    """
+    Evaluate a single overlap test between a daughter mesh (1) and either another daughter
+    or the mother (2). Returns the overlap mesh or None if there is no overlap.
+    """
+    if kind == _OverlapTest.daughter:
+        # first check if bounding mesh intersects
+        cullIntersection = boundingMesh1.intersect(boundingMesh2)
+        if cullIntersection.vertexCount() == 0:
+            return None
+
+        # bounding meshes collide, so check full mesh properly
+        overlapMesh = mesh1.intersect(mesh2)
+    elif kind == _OverlapTest.daughterCoplanar:
+        # first check if bounding mesh intersects
+        cullIntersection = boundingMesh1.intersect(boundingMesh2)
+        cullCoplanar = boundingMesh1.coplanarIntersection(boundingMesh2)
+        if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
+            return None
+
+        overlapMesh = mesh1.coplanarIntersection(mesh2)
+    elif kind == _OverlapTest.mother:
+        # the bounding box of the mother is only given (not None) if it is the mother itself
+        if boundingMesh2 is not None:
+            cullIntersection = boundingMesh1.subtract(boundingMesh2)
+            if cullIntersection.vertexCount() == 0:
+                return None
+
+        overlapMesh = mesh1.subtract(mesh2)
+    elif kind == _OverlapTest.motherCoplanar:
+        # Need mother.coplanar(daughter) as typically mother is larger
+        overlapMesh = mesh2.coplanarIntersection(mesh1)
+    else:
+        msg = f"Unknown overlap test type {kind}"
+        raise ValueError(msg)
+
+    _log.debug(
+        f"LogicalVolume.checkOverlaps> mesh test {kind} {overlapMesh.vertexCount()} {overlapMesh.polygonCount()}"
+    )
+
+    if overlapMesh.vertexCount() == 0:
+        return None
+    return overlapMesh
+
+
+# number of overlap tests taken from the generator at a time, the meshes of each batch are
+# converted to arrays once and sent to a worker with every chunk of tests that uses them
+_overlapBatchSize = 256
+
+
+def _overlapTestsSerialised(meshArrays, jobs):
+    """
+    Worker process version of _overlapTest for a chunk of tests where meshes are given as
+    indices into meshArrays, a list of vertex and face arrays. Each mesh is converted back once.
+    """
+    meshes = {}
+
+    def mesh(index):
+        if index is None:
+            return None
+        if index not in meshes:
+            meshes[index] = _CSG.fromArrays(*meshArrays[index])
+        return meshes[index]
+
+    results = []
+    for kind, *indices in jobs:
+        start = _time.perf_counter()
+        overlapMesh = _overlapTest(kind, *[mesh(i) for i in indices])
+        elapsed = _time.perf_counter() - start
+        results.append((elapsed, None if overlapMesh is None else overlapMesh.toArrays()))
+    return results
+
+
+def _overlapTestsParallel(tests, executor, workers):
+    """
+    Evaluate a batch of overlap tests (lv, kind, names, meshes) in the worker processes of
+    executor. Each distinct mesh is converted to arrays once. Returns (elapsed, overlap mesh
+    or None) per test.
+    """
+    arrays = {}
+    chunkSize = max(1, len(tests) // (4 * workers))
+    chunkArrays = []
+    chunkJobs = []
+    for iChunk in range(0, len(tests), chunkSize):
+        meshIndex = {}
+        meshArrays = []
+        jobs = []
+        for _, kind, _, meshes in tests[iChunk : iChunk + chunkSize]:
+            indices = []
+            for m in meshes:
+                if m is None:
+                    indices.append(None)
+                    continue
+                if id(m) not in meshIndex:
+                    if id(m) not in arrays:
+                        arrays[id(m)] = m.toArrays()
+                    meshIndex[id(m)] = len(meshArrays)
+                    meshArrays.append(arrays[id(m)])
+                indices.append(meshIndex[id(m)])
+            jobs.append((kind, *indices))
+        chunkArrays.append(meshArrays)
+        chunkJobs.append(jobs)
+
+    results = []
+    for chunkResults in executor.map(_overlapTestsSerialised, chunkArrays, chunkJobs):
+        for elapsed, result in chunkResults:
+            results.append((elapsed, None if result is None else _CSG.fromArrays(*result)))
+    return results
+
+
 class LogicalVolume:
     """
     LogicalVolume : G4LogicalVolume
@@ -63,7 +200,8 @@ class LogicalVolume:
     :param addRegistry:
     :type addRegistry: bool
 
-    Acceptable kwargs: "auxiliary", "visOptions".
+    Acceptable kwargs: "auxiliary", "visOptions", "localMesh" (an already computed mesh of
+    the solid, used instead of meshing it again).
 
     """
 
@@ -98,7 +236,12 @@ class LogicalVolume:
         self.daughterVolumes = []
         self._daughterVolumesDict = {}
         self.bdsimObjects = []
-        if _config.doMeshing:
+        self._mesh = None
+        self._meshStamp = None
+        self._meshVersions = None
+        if kwargs.get("localMesh", None) is not None:
+            self.mesh = _Mesh(self.solid, kwargs["localMesh"])
+        elif _config.doMeshing and not _config.lazyMeshing:
             self.reMesh()
         self.auxiliary = []
         self.addAuxiliaryInfo(kwargs.get("auxiliary", None))
@@ -117,6 +260,50 @@ class LogicalVolume:
     def __repr__(self):
         return "Logical volume : " + self.name + " " + str(self.solid) + " " + str(self.material)
 
+    @property
+    def mesh(self):
+        """
+        Mesh (visualisation.Mesh) of the solid. With config.lazyMeshing (and config.doMeshing)
+        it is generated on first access and again once the solid has been replaced or its
+        meshKey has changed, e.g. by editing it or a define it uses.
+        """
+        if _config.lazyMeshing and _config.doMeshing:
+            # the mesh key is only looked at again after an edit in the registry
+            versions = self._registryVersions()
+            if versions is None or versions != self._meshVersions:
+                if self._meshStamp != self._solidStamp():
+                    self.reMesh()
+                self._meshVersions = versions
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, mesh):
+        self._mesh = mesh
+        # only needed (and worth hashing the solid for) when meshing lazily
+        self._meshStamp = self._solidStamp() if _config.lazyMeshing else None
+
+    def _registryVersions(self):
+        registry = self.solid.registry
+        if registry is None:
+            return None
+        return (
+            self.solid,
+            registry.solidEditVersion,
+            registry.defineVersion,
+            _config.backendName(),
+        )
+
+    def _solidStamp(self):
+        meshKey = self.solid.meshKey()
+        if meshKey is not None:
+            return (self.solid, meshKey)
+
+        # without a key any edit of a solid or define in the registry may have changed it
+        registry = self.solid.registry
+        if registry is None:
+            return (self.solid,)
+        return (self.solid, registry.solidEditVersion, registry.defineVersion)
+
     def reMesh(self, recursive=False):
         """
         Regenerate the visualisation for this logical volume. Required if the geometry is modified
@@ -643,7 +830,8 @@ class LogicalVolume:
         recursive=False,
         coplanar=False,
         printOut=True,
-        nOverlapsDetected=[0],
+        nOverlapsDetected=None,
+        workers=None,
     ):
         """
         Check based on the meshes in each logical volume if there are any geometrical overlaps. By
@@ -651,12 +839,67 @@ class LogicalVolume:
         Coplanar overlaps may also be checked (default on).
 
         logged error messages will be given for any overlaps detected and the visualiser will show the
-        colour coded overlaps.
+        colour coded overlaps. An OverlapReport listing each overlap and the time spent on every mesh
+        test is returned (None if this logical volume was already checked).
 
         :param recursive: bool - Whether to descend into the daughter volumes and check their contents also.
         :param coplanar: bool - Whether to check for coplanar overlaps
         :param printOut: bool - (internal) Whether to print out a summary of N overlaps detected
-        :param nOverlapsDetected: [int] - (internal) counter for recursion - ignore
+        :param nOverlapsDetected: [int] - Optional counter incremented for each overlap detected
+        :param workers: int - Number of processes to share the mesh intersections between. None or 1 checks in this process.
+        """
+        # return if overlaps already checked
+        if self.overlapChecked:
+            _log.debug("Overlaps already checked - skipping")
+            return
+
+        if nOverlapsDetected is None:
+            nOverlapsDetected = [0]
+        report = _OverlapReport()
+
+        tests = self._overlapTestsRecursive(recursive, coplanar, nOverlapsDetected, report)
+
+        if workers is not None and workers > 1:
+            # tests are run in batches (never splitting the tests of one logical volume) so
+            # that only the meshes of one batch are held as arrays at a time, and all batches
+            # of the whole tree are shared out over the same pool of processes
+            _log.info("LogicalVolume.checkOverlaps> mesh tests over %d processes", workers)
+            with _ProcessPoolExecutor(max_workers=workers) as executor:
+                batch = []
+                for test in _itertools.chain(tests, [None]):
+                    endOfBatch = test is None or (
+                        len(batch) >= _overlapBatchSize and test[0] is not batch[-1][0]
+                    )
+                    if batch and endOfBatch:
+                        results = _overlapTestsParallel(batch, executor, workers)
+                        for (lv, kind, names, _), (elapsed, overlapMesh) in zip(batch, results):
+                            lv._addOverlap(
+                                kind, names, overlapMesh, elapsed, nOverlapsDetected, report
+                            )
+                        batch = []
+                    if test is not None:
+                        batch.append(test)
+        else:
+            for lv, kind, names, meshes in tests:
+                start = _time.perf_counter()
+                overlapMesh = _overlapTest(kind, *meshes)
+                elapsed = _time.perf_counter() - start
+                lv._addOverlap(kind, names, overlapMesh, elapsed, nOverlapsDetected, report)
+
+        if printOut:
+            _log.log(
+                _logging.ERROR if nOverlapsDetected[0] > 0 else _logging.INFO,
+                "%d overlaps detected",
+                nOverlapsDetected[0],
+            )
+
+        return report
+
+    def _overlapTestsRecursive(self, recursive, coplanar, nOverlapsDetected, report):
+        """
+        Generate the mesh tests required to check this logical volume (and optionally the whole
+        tree below it) for overlaps. Each test is (lv, kind, names, meshes) and is evaluated with
+        _overlapTest. Logical volumes are marked as checked as their tests are generated.
         """
         from ..geant4 import IsAReplica as _IsAReplica
 
@@ -668,10 +911,30 @@ class LogicalVolume:
             return
 
         if _IsAReplica(self):
-            self.daughterVolumes[0]._checkInternalOverlaps(nOverlapsDetected)
+            self.daughterVolumes[0]._checkInternalOverlaps(nOverlapsDetected, report)
             self.overlapChecked = True
             return
 
+        # ok this logical has been checked
+        self.overlapChecked = True
+
+        for kind, names, meshes in self._overlapTests(coplanar, report):
+            yield self, kind, names, meshes
+
+        # recursively check entire tree
+        if recursive:
+            for d in self.daughterVolumes:
+                if type(d.logicalVolume) is _AssemblyVolume:
+                    continue  # no specific overlap check - handled by the PV of an assembly
+                yield from d.logicalVolume._overlapTestsRecursive(
+                    recursive, coplanar, nOverlapsDetected, report
+                )
+
+    def _overlapTests(self, coplanar, report):
+        """
+        Transform the daughter meshes into the frame of this logical volume and return the
+        list of mesh tests (kind, names, meshes) that survive the bounding box broad phase.
+        """
         # local meshes
         transformedMeshes = []
         transformedBoundingMeshes = []
@@ -733,125 +996,155 @@ class LogicalVolume:
                 transformedBoundingMeshes.append(boundingmesh)
                 transformedMeshesNames.append(name)
 
-        # overlap daughter pv checks
-        for i in range(len(transformedMeshes)):
-            for j in range(i + 1, len(transformedMeshes)):
-                _log.debug(
-                    f"LogicalVolume.checkOverlaps> daughter-daughter bounding mesh intersection test: {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                )
+        # broad phase - axis aligned extents of the transformed bounding meshes so that only
+        # daughters that could possibly touch are passed to the (expensive) mesh booleans
+        nDaughterMeshes = len(transformedMeshes)
+        aabbs = _np.array(
+            [
+                _getBoundingBox(bm, nameForError=n)
+                for bm, n in zip(transformedBoundingMeshes, transformedMeshesNames)
+            ]
+        ).reshape(-1, 2, 3)
+        candidatePairs = _aabbSweepAndPrune(
+            aabbs[:, 0], aabbs[:, 1], _config.overlapBroadPhaseTolerance
+        )
+        nPairs = nDaughterMeshes * (nDaughterMeshes - 1) // 2
+        report.nPairs += nPairs
+        report.nPairsPruned += nPairs - len(candidatePairs)
+        _log.info(
+            "LogicalVolume.checkOverlaps> %s: %d of %d daughter pairs pruned by bounding box",
+            self.name,
+            nPairs - len(candidatePairs),
+            nPairs,
+        )
 
-                # first check if bounding mesh intersects
-                cullIntersection = transformedBoundingMeshes[i].intersect(
-                    transformedBoundingMeshes[j]
-                )
-                if cullIntersection.vertexCount() == 0:
-                    continue
+        # daughters whose extent is inside the extent of the mother cannot protrude from it, but
+        # only if the mother fills its extent, i.e. is a box (in its own frame, as the daughters)
+        motherIsBox = self.solid.type == "Box"
+        if nDaughterMeshes > 0 and motherIsBox:
+            [motherMin, motherMax] = self.mesh.getBoundingBox()
+            insideMother = _aabbContained(aabbs[:, 0], aabbs[:, 1], motherMin, motherMax)
+        else:
+            insideMother = _np.zeros(nDaughterMeshes, dtype=bool)
+        _log.debug(
+            "LogicalVolume.checkOverlaps> %s: %d of %d daughter-mother tests pruned by bounding box",
+            self.name,
+            int(insideMother.sum()),
+            nDaughterMeshes,
+        )
 
-                # bounding meshes collide, so check full mesh properly
-                interMesh = transformedMeshes[i].intersect(transformedMeshes[j])
-                _log.debug(
-                    f"LogicalVolume.checkOverlaps> full daughter-daughter intersection test: {i} {j} {interMesh.vertexCount()} {interMesh.polygonCount()}"
+        tests = []
+
+        # overlap daughter pv checks
+        for i, j in candidatePairs:
+            tests.append(
+                (
+                    _OverlapTest.daughter,
+                    (transformedMeshesNames[i], transformedMeshesNames[j]),
+                    (
+                        transformedMeshes[i],
+                        transformedBoundingMeshes[i],
+                        transformedMeshes[j],
+                        transformedBoundingMeshes[j],
+                    ),
                 )
-                if interMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    _log.error(
-                        f"OVERLAP DETECTED> overlap between daughters of {self.name} {transformedMeshesNames[i]} {transformedMeshesNames[j]} {interMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([interMesh, _OverlapType.overlap])
+            )
 
         # coplanar daughter pv checks
         if coplanar:
-            for i in range(len(transformedMeshes)):
-                for j in range(i + 1, len(transformedMeshes)):
-                    _log.debug(
-                        f"LogicalVolume.checkOverlaps> full coplanar test between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
+            for i, j in candidatePairs:
+                tests.append(
+                    (
+                        _OverlapTest.daughterCoplanar,
+                        (transformedMeshesNames[i], transformedMeshesNames[j]),
+                        (
+                            transformedMeshes[i],
+                            transformedBoundingMeshes[i],
+                            transformedMeshes[j],
+                            transformedBoundingMeshes[j],
+                        ),
                     )
-
-                    # first check if bounding mesh intersects
-                    cullIntersection = transformedBoundingMeshes[i].intersect(
-                        transformedBoundingMeshes[j]
-                    )
-                    cullCoplanar = transformedBoundingMeshes[i].coplanarIntersection(
-                        transformedBoundingMeshes[j]
-                    )
-                    if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
-                        continue
-
-                    coplanarMesh = transformedMeshes[i].coplanarIntersection(transformedMeshes[j])
-                    if coplanarMesh.vertexCount() != 0:
-                        nOverlapsDetected[0] += 1
-                        _log.error(
-                            f"OVERLAP DETECTED> coplanar overlap between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]} {coplanarMesh.vertexCount()}"
-                        )
-                        self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
+                )
 
         # protrusion from mother solid
-        for i in range(len(transformedMeshes)):
-            _log.debug(
-                f"LogicalVolume.checkOverlaps> full daughter-mother intersection test {transformedMeshesNames[i]}"
-            )
-
-            cullIntersection = transformedBoundingMeshes[i].subtract(self.mesh.localboundingmesh)
-            if cullIntersection.vertexCount() == 0:
+        for i in range(nDaughterMeshes):
+            if insideMother[i]:
                 continue
-
-            interMesh = transformedMeshes[i].subtract(self.mesh.localmesh)
-            _log.debug(
-                f"LogicalVolume.checkOverlaps> daughter container {i} {interMesh.vertexCount()} {interMesh.polygonCount()}"
-            )
-
-            if interMesh.vertexCount() != 0:
-                nOverlapsDetected[0] += 1
-                _log.error(
-                    f"OVERLAP DETECTED> overlap with mother {transformedMeshesNames[i]} {interMesh.vertexCount()}"
+            tests.append(
+                (
+                    _OverlapTest.mother,
+                    (transformedMeshesNames[i], self.name),
+                    (
+                        transformedMeshes[i],
+                        transformedBoundingMeshes[i],
+                        self.mesh.localmesh,
+                        self.mesh.localboundingmesh if motherIsBox else None,
+                    ),
                 )
-                self.mesh.addOverlapMesh([interMesh, _OverlapType.protrusion])
+            )
 
         # coplanar with solid
         if coplanar:
-            for i in range(len(transformedMeshes)):
-                (
-                    _log.debug(
-                        f"LogicalVolume.checkOverlaps> full daughter-mother coplanar test {transformedMeshesNames[i]}"
-                    ),
+            for i in range(nDaughterMeshes):
+                tests.append(
+                    (
+                        _OverlapTest.motherCoplanar,
+                        (transformedMeshesNames[i], self.name),
+                        (transformedMeshes[i], None, self.mesh.localmesh, None),
+                    )
                 )
 
-                # cullCoplanar = self.mesh.localboundingmesh.coplanarIntersection(transformedBoundingMeshes[i])
-                # if cullCoplanar.vertexCount() == 0 :
-                #    continue
-                # print(self.mesh.localboundingmesh,transformedBoundingMeshes[i])
-                coplanarMesh = self.mesh.localmesh.coplanarIntersection(
-                    transformedMeshes[i]
-                )  # Need mother.coplanar(daughter) as typically mother is larger
-                if coplanarMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    _log.error(
-                        f"OVERLAP DETECTED> coplanar overlap between daughter and mother {transformedMeshesNames[i]} {coplanarMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
+        return tests
 
-        # recursively check entire tree
-        if recursive:
-            for d in self.daughterVolumes:
-                if type(d.logicalVolume) is _AssemblyVolume:
-                    continue  # no specific overlap check - handled by the PV of an assembly
-                # don't make any summary print out for a recursive call
-                d.logicalVolume.checkOverlaps(
-                    recursive=recursive,
-                    coplanar=coplanar,
-                    printOut=False,
-                    nOverlapsDetected=nOverlapsDetected,
-                )
+    def _addOverlap(self, kind, names, overlapMesh, elapsed, nOverlapsDetected, report):
+        """
+        Record the result of a mesh test in the report and any overlap found on the mesh of
+        this logical volume.
+        """
+        overlapType = _OverlapTest.overlapType[kind]
+        report.addTest(overlapType, self.name, names[0], names[1], elapsed, overlapMesh is not None)
+        if overlapMesh is None:
+            return
 
-        # ok this logical has been checked
-        self.overlapChecked = True
+        volume = None
+        if overlapType != _OverlapType.coplanar and hasattr(overlapMesh, "volume"):
+            volume = overlapMesh.volume()
+        report.addOverlap(
+            _Overlap(
+                overlapType,
+                self.name,
+                names[0],
+                names[1],
+                volume,
+                [
+                    [float(x) for x in v]
+                    for v in _getBoundingBox(overlapMesh, nameForError=self.name)
+                ],
+                elapsed,
+            )
+        )
 
-        if printOut:
-            _log.log(
-                _logging.ERROR if nOverlapsDetected[0] > 0 else _logging.INFO,
-                "%d overlaps detected",
-                nOverlapsDetected[0],
+        nOverlapsDetected[0] += 1
+        if kind == _OverlapTest.daughter:
+            _log.error(
+                f"OVERLAP DETECTED> overlap between daughters of {self.name} {names[0]} {names[1]} {overlapMesh.vertexCount()}"
+            )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.overlap])
+        elif kind == _OverlapTest.daughterCoplanar:
+            _log.error(
+                f"OVERLAP DETECTED> coplanar overlap between daughters {names[0]} {names[1]} {overlapMesh.vertexCount()}"
+            )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.coplanar])
+        elif kind == _OverlapTest.mother:
+            _log.error(
+                f"OVERLAP DETECTED> overlap with mother {names[0]} {overlapMesh.vertexCount()}"
             )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.protrusion])
+        elif kind == _OverlapTest.motherCoplanar:
+            _log.error(
+                f"OVERLAP DETECTED> coplanar overlap between daughter and mother {names[0]} {overlapMesh.vertexCount()}"
+            )
+            self.mesh.addOverlapMesh([overlapMesh, _OverlapType.coplanar])
 
     def setSolid(self, solid):
         """
@@ -859,7 +1152,11 @@ class LogicalVolume:
         transformation then use replaceSolid
         """
         self.solid = solid
-        self.mesh = _Mesh(self.solid)
+        if _config.lazyMeshing:
+            self._meshStamp = None
+            self._meshVersions = None
+        else:
+            self.mesh = _Mesh(self.solid)
 
     def makeSolidTessellated(self):
         """
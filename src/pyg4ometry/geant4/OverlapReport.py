@@ -0,0 +1,181 @@
+from ..visualisation import OverlapType as _OverlapType
+
+import csv as _csv
+import json as _json
+import logging as _logging
+
+_log = _logging.getLogger(__name__)
+
+_overlapTypeNames = {
+    _OverlapType.protrusion: "protrusion",
+    _OverlapType.overlap: "overlap",
+    _OverlapType.coplanar: "coplanar",
+}
+_overlapTypesByName = {v: k for k, v in _overlapTypeNames.items()}
+
+
+class Overlap:
+    """
+    A single overlap found by LogicalVolume.checkOverlaps.
+
+    :param overlapType: type of overlap
+    :type overlapType: visualisation.OverlapType
+    :param motherName: name of the logical volume the overlap was found in
+    :type motherName: str
+    :param name1: name of the (first) daughter
+    :type name1: str
+    :param name2: name of the second daughter or of the mother for a protrusion
+    :type name2: str
+    :param volume: volume of the overlap mesh in mm3 (None for coplanar overlaps)
+    :type volume: float
+    :param boundingBox: extent of the overlap mesh in the mother frame [[x,y,z],[x,y,z]]
+    :type boundingBox: list
+    :param time: time spent on the mesh test for this pair in s
+    :type time: float
+    """
+
+    def __init__(
+        self, overlapType, motherName, name1, name2, volume=None, boundingBox=None, time=0.0
+    ):
+        self.overlapType = overlapType
+        self.motherName = motherName
+        self.name1 = name1
+        self.name2 = name2
+        self.volume = volume
+        self.boundingBox = boundingBox
+        self.time = time
+
+    def __repr__(self):
+        return (
+            f"Overlap : {self.typeName} {self.motherName} {self.name1} {self.name2} "
+            f"volume={self.volume} time={self.time:.3g}s"
+        )
+
+    @property
+    def typeName(self):
+        return _overlapTypeNames[self.overlapType]
+
+    def toDict(self):
+        return {
+            "type": self.typeName,
+            "mother": self.motherName,
+            "name1": self.name1,
+            "name2": self.name2,
+            "volume": self.volume,
+            "boundingBox": self.boundingBox,
+            "time": self.time,
+        }
+
+    @classmethod
+    def fromDict(cls, d):
+        return cls(
+            _overlapTypesByName[d["type"]],
+            d["mother"],
+            d["name1"],
+            d["name2"],
+            d["volume"],
+            d["boundingBox"],
+            d["time"],
+        )
+
+
+class OverlapReport:
+    """
+    Machine readable result of LogicalVolume.checkOverlaps. Holds every overlap found
+    as well as the time spent on every mesh test, so slow pairs can be identified.
+
+    Example:
+
+    >>> report = lv.checkOverlaps(recursive=True)
+    >>> report.writeJson("overlaps.json")
+    >>> report.slowestTests(5)
+    """
+
+    _csvColumns = ["type", "mother", "name1", "name2", "volume", "xmin", "ymin", "zmin"]
+    _csvColumns += ["xmax", "ymax", "zmax", "time"]
+
+    def __init__(self):
+        self.overlaps = []
+        # [type, mother, name1, name2, time, overlapping] for every mesh test
+        self.tests = []
+        # daughter pairs considered and pruned by the bounding box broad phase
+        self.nPairs = 0
+        self.nPairsPruned = 0
+
+    def __repr__(self):
+        return f"OverlapReport : {len(self.overlaps)} overlaps from {len(self.tests)} tests"
+
+    def __len__(self):
+        return len(self.overlaps)
+
+    def __iter__(self):
+        return iter(self.overlaps)
+
+    def __getitem__(self, index):
+        return self.overlaps[index]
+
+    def addOverlap(self, overlap):
+        self.overlaps.append(overlap)
+
+    def addTest(self, overlapType, motherName, name1, name2, time, overlapping):
+        self.tests.append(
+            [_overlapTypeNames[overlapType], motherName, name1, name2, time, overlapping]
+        )
+
+    def nOverlaps(self, overlapType=None):
+        """
+        Number of overlaps, optionally only of one visualisation.OverlapType.
+        """
+        if overlapType is None:
+            return len(self.overlaps)
+        return len([o for o in self.overlaps if o.overlapType == overlapType])
+
+    def totalTime(self):
+        return sum(t[4] for t in self.tests)
+
+    def slowestTests(self, n=10):
+        """
+        Return the n mesh tests that took the longest as [type, mother, name1, name2, time, overlapping].
+        """
+        return sorted(self.tests, key=lambda t: t[4], reverse=True)[:n]
+
+    def toDict(self):
+        return {
+            "nOverlaps": len(self.overlaps),
+            "nPairs": self.nPairs,
+            "nPairsPruned": self.nPairsPruned,
+            "totalTime": self.totalTime(),
+            "overlaps": [o.toDict() for o in self.overlaps],
+            "tests": self.tests,
+        }
+
+    @classmethod
+    def fromDict(cls, d):
+        report = cls()
+        report.overlaps = [Overlap.fromDict(o) for o in d["overlaps"]]
+        report.tests = [list(t) for t in d["tests"]]
+        report.nPairs = d["nPairs"]
+        report.nPairsPruned = d["nPairsPruned"]
+        return report
+
+    def writeJson(self, fileName):
+        with open(fileName, "w") as f:
+            _json.dump(self.toDict(), f, indent=1)
+
+    @classmethod
+    def loadJson(cls, fileName):
+        with open(fileName) as f:
+            return cls.fromDict(_json.load(f))
+
+    def writeCsv(self, fileName):
+        """
+        Write one row per overlap. Use writeJson to also keep the per test timing.
+        """
+        with open(fileName, "w", newline="") as f:
+            writer = _csv.writer(f)
+            writer.writerow(self._csvColumns)
+            for o in self.overlaps:
+                bb = o.boundingBox if o.boundingBox is not None else [[None] * 3, [None] * 3]
+                writer.writerow(
+                    [o.typeName, o.motherName, o.name1, o.name2, o.volume, *bb[0], *bb[1], o.time]
+                )
@@ -1,8 +1,9 @@
 from .ReplicaVolume import ReplicaVolume as _ReplicaVolume
 from . import solid as _solid
-from ..visualisation import Mesh as _Mesh
+from ..visualisation import LazyMeshList as _LazyMeshList
 from .. import transformation as _trans
 
+import functools as _functools
 import numpy as _np
 import logging as _log
 
@@ -187,6 +188,23 @@ class ParameterisedVolume(_ReplicaVolume):
             self.pzTopCut = pzTopCut
             self.lunit = lunit
 
+    # dimensions class for each type of solid that can be parameterised
+    _dimensionsTypes = {
+        "Box": BoxDimensions,
+        "Tubs": TubeDimensions,
+        "Cons": ConeDimensions,
+        "Orb": OrbDimensions,
+        "Sphere": SphereDimensions,
+        "Torus": TorusDimensions,
+        "Hype": HypeDimensions,
+        "Para": ParaDimensions,
+        "Trd": TrdDimensions,
+        "Trap": TrapDimensions,
+        "Polycone": PolyconeDimensions,
+        "Polyhedra": PolyhedraDimensions,
+        "Ellipsoid": EllipsoidDimensions,
+    }
+
     def __init__(
         self,
         name,
@@ -219,264 +237,226 @@ class ParameterisedVolume(_ReplicaVolume):
         self.meshes = self.createParameterisedMeshes()
 
     def createParameterisedMeshes(self):
-        meshes = []
-
+        """
+        Meshes of the parameterised copies, generated on first access. Copies with identical
+        dimensions share one mesh, see LazyMeshList.
+        """
+        sources = []
         for paramData, i in zip(self.paramData, range(0, int(self.ncopies), 1)):
-            # box
-            if self.logicalVolume.solid.type == "Box" and isinstance(paramData, self.BoxDimensions):
-                solid = _solid.Box(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX,
-                    paramData.pY,
-                    paramData.pZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Tubs" and isinstance(
-                paramData, self.TubeDimensions
-            ):
-                solid = _solid.Tubs(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pDz,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Cons" and isinstance(
-                paramData, self.ConeDimensions
-            ):
-                solid = _solid.Cons(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin1,
-                    paramData.pRMax1,
-                    paramData.pRMin2,
-                    paramData.pRMax2,
-                    paramData.pDz,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Orb" and isinstance(
-                paramData, self.OrbDimensions
-            ):
-                solid = _solid.Orb(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Sphere" and isinstance(
-                paramData, self.SphereDimensions
-            ):
-                solid = _solid.Sphere(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.pSTheta,
-                    paramData.pDTheta,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Torus" and isinstance(
-                paramData, self.TorusDimensions
-            ):
-                solid = _solid.Torus(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    paramData.pRTor,
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Hype" and isinstance(
-                paramData, self.HypeDimensions
-            ):
-                solid = _solid.Hype(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.innerRadius,
-                    paramData.outerRadius,
-                    paramData.innerStereo,
-                    paramData.outerStereo,
-                    paramData.lenZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Para" and isinstance(
-                paramData, self.ParaDimensions
-            ):
-                solid = _solid.Para(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX,
-                    paramData.pY,
-                    paramData.pZ,
-                    paramData.pAlpha,
-                    paramData.pTheta,
-                    paramData.pPhi,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Trd" and isinstance(
-                paramData, self.TrdDimensions
-            ):
-                solid = _solid.Trd(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pX1,
-                    paramData.pX2,
-                    paramData.pY1,
-                    paramData.pY2,
-                    paramData.pZ,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Trap" and isinstance(
-                paramData, self.TrapDimensions
-            ):
-                solid = _solid.Trap(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pDz,
-                    paramData.pTheta,
-                    paramData.pDPhi,
-                    paramData.pDy1,
-                    paramData.pDx1,
-                    paramData.pDx2,
-                    paramData.pAlp1,
-                    paramData.pDy2,
-                    paramData.pDx3,
-                    paramData.pDx4,
-                    paramData.pAlp2,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Polycone" and isinstance(
-                paramData, self.PolyconeDimensions
-            ):
-                solid = _solid.Polycone(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.pZpl,
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    self.logicalVolume.solid.nslice,
-                    False,
-                )
-
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Polyhedra" and isinstance(
-                paramData, self.PolyhedraDimensions
-            ):
-                solid = _solid.Polyhedra(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pSPhi,
-                    paramData.pDPhi,
-                    paramData.numSide,
-                    len(paramData.pZpl),
-                    paramData.pZpl,
-                    paramData.pRMin,
-                    paramData.pRMax,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    paramData.aunit,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            elif self.logicalVolume.solid.type == "Ellipsoid" and isinstance(
-                paramData, self.EllipsoidDimensions
-            ):
-                solid = _solid.Ellipsoid(
-                    self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                    paramData.pxSemiAxis,
-                    paramData.pySemiAxis,
-                    paramData.pzSemiAxis,
-                    paramData.pzBottomCut,
-                    paramData.pzTopCut,
-                    self.logicalVolume.registry,
-                    paramData.lunit,
-                    self.logicalVolume.solid.nslice,
-                    self.logicalVolume.solid.nstack,
-                    False,
-                )
-                mesh = _Mesh(solid)
-                meshes.append(mesh)
-
-            else:
-                pass
-
-        return meshes
+            if isinstance(paramData, self._dimensionsTypes.get(self.logicalVolume.solid.type, ())):
+                sources.append(_functools.partial(self._parameterisedSolid, paramData, i))
+        return _LazyMeshList(sources)
+
+    def _parameterisedSolid(self, paramData, i):
+        # box
+        if self.logicalVolume.solid.type == "Box" and isinstance(paramData, self.BoxDimensions):
+            return _solid.Box(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX,
+                paramData.pY,
+                paramData.pZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Tubs" and isinstance(paramData, self.TubeDimensions):
+            return _solid.Tubs(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pDz,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Cons" and isinstance(paramData, self.ConeDimensions):
+            return _solid.Cons(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin1,
+                paramData.pRMax1,
+                paramData.pRMin2,
+                paramData.pRMax2,
+                paramData.pDz,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Orb" and isinstance(paramData, self.OrbDimensions):
+            return _solid.Orb(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Sphere" and isinstance(
+            paramData, self.SphereDimensions
+        ):
+            return _solid.Sphere(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.pSTheta,
+                paramData.pDTheta,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Torus" and isinstance(
+            paramData, self.TorusDimensions
+        ):
+            return _solid.Torus(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pRMin,
+                paramData.pRMax,
+                paramData.pRTor,
+                paramData.pSPhi,
+                paramData.pDPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Hype" and isinstance(paramData, self.HypeDimensions):
+            return _solid.Hype(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.innerRadius,
+                paramData.outerRadius,
+                paramData.innerStereo,
+                paramData.outerStereo,
+                paramData.lenZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Para" and isinstance(paramData, self.ParaDimensions):
+            return _solid.Para(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX,
+                paramData.pY,
+                paramData.pZ,
+                paramData.pAlpha,
+                paramData.pTheta,
+                paramData.pPhi,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Trd" and isinstance(paramData, self.TrdDimensions):
+            return _solid.Trd(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pX1,
+                paramData.pX2,
+                paramData.pY1,
+                paramData.pY2,
+                paramData.pZ,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Trap" and isinstance(paramData, self.TrapDimensions):
+            return _solid.Trap(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pDz,
+                paramData.pTheta,
+                paramData.pDPhi,
+                paramData.pDy1,
+                paramData.pDx1,
+                paramData.pDx2,
+                paramData.pAlp1,
+                paramData.pDy2,
+                paramData.pDx3,
+                paramData.pDx4,
+                paramData.pAlp2,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Polycone" and isinstance(
+            paramData, self.PolyconeDimensions
+        ):
+            return _solid.Polycone(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.pZpl,
+                paramData.pRMin,
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                self.logicalVolume.solid.nslice,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Polyhedra" and isinstance(
+            paramData, self.PolyhedraDimensions
+        ):
+            return _solid.Polyhedra(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pSPhi,
+                paramData.pDPhi,
+                paramData.numSide,
+                len(paramData.pZpl),
+                paramData.pZpl,
+                paramData.pRMin,
+                paramData.pRMax,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                paramData.aunit,
+                False,
+            )
+
+        elif self.logicalVolume.solid.type == "Ellipsoid" and isinstance(
+            paramData, self.EllipsoidDimensions
+        ):
+            return _solid.Ellipsoid(
+                self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+                paramData.pxSemiAxis,
+                paramData.pySemiAxis,
+                paramData.pzSemiAxis,
+                paramData.pzBottomCut,
+                paramData.pzTopCut,
+                self.logicalVolume.registry,
+                paramData.lunit,
+                self.logicalVolume.solid.nslice,
+                self.logicalVolume.solid.nstack,
+                False,
+            )
+
+        return None
 
     def __repr__(self):
         return ""
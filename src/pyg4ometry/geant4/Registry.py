@@ -1,3 +1,4 @@
+from .. import config as _config
 from .. import exceptions as _exceptions
 from . import _Material as _mat
 from . import solid
@@ -66,8 +67,13 @@ class Registry:
         self.logicalVolumeUsageCountDict = _defaultdict(int)  # named logical usage in physical
 
         self.editedSolids = []  # Solids changed post-initialisation
+        self.solidEditVersion = 0  # incremented whenever a solid is edited, see registerSolidEdit
+        self.solidMeshMemo = {}  # solid name : (meshKey, mesh) of boolean operands, see solidMesh
 
         self.expressionParser = None
+        self.defineVersion = 0  # incremented whenever a define changes, see registerDefineEdit
+        self.expressionValues = {}  # expression string : value, see evaluateExpression
+        self.expressionValuesVersion = 0
 
     def clear(self):
         """Empty all internal structures"""
@@ -103,6 +109,8 @@ class Registry:
         self.logicalVolumeUsageCountDict.clear()
 
         self.editedSolids = []
+        self.clearSolidMeshMemo()
+        self.registerDefineEdit()
 
     def getExpressionParser(self):
         if not self.expressionParser:
@@ -112,9 +120,83 @@ class Registry:
 
         return self.expressionParser
 
+    def evaluateExpression(self, expressionString):
+        """
+        Evaluate an expression string using the defines of this registry. Every distinct
+        expression is only parsed once and its value is memoised until a define changes,
+        see registerDefineEdit.
+
+        :param expressionString: expression to evaluate e.g. "2*a+3"
+        :type expressionString: str
+        """
+        if self.expressionValuesVersion != self.defineVersion:
+            self.expressionValues.clear()
+            self.expressionValuesVersion = self.defineVersion
+
+        try:
+            return self.expressionValues[expressionString]
+        except KeyError:
+            pass
+
+        value = self.getExpressionParser().compile(expressionString)(self.defineDict)
+        self.expressionValues[expressionString] = value
+        return value
+
+    def registerDefineEdit(self):
+        """
+        Forget all memoised expression values. Called when a define expression is changed
+        or a define shadowing a unit is added. Memoised solid meshes are dropped too as
+        any of them may depend on the define.
+        """
+        self.defineVersion += 1
+        self.solidMeshMemo.clear()
+
     def registerSolidEdit(self, solid):
         if solid.name in self.solidDict:
             self.editedSolids.append(solid.name)
+        self.solidEditVersion += 1
+        self._invalidateSolidMesh(solid)
+
+    def solidMesh(self, solid):
+        """
+        Return a mesh of solid, memoised so that a solid shared by many booleans is only
+        meshed once. A fresh copy is returned every time so it may be transformed freely.
+        Each entry is stored with the meshKey of the solid and only reused while the key
+        is unchanged, so edits that bypass registerSolidEdit (e.g. a changed define) are
+        still picked up. Solids not stored in this registry, or without a meshKey, are
+        always meshed again.
+
+        :param solid: solid to mesh
+        :type solid: SolidBase
+        """
+        if not _config.memoiseSolidMeshes or self.solidDict.get(solid.name) is not solid:
+            return solid.mesh()
+
+        key = solid.meshKey()
+        if key is None:
+            return solid.mesh()
+
+        memoKey, mesh = self.solidMeshMemo.get(solid.name, (None, None))
+        if memoKey != key:
+            mesh = solid.mesh()
+            self.solidMeshMemo[solid.name] = (key, mesh)
+        return mesh.clone()
+
+    def clearSolidMeshMemo(self):
+        """Forget all memoised solid meshes."""
+        self.solidMeshMemo.clear()
+
+    def _invalidateSolidMesh(self, solid):
+        # iterative so deep boolean trees cannot hit the recursion limit
+        stack = [solid]
+        seen = set()
+        while stack:
+            solid = stack.pop()
+            if id(solid) in seen:
+                continue
+            seen.add(id(solid))
+            self.solidMeshMemo.pop(solid.name, None)
+            stack.extend(getattr(solid, "dependents", []))
 
     def addMaterial(self, material, dontWarnIfAlreadyAdded=False):
         """
@@ -391,6 +473,10 @@ class Registry:
         else:
             self.defineDict[define.name] = define
 
+        # a new name cannot change a memoised value unless it hides a unit of the same name
+        if define.name in _units:
+            self.registerDefineEdit()
+
         self.defineNameCount[define.name] += 1
 
         return define.name  # why do we need this?
@@ -417,6 +503,7 @@ class Registry:
 
         self.defineDict[define.name] = define
         define.registry = self
+        self.registerDefineEdit()
 
         self.defineNameCount[define.name] += 1
 
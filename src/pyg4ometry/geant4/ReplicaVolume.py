@@ -1,12 +1,15 @@
 from .PhysicalVolume import PhysicalVolume as _PhysicalVolume
 from . import solid as _solid
-from ..visualisation import Mesh as _Mesh
+from ..visualisation import LazyMeshList as _LazyMeshList
 from ..visualisation import OverlapType as _OverlapType
+from ..visualisation import _getBoundingBox
 from ..visualisation import VisualisationOptions as _VisOptions
 from .. import transformation as _trans
 
+import functools as _functools
 import numpy as _np
 import logging as _log
+import time as _time
 
 _log = _log.getLogger(__name__)
 
@@ -76,11 +79,39 @@ class ReplicaVolume(_PhysicalVolume):
         names = {1: "kXAxis", 2: "kYAxis", 3: "kZAxis", 4: "kRho", 5: "kPhi"}
         return names[self.axis]
 
-    def _checkInternalOverlaps(self, nOverlapsDetected=[0]):
+    def _checkInternalOverlaps(self, nOverlapsDetected=None, report=None):
         """
         Check if there are overlaps with the nominal mother volume. ie it possible to provide
-        an incorrect mother volume / logical volume and parameterisation.
+        an incorrect mother volume / logical volume and parameterisation. Results are added
+        to report (an OverlapReport) if given.
         """
+        from .OverlapReport import Overlap as _Overlap
+
+        if nOverlapsDetected is None:
+            nOverlapsDetected = [0]
+
+        def _record(overlapType, name1, name2, interMesh, elapsed):
+            overlapping = interMesh.vertexCount() != 0
+            if report is None:
+                return
+            report.addTest(overlapType, self.motherVolume.name, name1, name2, elapsed, overlapping)
+            if overlapping:
+                bb = _getBoundingBox(interMesh, nameForError=self.name)
+                volume = None
+                if overlapType != _OverlapType.coplanar and hasattr(interMesh, "volume"):
+                    volume = interMesh.volume()
+                report.addOverlap(
+                    _Overlap(
+                        overlapType,
+                        self.motherVolume.name,
+                        name1,
+                        name2,
+                        volume,
+                        [[float(x) for x in v] for v in bb],
+                        elapsed,
+                    )
+                )
+
         # protrusion from mother solid
         tempMeshes = []
         for (rot, tra), m in zip(self.transforms, self.meshes):
@@ -95,7 +126,15 @@ class ReplicaVolume(_PhysicalVolume):
                 f"ReplicaVolume.checkOverlaps> full daughter-mother intersection test {self.meshes[i]}"
             )
 
+            start = _time.perf_counter()
             interMesh = tempMeshes[i].subtract(self.motherVolume.mesh.localboundingmesh)
+            _record(
+                _OverlapType.protrusion,
+                f"{self.name}#{i}",
+                self.motherVolume.name,
+                interMesh,
+                _time.perf_counter() - start,
+            )
             _log.debug(
                 f"ReplicaVolume.checkOverlaps> daughter container {i} {interMesh.vertexCount()} {interMesh.polygonCount()}"
             )
@@ -115,12 +154,20 @@ class ReplicaVolume(_PhysicalVolume):
                 )
 
                 # first check if bounding mesh intersects
+                start = _time.perf_counter()
                 cullIntersection = tempMeshes[i].intersect(tempMeshes[j])
                 if cullIntersection.vertexCount() == 0:
                     continue
 
                 # bounding meshes collide, so check full mesh properly
                 interMesh = tempMeshes[i].intersect(tempMeshes[j])
+                _record(
+                    _OverlapType.overlap,
+                    f"{self.name}#{i}",
+                    f"{self.name}#{j}",
+                    interMesh,
+                    _time.perf_counter() - start,
+                )
                 _log.debug(
                     f"ReplicaVolume.checkOverlaps> full daughter-daughter intersection test: {i} {j} {interMesh.vertexCount()} {interMesh.polygonCount()}"
                 )
@@ -154,7 +201,7 @@ class ReplicaVolume(_PhysicalVolume):
                     trans[self.axis - 1] = v
 
                 transforms.append([rot, trans])
-                meshes.append(self.logicalVolume.mesh)
+                meshes.append(self._logicalVolumeMesh)
 
                 # if daughter contains a replica
                 if len(self.logicalVolume.daughterVolumes) == 1:
@@ -163,8 +210,8 @@ class ReplicaVolume(_PhysicalVolume):
                             daughter_meshes,
                             daughter_transforms,
                         ] = self.logicalVolume.daughterVolumes[0].createReplicaMeshes()
-                        for m, t in zip(daughter_meshes, daughter_transforms):
-                            meshes.append(m)
+                        for i, t in enumerate(daughter_transforms):
+                            meshes.append(_functools.partial(daughter_meshes.__getitem__, i))
                             transforms.append(
                                 [rot, _np.array(trans) + _np.array(t[1])]
                             )  # TBC - t[0] ie daughter rotation is unused / not compounded
@@ -175,28 +222,32 @@ class ReplicaVolume(_PhysicalVolume):
                 range(0, nreplicas, 1),
             ):
                 if self.axis == self.Axis.kRho:
-                    solid = _solid.Tubs(
-                        self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
-                        v,
-                        v + width,
-                        self.logicalVolume.solid.pDz,
-                        self.logicalVolume.solid.pSPhi,
-                        self.logicalVolume.solid.pDPhi,
-                        self.logicalVolume.registry,
-                        self.logicalVolume.solid.lunit,
-                        self.logicalVolume.solid.aunit,
-                        self.logicalVolume.solid.nslice,
-                        False,
-                    )
-                    mesh = _Mesh(solid)
-                    meshes.append(mesh)
+                    meshes.append(_functools.partial(self._rhoReplicaSolid, i, v, width))
                     transforms.append([[0, 0, 0], [0, 0, 0]])
 
                 elif self.axis == self.Axis.kPhi:
-                    meshes.append(self.logicalVolume.mesh)
+                    meshes.append(self._logicalVolumeMesh)
                     transforms.append([[0, 0, v], [0, 0, 0]])
 
-        return [meshes, transforms]
+        return [_LazyMeshList(meshes), transforms]
+
+    def _logicalVolumeMesh(self):
+        return self.logicalVolume.mesh
+
+    def _rhoReplicaSolid(self, i, v, width):
+        return _solid.Tubs(
+            self.name + "_" + self.logicalVolume.solid.name + "_" + str(i),
+            v,
+            v + width,
+            self.logicalVolume.solid.pDz,
+            self.logicalVolume.solid.pSPhi,
+            self.logicalVolume.solid.pDPhi,
+            self.logicalVolume.registry,
+            self.logicalVolume.solid.lunit,
+            self.logicalVolume.solid.aunit,
+            self.logicalVolume.solid.nslice,
+            False,
+        )
 
     def getPhysicalVolumes(self):
         """
@@ -26,5 +26,6 @@ from .DivisionVolume import *
 from .SkinSurface import *
 from .BorderSurface import *
 from .Registry import *
+from .OverlapReport import *
 from ._Material import *
 from . import solid
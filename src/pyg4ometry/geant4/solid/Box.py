@@ -13,6 +13,7 @@ elif _config.meshing == _config.meshingType.cgal_sm:
     from ...pycgal.geom import Vertex as _Vertex
     from ...pycgal.geom import Polygon as _Polygon
 
+import numpy as _np
 import logging as _log
 
 _log = _log.getLogger(__name__)
@@ -124,29 +125,15 @@ class Box(_SolidBase):
         pY = self.evaluateParameter(self.pY) * uval / 2.0
         pZ = self.evaluateParameter(self.pZ) * uval / 2.0
 
-        c = _Vector(0, 0, 0)
-        r = [pX, pY, pZ]
-
-        polygons = [
-            _Polygon(
-                [
-                    _Vertex(
-                        _Vector(
-                            c.x + r[0] * (2 * bool(i & 1) - 1),
-                            c.y + r[1] * (2 * bool(i & 2) - 1),
-                            c.z + r[2] * (2 * bool(i & 4) - 1),
-                        )
-                    )
-                    for i in v[0]
-                ]
-            )
-            for v in [
-                [[0, 4, 6, 2], [-1, 0, 0]],
-                [[1, 3, 7, 5], [+1, 0, 0]],
-                [[0, 1, 5, 4], [0, -1, 0]],
-                [[2, 6, 7, 3], [0, +1, 0]],
-                [[0, 2, 3, 1], [0, 0, -1]],
-                [[4, 5, 7, 6], [0, 0, +1]],
-            ]
+        # corner i has the sign of bit 0,1,2 of i in x,y,z
+        corners = _np.arange(8)[:, None] >> _np.arange(3) & 1
+        vertices = (2 * corners - 1) * [pX, pY, pZ]
+        faces = [
+            [0, 4, 6, 2],
+            [1, 3, 7, 5],
+            [0, 1, 5, 4],
+            [2, 6, 7, 3],
+            [0, 2, 3, 1],
+            [4, 5, 7, 6],
         ]
-        return _CSG.fromPolygons(polygons)
+        return _CSG.fromArrays(vertices, faces)
@@ -122,95 +122,40 @@ class ExtrudedSolid(_SolidBase):
         nslices = len(pZslices)
 
         _log.debug("xtru.pycsgmesh> mesh")
-        polygons = []
-        polygonsT = []
-        polygonsB = []
-
-        if self.polygon_area(vertices) < 0:
-            vertices = list(reversed(vertices))
-
-        topPolyList = [
-            [scale[-1] * vert[0] + x_offs[-1], scale[-1] * vert[1] + y_offs[-1]]
-            for vert in list(reversed(vertices))
-        ]
-
-        topPolyListConvex = _PolygonProcessing.triangulatePolygon2d(topPolyList)
-
-        for topPoly in topPolyListConvex:
-            topPolyPolygon = _Polygon(
-                [_Vertex(_Vector(vert[0], vert[1], zpos[-1])) for vert in topPoly]
-            )
-            polygonsT.append(topPolyPolygon)
-
-        bottomPolyList = [
-            [scale[0] * vert[0] + x_offs[0], scale[0] * vert[1] + y_offs[0]]
-            for vert in list(reversed(vertices))
-        ]
-
-        bottomPolyListConvex = _PolygonProcessing.triangulatePolygon2d(bottomPolyList)
-
-        for bottomPoly in bottomPolyListConvex:
-            bottomPoly = list(
-                bottomPoly
-            )  # TODO reversed here because of needing counterclockwise in 2D convex decomp in CGAL
-            bottomPoly.reverse()
-
-            bottomPolyPolygon = _Polygon(
-                [_Vertex(_Vector(vert[0], vert[1], zpos[0])) for vert in bottomPoly]
-            )
-            polygonsB.append(bottomPolyPolygon)
-
-        # It appears we must append the top and bottom faces and then tile the sides
-        polygons.extend(polygonsT)
-        polygons.extend(polygonsB)
-
-        maxn = len(vertices)
-
-        for l in range(nslices - 1):
-            l_curr = l
-            l_next = l + 1
-
-            for n in range(maxn):
-                n_next = (n + 1) % maxn
-
-                vert = vertices[nslices - n]
-                vert_next = vertices[nslices - n - 1]
-
-                poly = _Polygon(
-                    [
-                        _Vertex(
-                            _Vector(
-                                scale[l_curr] * vert[0] + x_offs[l_curr],
-                                scale[l_curr] * vert[1] + y_offs[l_curr],
-                                zpos[l_curr],
-                            )
-                        ),
-                        _Vertex(
-                            _Vector(
-                                scale[l_curr] * vert_next[0] + x_offs[l_curr],
-                                scale[l_curr] * vert_next[1] + y_offs[l_curr],
-                                zpos[l_curr],
-                            )
-                        ),
-                        _Vertex(
-                            _Vector(
-                                scale[l_next] * vert_next[0] + x_offs[l_next],
-                                scale[l_next] * vert_next[1] + y_offs[l_next],
-                                zpos[l_next],
-                            )
-                        ),
-                        _Vertex(
-                            _Vector(
-                                scale[l_next] * vert[0] + x_offs[l_next],
-                                scale[l_next] * vert[1] + y_offs[l_next],
-                                zpos[l_next],
-                            )
-                        ),
-                    ]
-                )
-
-                polygons.append(poly)
-
-        mesh = _CSG.fromPolygons(polygons)
-
-        return mesh
+
+        # anticlockwise polygon (polygon_area is negative for anticlockwise)
+        polygon = _np.array(vertices, dtype=float)
+        if self.polygon_area(vertices) > 0:
+            polygon = polygon[::-1]
+        nvert = len(polygon)
+
+        # vertex k of slice l has index l * nvert + k
+        scale = _np.array(scale, dtype=float)[:, None, None]
+        offset = _np.stack([x_offs, y_offs], axis=1)[:, None, :]
+        xy = scale * polygon[None, :, :] + offset
+        z = _np.broadcast_to(_np.array(zpos, dtype=float)[:, None, None], (nslices, nvert, 1))
+        meshVertices = _np.concatenate([xy, z], axis=2).reshape(-1, 3)
+
+        # sides, outward for an anticlockwise polygon
+        l = _np.arange(nslices - 1)[:, None] * nvert
+        k1 = _np.arange(nvert)[None, :]
+        k2 = (k1 + 1) % nvert
+        sides = _np.stack([l + k1, l + k2, l + nvert + k2, l + nvert + k1], axis=-1).reshape(-1, 4)
+
+        # top and bottom from a triangulation of the polygon
+        triangles = _PolygonProcessing.triangulatePolygon2d(polygon.tolist())
+        triangles = _np.array(triangles, dtype=float).reshape(-1, 3, 2)
+        distance = _np.linalg.norm(triangles[:, :, None, :] - polygon[None, None, :, :], axis=3)
+        triangles = distance.argmin(axis=2)
+        e1 = polygon[triangles[:, 1]] - polygon[triangles[:, 0]]
+        e2 = polygon[triangles[:, 2]] - polygon[triangles[:, 0]]
+        area = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+        triangles[area < 0] = triangles[area < 0, ::-1]
+        top = triangles + (nslices - 1) * nvert
+        bottom = triangles[:, ::-1]
+
+        faces = _np.concatenate([sides.reshape(-1), top.reshape(-1), bottom.reshape(-1)])
+        offsets = _np.concatenate(
+            [_np.arange(0, 4 * len(sides), 4), 4 * len(sides) + _np.arange(0, 6 * len(top) + 1, 3)]
+        )
+        return _CSG.fromArrays(meshVertices, faces, offsets)
@@ -75,9 +75,9 @@ class Intersection(_SolidBase):
 
         # get meshes
         _log.debug("Intersection.mesh> mesh1")
-        m1 = obj1.mesh()
+        m1 = self.registry.solidMesh(obj1)
         _log.debug("Intersection.mesh> mesh2")
-        m2 = obj2.mesh().clone()
+        m2 = self.registry.solidMesh(obj2)
 
         # apply transform to second mesh
         m2.rotate(rot[0], -rad2deg(rot[1]))
@@ -90,6 +90,13 @@ class Intersection(_SolidBase):
 
         return mesh
 
+    def _meshParameters(self):
+        return [
+            *super()._meshParameters(),
+            self._operandMeshKey(self.object1()),
+            self._operandMeshKey(self.object2()),
+        ]
+
     def translation(self):
         return self.tra2[1].eval()
 
@@ -1,12 +1,47 @@
 from .SolidBase import SolidBase as _SolidBase
+from ... import config as _config
 from ... import exceptions
+from ...meshutils import aabbSweepAndPrune as _aabbSweepAndPrune
+from ...meshutils import connectedComponents as _connectedComponents
 from ...transformation import *
 
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 import copy as _copy
 import logging as _log
+import numpy as _np
+
+if _config.meshing == _config.meshingType.pycsg:
+    from ...pycsg.core import CSG as _CSG
+elif _config.meshing == _config.meshingType.cgal_sm:
+    from ...pycgal.core import CSG as _CSG
 
 _log = _log.getLogger(__name__)
 
+# constituents closer than this (mm) are unioned rather than concatenated
+_aabbTolerance = 1e-6
+
+
+def _meshExtent(mesh):
+    if mesh.vertexCount() == 0:
+        return _np.zeros((2, 3))
+    return mesh.bbox()
+
+
+def _unionSerialised(job):
+    m1, m2 = (_CSG.fromArrays(*m) for m in job)
+    return m1.union(m2).toArrays()
+
+
+def _unionPairs(pairs, executor=None):
+    """
+    Union each pair of meshes, optionally in the worker processes of executor.
+    """
+    if executor is None or len(pairs) < 2:
+        return [m1.union(m2) for m1, m2 in pairs]
+
+    jobs = [tuple(m.toArrays() for m in pair) for pair in pairs]
+    return [_CSG.fromArrays(*r) for r in executor.map(_unionSerialised, jobs)]
+
 
 class MultiUnion(_SolidBase):
     """
@@ -50,19 +85,20 @@ class MultiUnion(_SolidBase):
         # TODO put all information
         return f"Multi Union {self.name}"
 
-    def mesh(self):
-        _log.debug("MultiUnion.pycsgmesh>")
+    def mesh(self, workers=None):
+        """
+        Mesh the union of all constituents. Constituents whose bounding boxes do not
+        touch are combined by concatenating their meshes, only groups of overlapping
+        constituents are unioned, pairwise as a balanced tree so the intermediate meshes
+        stay small.
 
-        result = self.objects[0].mesh()
-        tra2 = self.transformations[0]
-        rot = tbxyz2axisangle(tra2[0].eval())
-        tlate = tra2[1].eval()
-        result.rotate(rot[0], -rad2deg(rot[1]))
-        result.translate(tlate)
+        :param workers: number of processes for the unions of each level of the tree (cgal_sm meshing only)
+        :type workers: int
+        """
+        _log.debug("MultiUnion.pycsgmesh>")
 
-        for idx, (solid, tra2) in enumerate(
-            zip(self.objects[1:], self.transformations[1:]), start=1
-        ):
+        meshes = []
+        for idx, (solid, tra2) in enumerate(zip(self.objects, self.transformations)):
             # tranformation
             rot = tbxyz2axisangle(tra2[0].eval())
             tlate = tra2[1].eval()
@@ -70,13 +106,49 @@ class MultiUnion(_SolidBase):
 
             # get meshes
             _log.debug(f"union.mesh> mesh {idx}")
-            mesh = solid.mesh()
+            mesh = self.registry.solidMesh(solid)
 
-            # apply transform to second mesh
+            # apply transform to mesh
             mesh.rotate(rot[0], -rad2deg(rot[1]))
             mesh.translate(tlate)
-
-            _log.debug("MultiUnion.mesh> union")
-            result = result.union(mesh)
-
-        return result
+            meshes.append(mesh)
+
+        if len(meshes) == 1:
+            return meshes[0]
+
+        # group constituents with touching bounding boxes
+        aabbs = _np.array([_meshExtent(m) for m in meshes])
+        pairs = _aabbSweepAndPrune(aabbs[:, 0], aabbs[:, 1], _aabbTolerance)
+        groups = _connectedComponents(len(meshes), pairs)
+        _log.debug(f"MultiUnion.mesh> {len(meshes)} constituents in {len(groups)} groups")
+
+        # balanced pairwise reduction, all groups advance one level at a time
+        # the first level is the widest, one pool of processes serves all levels
+        groups = [[meshes[i] for i in group] for group in groups]
+        executor = None
+        try:
+            while any(len(group) > 1 for group in groups):
+                jobs = [
+                    (group[i], group[i + 1])
+                    for group in groups
+                    for i in range(0, len(group) - 1, 2)
+                ]
+                _log.debug(f"MultiUnion.mesh> union {len(jobs)} pairs")
+                if executor is None and workers and workers > 1 and len(jobs) > 1:
+                    executor = _ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+                results = iter(_unionPairs(jobs, executor))
+                groups = [
+                    [next(results) for _ in range(0, len(group) - 1, 2)]
+                    + ([group[-1]] if len(group) % 2 else [])
+                    for group in groups
+                ]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if len(groups) == 1:
+            return groups[0][0]
+        return type(meshes[0]).concatenate([group[0] for group in groups])
+
+    def _meshParameters(self):
+        return [*super()._meshParameters(), [self._operandMeshKey(obj) for obj in self.objects]]
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from ...meshutils import revolvedMesh as _revolvedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
@@ -92,62 +93,12 @@ class Orb(_SolidBase):
 
         pRMax = self.evaluateParameter(self.pRMax) * luval
 
-        polygons = []
-
         _log.debug("orb.pycsgmesh>")
 
-        dPhi = 2 * _np.pi / self.nslice
-        dTheta = _np.pi / self.nstack
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1
-            p2 = dPhi * i2
-
-            for j in range(0, self.nstack, 1):
-                j1 = j
-                j2 = j + 1
-
-                t1 = dTheta * j1
-                t2 = dTheta * j2
-
-                xRMaxP1T1 = pRMax * _np.sin(t1) * _np.cos(p1)
-                yRMaxP1T1 = pRMax * _np.sin(t1) * _np.sin(p1)
-                zRMaxP1T1 = pRMax * _np.cos(t1)
-
-                xRMaxP2T1 = pRMax * _np.sin(t1) * _np.cos(p2)
-                yRMaxP2T1 = pRMax * _np.sin(t1) * _np.sin(p2)
-                zRMaxP2T1 = pRMax * _np.cos(t1)
-
-                xRMaxP1T2 = pRMax * _np.sin(t2) * _np.cos(p1)
-                yRMaxP1T2 = pRMax * _np.sin(t2) * _np.sin(p1)
-                zRMaxP1T2 = pRMax * _np.cos(t2)
-
-                xRMaxP2T2 = pRMax * _np.sin(t2) * _np.cos(p2)
-                yRMaxP2T2 = pRMax * _np.sin(t2) * _np.sin(p2)
-                zRMaxP2T2 = pRMax * _np.cos(t2)
-
-                if t1 == 0:  # if north pole (triangles)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    polygons.append(_Polygon(vCurv))
-                elif t2 == _np.pi:  # if south pole (triangleS)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    polygons.append(_Polygon(vCurv))
-                else:  # normal curved quad
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    polygons.append(_Polygon(vCurv))
-
-        mesh = _CSG.fromPolygons(polygons)
-        return mesh
+        # meridian from the north to the south pole
+        theta = _np.linspace(0, _np.pi, self.nstack + 1)
+        r = pRMax * _np.sin(theta)
+        r[[0, -1]] = 0
+        profile = _np.stack([r, pRMax * _np.cos(theta)], axis=1)
+
+        return _CSG.fromArrays(*_revolvedMesh([profile], 0, 2 * _np.pi, self.nslice))
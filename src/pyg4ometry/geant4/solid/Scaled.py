@@ -39,6 +39,8 @@ class Scaled(_SolidBase):
         if addRegistry:
             registry.addSolid(self)
 
+        solid.dependents.append(self)
+
     def __repr__(self):
         return f"Scaled : {self.name} {self.solid} {self.pX} {self.pY} {self.pZ}"
 
@@ -54,8 +56,11 @@ class Scaled(_SolidBase):
         pY = self.evaluateParameter(self.pY)
         pZ = self.evaluateParameter(self.pZ)
 
-        mesh = self.solid.mesh()
+        mesh = self.registry.solidMesh(self.solid)
         mesh.scale([pX, pY, pZ])
 
         _log.debug("scaled.pycsgmesh> mesh")
         return mesh
+
+    def _meshParameters(self):
+        return [*super()._meshParameters(), self._operandMeshKey(self.solid)]
@@ -1,6 +1,20 @@
 import numpy as _np
 from ... import config as _config
 
+import hashlib as _hashlib
+
+
+class _NoMeshKey(Exception):
+    """
+    A solid parameter that does not give the same key in every session.
+    """
+
+
+def _isPlainData(value):
+    if isinstance(value, (list, tuple)):
+        return all(_isPlainData(v) for v in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
 
 class SolidBase:
     """
@@ -50,6 +64,100 @@ class SolidBase:
             # for now, just return the value without dealing with units
             return varVal
 
+    def _meshParameters(self):
+        """
+        Evaluated parameters that determine the mesh of this solid. Solids which depend
+        on data outside of varNames (other solids, tessellations) extend this.
+        """
+        if not hasattr(self, "varNames") or not hasattr(self, "varUnits"):
+            # e.g. HalfSpace or Wedge, whose parameters are not declared
+            raise _NoMeshKey(self.name)
+
+        params = [self.type]
+        for varName in self.varNames:
+            value = getattr(self, varName)
+            try:
+                value = self.evaluateParameter(value)
+            except Exception:
+                # only plain data has a repr that is the same in every session
+                if not _isPlainData(value):
+                    msg = f"{self.name}.{varName}"
+                    raise _NoMeshKey(msg)
+                value = repr(value)
+            params.append([varName, value])
+        params.append([[u, getattr(self, u)] for u in self.varUnits if u])
+
+        # discretisation, including the global defaults for this type of solid
+        params.append([getattr(self, "nslice", None), getattr(self, "nstack", None)])
+        defaults = getattr(_config.SolidDefaults, self.type, None)
+        params.append([getattr(defaults, "nslice", None), getattr(defaults, "nstack", None)])
+        return params
+
+    def __setattr__(self, attribute, value):
+        super().__setattr__(attribute, value)
+        # any public attribute may determine the mesh, so count it as an edit for the
+        # memoised mesh keys (see meshKey), also for solids without property setters
+        if not attribute.startswith("_"):
+            registry = self.__dict__.get("registry")
+            if registry is not None:
+                registry.solidEditVersion += 1
+
+    def meshKey(self):
+        """
+        Content hash (hex str) of everything that determines the mesh of this solid: its type,
+        evaluated parameters, units, slicing settings and the meshing backend. The name of the
+        solid is not included, so identical solids share a key. None if a parameter can be
+        neither evaluated nor represented the same way in every session.
+
+        The key is memoised until a solid or define in the registry of the solid is edited
+        (Registry.solidEditVersion and defineVersion). Call registry.registerSolidEdit after
+        modifying parameter arrays in place.
+        """
+        registry = self.registry
+        if registry is not None:
+            stamp = (registry.solidEditVersion, registry.defineVersion, _config.backendName())
+            memo = self.__dict__.get("_meshKeyMemo")
+            if memo is not None and memo[0] == stamp:
+                return memo[1]
+
+        key = self._computeMeshKey()
+        if registry is not None and key is not None:
+            self._meshKeyMemo = (stamp, key)
+        return key
+
+    def _computeMeshKey(self):
+        from ... import __version__
+
+        h = _hashlib.sha256()
+
+        def update(obj):
+            if isinstance(obj, _np.ndarray):
+                h.update(str(obj.dtype).encode())
+                h.update(str(obj.shape).encode())
+                h.update(_np.ascontiguousarray(obj).tobytes())
+            elif isinstance(obj, (list, tuple)):
+                h.update(b"[")
+                for item in obj:
+                    update(item)
+                    h.update(b",")
+                h.update(b"]")
+            else:
+                h.update(repr(obj).encode())
+
+        try:
+            params = self._meshParameters()
+        except _NoMeshKey:
+            return None
+        update([__version__, _config.backendName(), params])
+        return h.hexdigest()
+
+    def _operandMeshKey(self, solid):
+        # operands contribute their (memoised) key rather than all their parameters
+        key = solid.meshKey()
+        if key is None:
+            raise _NoMeshKey(solid.name)
+        return key
+
     def _addProperty(self, attribute):
         # create local setter and getter with a particular attribute name
         if hasattr(self.__class__, attribute):
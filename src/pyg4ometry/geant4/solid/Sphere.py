@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from ...meshutils import revolvedMesh as _revolvedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
@@ -119,8 +120,6 @@ class Sphere(_SolidBase):
         0 < theta < pi
         """
 
-        tBefore = _time.process_time()
-
         _log.debug("sphere.antlr>")
         from ...gdml import Units as _Units
 
@@ -136,172 +135,21 @@ class Sphere(_SolidBase):
 
         _log.debug("Sphere.pycsgmesh>")
 
-        polygons = []
-
-        # changed from d - s/ st
-
-        dPhi = (pDPhi) / self.nslice
-        dTheta = (pDTheta) / self.nstack
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            for j in range(0, self.nstack, 1):
-                j1 = j
-                j2 = j + 1
-
-                t1 = dTheta * j1 + pSTheta
-                t2 = dTheta * j2 + pSTheta
-
-                if pRmin != 0:
-                    xRMinP1T1 = pRmin * _np.sin(t1) * _np.cos(p1)
-                    yRMinP1T1 = pRmin * _np.sin(t1) * _np.sin(p1)
-                    zRMinP1T1 = pRmin * _np.cos(t1)
-
-                    xRMinP2T1 = pRmin * _np.sin(t1) * _np.cos(p2)
-                    yRMinP2T1 = pRmin * _np.sin(t1) * _np.sin(p2)
-                    zRMinP2T1 = pRmin * _np.cos(t1)
-
-                    xRMinP1T2 = pRmin * _np.sin(t2) * _np.cos(p1)
-                    yRMinP1T2 = pRmin * _np.sin(t2) * _np.sin(p1)
-                    zRMinP1T2 = pRmin * _np.cos(t2)
-
-                    xRMinP2T2 = pRmin * _np.sin(t2) * _np.cos(p2)
-                    yRMinP2T2 = pRmin * _np.sin(t2) * _np.sin(p2)
-                    zRMinP2T2 = pRmin * _np.cos(t2)
-                else:
-                    xRMinP1T1 = 0.0
-                    yRMinP1T1 = 0.0
-                    zRMinP1T1 = 0.0
-
-                    xRMinP2T1 = 0.0
-                    yRMinP2T1 = 0.0
-                    zRMinP2T1 = 0.0
-
-                    xRMinP1T2 = 0.0
-                    yRMinP1T2 = 0.0
-                    zRMinP1T2 = 0.0
-
-                    xRMinP2T2 = 0.0
-                    yRMinP2T2 = 0.0
-                    zRMinP2T2 = 0.0
-
-                xRMaxP1T1 = pRmax * _np.sin(t1) * _np.cos(p1)
-                yRMaxP1T1 = pRmax * _np.sin(t1) * _np.sin(p1)
-                zRMaxP1T1 = pRmax * _np.cos(t1)
-
-                xRMaxP2T1 = pRmax * _np.sin(t1) * _np.cos(p2)
-                yRMaxP2T1 = pRmax * _np.sin(t1) * _np.sin(p2)
-                zRMaxP2T1 = pRmax * _np.cos(t1)
-
-                xRMaxP1T2 = pRmax * _np.sin(t2) * _np.cos(p1)
-                yRMaxP1T2 = pRmax * _np.sin(t2) * _np.sin(p1)
-                zRMaxP1T2 = pRmax * _np.cos(t2)
-
-                xRMaxP2T2 = pRmax * _np.sin(t2) * _np.cos(p2)
-                yRMaxP2T2 = pRmax * _np.sin(t2) * _np.sin(p2)
-                zRMaxP2T2 = pRmax * _np.cos(t2)
-
-                ###########################
-                # Curved sphere faces
-                ###########################
-                if t1 == 0:  # if north pole (triangles)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    # print "outer  north pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                elif t2 == _np.pi:  # if south pole (triangleS)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer south pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                else:  # normal curved quad
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer normal quad",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-
-                if pRmin != 0:
-                    if t1 == 0:  # if north pole (triangles)
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner north pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    elif t2 == _np.pi:  # if south pole
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner south pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    else:  # normal curved quad
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner quad ", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                if pDPhi != 2 * _np.pi:
-                    if i == 0 and pSPhi != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if i == self.nslice - 1 and pSPhi + pDPhi != 2 * _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                if pDTheta != _np.pi:
-                    if j == 0 and pSTheta != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if j == self.nstack - 1 and pSTheta + pDTheta != _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-        tAfter = _time.process_time()
-
-        # mBefore = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        mesh = _CSG.fromPolygons(polygons)
-        # mAfter = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        # _log.debug(
-        #    f"Sphere.pycsgmesh> profile {self.nstack} {self.nslice} {mesh.getNumberPolys()} {mAfter - mBefore} {tAfter - tBefore}"
-        # )
+        # outer meridian followed by the inner one (or the centre) in reverse
+        theta = pSTheta + pDTheta / self.nstack * _np.arange(self.nstack + 1)
+        sinTheta = _np.sin(theta)
+        sinTheta[_np.isclose(theta, 0) | _np.isclose(theta, _np.pi)] = 0
+        outer = _np.stack([pRmax * sinTheta, pRmax * _np.cos(theta)], axis=1)
+        n = len(outer)
+        i = _np.arange(self.nstack)
+        if pRmin != 0:
+            inner = _np.stack([pRmin * sinTheta, pRmin * _np.cos(theta)], axis=1)[::-1]
+            caps = _np.stack([i, i + 1, 2 * n - 2 - i, 2 * n - 1 - i], axis=1)
+        else:
+            inner = _np.zeros((1, 2))
+            caps = _np.stack([i, i + 1, _np.full_like(i, n)], axis=1)
+        profile = _np.concatenate([outer, inner])
+
+        mesh = _CSG.fromArrays(*_revolvedMesh([profile], pSPhi, pDPhi, self.nslice, list(caps)))
+        _log.debug(f"Sphere.pycsgmesh> profile {self.nstack} {self.nslice} {mesh.getNumberPolys()}")
         return mesh
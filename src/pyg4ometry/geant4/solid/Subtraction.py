@@ -64,9 +64,9 @@ class Subtraction(_SolidBase):
 
         # get meshes
         _log.debug("subtraction.mesh> mesh1")
-        m1 = obj1.mesh()
+        m1 = self.registry.solidMesh(obj1)
         _log.debug("subtraction.mesh> mesh2")
-        m2 = obj2.mesh().clone()
+        m2 = self.registry.solidMesh(obj2)
 
         m2.rotate(rot[0], -rad2deg(rot[1]))
         m2.translate(tlate)
@@ -82,6 +82,13 @@ class Subtraction(_SolidBase):
 
         return mesh
 
+    def _meshParameters(self):
+        return [
+            *super()._meshParameters(),
+            self._operandMeshKey(self.object1()),
+            self._operandMeshKey(self.object2()),
+        ]
+
     def translation(self):
         return self.tra2[1].eval()
 
@@ -1,17 +1,12 @@
 from ... import config as _config
 
+from ... import meshutils as _meshutils
 from .SolidBase import SolidBase as _SolidBase
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
-    from ...pycsg.geom import Vector as _Vector
-    from ...pycsg.geom import Vertex as _Vertex
-    from ...pycsg.geom import Polygon as _Polygon
 elif _config.meshing == _config.meshingType.cgal_sm:
     from ...pycgal.core import CSG as _CSG
-    from ...pycgal.geom import Vector as _Vector
-    from ...pycgal.geom import Vertex as _Vertex
-    from ...pycgal.geom import Polygon as _Polygon
 
 import numpy as _np
 import logging as _log
@@ -71,122 +66,110 @@ class TessellatedSolid(_SolidBase):
     def __str__(self):
         return f"TessellatedSolid {self.type}"
 
+    @classmethod
+    def fromArrays(cls, name, vertices, faces, registry, addRegistry=True):
+        """
+        Construct a Freecad type tessellated solid that stores the given arrays directly,
+        without creating a Python list per vertex and facet.
+
+        :param vertices: vertex positions in mm
+        :type vertices: array_like (N,3)
+        :param faces: vertex indices of each facet, triangles padded with -1 if mixed with quadrangles
+        :type faces: array_like (M,3) or (M,4)
+        """
+        vertices = _np.ascontiguousarray(vertices, dtype=_np.float64).reshape(-1, 3)
+        faces = _np.asarray(faces, dtype=_np.int32)
+        faces = faces.reshape(-1, faces.shape[-1] if faces.ndim > 1 else 3)
+        return cls(name, [vertices, faces], registry, cls.MeshType.Freecad, addRegistry)
+
+    def _listStorage(self):
+        # array backed meshes are converted back to lists before they are edited in place
+        if isinstance(self.meshtess[0], _np.ndarray):
+            self.meshtess[0] = self.meshtess[0].tolist()
+        if isinstance(self.meshtess[1], _np.ndarray):
+            self.meshtess[1] = [[i for i in f if i >= 0] for f in self.meshtess[1].tolist()]
+
     def addVertex(self, vertex):
+        self._listStorage()
         self.meshtess[0].append(vertex)
 
     def addTriangle(self, triangle):
+        self._listStorage()
         self.meshtess[1].append(triangle)
 
-    def removeDuplicateVertices(self):
-        if self.meshtype != TessellatedSolid.MeshType.Freecad:
-            _log.warning("Cannot run on this mesh type")
-            return
-
-        vertexmap = {}
-
-        meshtess0 = []
-        meshtess1 = []
-
-        # Loop over triangles (polygons) in mesh
-        ivertexmap = 0
-        for t in self.meshtess[1]:
-            vinew_list = []
-            for vi in t:
-                v = self.meshtess[0][vi]
-                vr = (
-                    round(v[0] + 1.23456789, 10),
-                    round(v[1] + 1.23456789, 10),
-                    round(v[2] + 1.23456789, 10),
-                )
-                vrhash = hash(vr)
-
-                try:
-                    vinew = vertexmap[vrhash]
-                except KeyError:
-                    vertexmap[vrhash] = ivertexmap
-                    meshtess0.append(v)
-                    vinew = ivertexmap
-                    ivertexmap += 1
-
-                vinew_list.append(vinew)
-
-            meshtess1.append(vinew_list)
-
-        self.meshtess[0] = meshtess0
-        self.meshtess[1] = meshtess1
-
-        # print(vertexmap)
-        # print(meshtess0)
-        # print(meshtess1)
-
-    def mesh(self):
-        #############################################
-        # render GDML mesh
-        #############################################
+    def toArrays(self):
+        """
+        Return the tessellation as float64 (N,3) vertex positions in mm and int32 (M,3)
+        facet vertex indices, independent of the mesh type. If there are quadrangular
+        facets the faces are (M,4) and the triangles are padded with -1.
+        """
         if self.meshtype == self.MeshType.Gdml:
-            # vertex name - integer dict
-            vdict = {}
-
-            i = 0
+            # vertices are defines referred to by name, evaluate each only once
+            index = {}
             for f in self.meshtess:
                 for facet_vertex in f:
-                    try:
-                        vdict[facet_vertex]
-                    except KeyError:
-                        vdict[facet_vertex] = i
-                        i += 1
-
-            verts = [0 for dummy in range(0, len(vdict.keys()), 1)]
-            facet = []
-            for vdi in vdict.items():
-                p = self.registry.defineDict[vdi[0]]
-                verts[vdi[1]] = p.eval()
-
-            for f in self.meshtess:
-                facet.append([vdict[fi] for fi in f])
-
-        #############################################
-        # Mesh from CAD
-        #############################################
+                    index.setdefault(facet_vertex, len(index))
+            vertices = [self.registry.defineDict[vn].eval() for vn in index]
+            faces = [[index[fv] for fv in f] for f in self.meshtess]
         elif self.meshtype == self.MeshType.Freecad:
-            verts = self.meshtess[0]
-            facet = self.meshtess[1]
-
-        #############################################
-        # Mesh from STL
-        #############################################
+            vertices = self.meshtess[0]
+            faces = self.meshtess[1]
         elif self.meshtype == self.MeshType.Stl:
-            verts = []
-            facet = []
+            vertices = [f[0][:3] for f in self.meshtess]
+            faces = _np.arange(3 * len(self.meshtess)).reshape(-1, 3)
+        else:
+            msg = f"Urecognised mesh type: {self.meshtype}"
+            raise ValueError(msg)
 
-            i = 0
-            for f in self.meshtess:
-                v1 = f[0][0]
-                v2 = f[0][1]
-                v3 = f[0][2]
+        vertices = _np.asarray(vertices, dtype=_np.float64).reshape(-1, 3)
+        if isinstance(faces, _np.ndarray):
+            return vertices, faces.astype(_np.int32)
+        if len(faces) == 0:
+            return vertices, _np.zeros((0, 3), dtype=_np.int32)
+
+        nMax = max(len(f) for f in faces)
+        if all(len(f) == nMax for f in faces):
+            return vertices, _np.array(faces, dtype=_np.int32).reshape(-1, nMax)
+        return vertices, _np.array(
+            [list(f) + [-1] * (nMax - len(f)) for f in faces], dtype=_np.int32
+        )
 
-                verts.append(v1)
-                verts.append(v2)
-                verts.append(v3)
+    def removeDuplicateVertices(self):
+        """
+        Merge vertices that are equal to 10 decimals (mm) and drop unused vertices. The
+        remaining vertices are ordered by first use in the facets.
+        """
+        if self.meshtype != TessellatedSolid.MeshType.Freecad:
+            _log.warning("Cannot run on this mesh type")
+            return
 
-                facet.append((3 * i + 0, 3 * i + 1, 3 * i + 2))
-                i += 1
+        arrays = isinstance(self.meshtess[0], _np.ndarray)
+        vertices, faces = self.toArrays()
+        used = faces >= 0
+        vertices, index = _meshutils.uniqueVertices(vertices[faces[used]], 10)
+        faces[used] = index
 
+        if arrays:
+            self.meshtess[0] = vertices
+            self.meshtess[1] = faces
         else:
-            msg = f"Urecognised mesh type: {self.meshtype}"
-            raise ValueError(msg)
+            self.meshtess[0] = vertices.tolist()
+            self.meshtess[1] = [[i for i in f if i >= 0] for f in faces.tolist()]
 
-        #############################################
-        # Convert verts and facets to polygons
-        #############################################
-        polygon_list = []
+    def _meshParameters(self):
+        return [*super()._meshParameters(), self.meshtype, *self.toArrays()]
+
+    def mesh(self):
+        vertices, faces = self.toArrays()
 
-        for f in facet:
-            # This allows for both triangular and quadrilateral facets
-            polygon = _Polygon([_Vertex(verts[facet_vertex]) for facet_vertex in f])
-            polygon_list.append(polygon)
+        # merge coincident vertices (as when meshing from polygons) so facet soups such as
+        # STL give a closed surface
+        vertices, index = _meshutils.uniqueVertices(vertices, 11)
 
-        return _CSG.fromPolygons(polygon_list, cgalTest=False)
+        # flat facet vertex indices and the offset of each facet, without the -1 padding
+        used = faces >= 0
+        offsets = _np.concatenate([[0], _np.cumsum(used.sum(axis=1))])
+        return _CSG.fromArrays(vertices, index[faces[used]], offsets)
 
 
 def createTessellatedSolid(name, polygons, reg):
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from ...meshutils import revolvedMesh as _revolvedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
@@ -116,92 +117,15 @@ class Torus(_SolidBase):
         pDPhi = self.evaluateParameter(self.pDPhi) * auval
 
         _log.debug("torus.pycsgmesh>")
-        polygons = []
-
-        nstack = self.nstack
-        nslice = self.nslice
-
-        dTheta = 2 * _np.pi / nstack
-        dPhi = pDPhi / nslice
-
-        for j0 in range(nslice):
-            j1 = j0
-            j2 = j0 + 1
-
-            for i0 in range(nstack):
-                i1 = i0
-                i2 = i0 + 1
-
-                xRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T1 = pRmax * _np.sin(dTheta * i1)
-
-                xRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T1 = pRmax * _np.sin(dTheta * i1)
-
-                vertices_outer = []
-                vertices_outer.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                vertices_outer.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                vertices_outer.reverse()
-                polygons.append(_Polygon(vertices_outer))
-
-                xRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T1 = pRmin * _np.sin(dTheta * i1)
-
-                xRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T1 = pRmin * _np.sin(dTheta * i1)
-
-                if 0 < pRmin < pRmax:
-                    vertices_inner = []
-                    vertices_inner.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                    vertices_inner.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                    # vertices_inner.reverse()
-                    polygons.append(_Polygon(vertices_inner))
-
-                if pDPhi != 2 * _np.pi:
-                    if j1 == 0:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        end.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        end.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        end.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        end.reverse()
-                        polygons.append(_Polygon(end))
-
-                    if j1 == nslice - 1:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        end.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        end.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        end.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        # end.reverse()
-                        polygons.append(_Polygon(end))
-
-        mesh = _CSG.fromPolygons(polygons)
-
-        return mesh
+
+        # circular cross section(s) of the tube
+        theta = 2 * _np.pi / self.nstack * _np.arange(self.nstack)
+        outer = _np.stack([pRtor + pRmax * _np.cos(theta), pRmax * _np.sin(theta)], axis=1)
+        if not 0 < pRmin < pRmax:
+            return _CSG.fromArrays(*_revolvedMesh([outer], pSPhi, pDPhi, self.nslice))
+
+        inner = _np.stack([pRtor + pRmin * _np.cos(theta), pRmin * _np.sin(theta)], axis=1)
+        i1 = _np.arange(self.nstack)
+        i2 = (i1 + 1) % self.nstack
+        caps = _np.stack([i1, i2, i2 + self.nstack, i1 + self.nstack], axis=1)
+        return _CSG.fromArrays(*_revolvedMesh([outer, inner], pSPhi, pDPhi, self.nslice, caps))
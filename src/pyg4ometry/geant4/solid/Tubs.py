@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from ...meshutils import revolvedMesh as _revolvedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
@@ -102,97 +103,5 @@ class Tubs(_SolidBase):
 
         _log.debug("tubs.pycsgmesh> mesh")
 
-        polygons = []
-
-        dPhi = pDPhi / self.nslice
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            xRMinP1 = pRMin * _np.cos(p1)
-            yRMinP1 = pRMin * _np.sin(p1)
-            xRMinP2 = pRMin * _np.cos(p2)
-            yRMinP2 = pRMin * _np.sin(p2)
-
-            xRMaxP1 = pRMax * _np.cos(p1)
-            yRMaxP1 = pRMax * _np.sin(p1)
-            xRMaxP2 = pRMax * _np.cos(p2)
-            yRMaxP2 = pRMax * _np.sin(p2)
-
-            ###########################
-            # wedge ends
-            ###########################
-            if pDPhi != 2 * _np.pi and i == 0:
-                vWedg = []
-                vWedg.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vWedg.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vWedg.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vWedg.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                vWedg.reverse()
-                polygons.append(_Polygon(vWedg))
-
-            if pDPhi != 2 * _np.pi and i == self.nslice - 1:
-                vWedg = []
-                vWedg.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                vWedg.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vWedg.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                vWedg.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                vWedg.reverse()
-                polygons.append(_Polygon(vWedg))
-
-            ###########################
-            # tube ends
-            ###########################
-            if pRMin == 0:
-                vEnd = []
-                vEnd.append(_Vertex([0, 0, -pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                polygons.append(_Polygon(vEnd))
-
-                vEnd = []
-                vEnd.append(_Vertex([0, 0, pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                polygons.append(_Polygon(vEnd))
-
-            else:
-                vEnd = []
-                vEnd.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vEnd.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-                polygons.append(_Polygon(vEnd))
-
-                vEnd = []
-                vEnd.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-                vEnd.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-                vEnd.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                polygons.append(_Polygon(vEnd))
-
-            ###########################
-            # Curved cylinder faces
-            ###########################
-            vCurv = []
-            vCurv.append(_Vertex([xRMaxP1, yRMaxP1, -pDz]))
-            vCurv.append(_Vertex([xRMaxP2, yRMaxP2, -pDz]))
-            vCurv.append(_Vertex([xRMaxP2, yRMaxP2, pDz]))
-            vCurv.append(_Vertex([xRMaxP1, yRMaxP1, pDz]))
-            polygons.append(_Polygon(vCurv))
-
-            if pRMin != 0:
-                vCurv = []
-                vCurv.append(_Vertex([xRMinP1, yRMinP1, -pDz]))
-                vCurv.append(_Vertex([xRMinP1, yRMinP1, pDz]))
-                vCurv.append(_Vertex([xRMinP2, yRMinP2, pDz]))
-                vCurv.append(_Vertex([xRMinP2, yRMinP2, -pDz]))
-                polygons.append(_Polygon(vCurv))
-
-        mesh = _CSG.fromPolygons(polygons)
-
-        return mesh
+        profile = [[pRMin, -pDz], [pRMax, -pDz], [pRMax, pDz], [pRMin, pDz]]
+        return _CSG.fromArrays(*_revolvedMesh([profile], pSPhi, pDPhi, self.nslice))
@@ -61,3 +61,331 @@ def MeshShrink(m, shrinkFactor=1e-5):
     m.append(vertnormals)
 
     return vertnormals
+
+
+def uniqueVertices(vertices, decimals=10):
+    """
+    Merge vertices that are equal after rounding.
+
+    :param vertices: vertex positions
+    :type vertices: array_like (N,3)
+    :param decimals: number of decimals the coordinates are rounded to before comparing
+    :type decimals: int
+    returns: (distinct vertices (K,3) in order of first occurrence, int array (N) with
+             the index of each given vertex in them)
+    """
+    vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+    n = len(vertices)
+    if n == 0:
+        return vertices, _np.zeros(0, dtype=int)
+
+    # sort rows lexicographically (much faster than unique with axis=0), equal rows are
+    # then adjacent and, the sort being stable, the first of each run is its first occurrence
+    rounded = _np.round(vertices, decimals)
+    order = _np.lexsort(rounded.T[::-1])
+    sortedRows = rounded[order]
+    start = _np.empty(n, dtype=bool)
+    start[0] = True
+    _np.any(sortedRows[1:] != sortedRows[:-1], axis=1, out=start[1:])
+
+    group = _np.empty(n, dtype=int)
+    group[order] = _np.cumsum(start) - 1
+    first = order[start]
+
+    # number the distinct vertices by first occurrence
+    rank = _np.empty(len(first), dtype=int)
+    rank[_np.argsort(first)] = _np.arange(len(first))
+    return vertices[_np.sort(first)], rank[group]
+
+
+def aabbSweepAndPrune(aabbMin, aabbMax, tolerance=0.0):
+    """
+    Broad phase collision search between axis aligned bounding boxes. The boxes are
+    sorted along the axis with the largest spread of centres and only boxes whose
+    intervals overlap on that axis are tested on the remaining two. Touching boxes
+    (within tolerance) are kept as candidates so coplanar surfaces are not missed.
+
+    :param aabbMin: lower corners of the boxes
+    :type aabbMin: array_like (N,3)
+    :param aabbMax: upper corners of the boxes
+    :type aabbMax: array_like (N,3)
+    :param tolerance: distance by which boxes are grown before testing
+    :type tolerance: float
+    returns: int array (M,2) of candidate index pairs (i,j) with i < j, sorted
+    """
+    aabbMin = _np.asarray(aabbMin, dtype=float).reshape(-1, 3) - tolerance
+    aabbMax = _np.asarray(aabbMax, dtype=float).reshape(-1, 3) + tolerance
+    n = len(aabbMin)
+    if n < 2:
+        return _np.empty((0, 2), dtype=int)
+
+    centres = 0.5 * (aabbMin + aabbMax)
+    axis = int(_np.argmax(centres.var(axis=0)))
+
+    order = _np.argsort(aabbMin[:, axis], kind="stable")
+    sortedMin = aabbMin[order, axis]
+    sortedMax = aabbMax[order, axis]
+
+    # for sorted box i every box from i+1 up to (not including) end[i] starts before i ends
+    end = _np.searchsorted(sortedMin, sortedMax, side="right")
+    counts = _np.maximum(end - _np.arange(n) - 1, 0)
+    first = _np.repeat(_np.arange(n), counts)
+    offsets = _np.arange(counts.sum()) - _np.repeat(_np.cumsum(counts) - counts, counts)
+    second = first + 1 + offsets
+
+    a = order[first]
+    b = order[second]
+    keep = _np.all((aabbMin[a] <= aabbMax[b]) & (aabbMin[b] <= aabbMax[a]), axis=1)
+
+    pairs = _np.sort(_np.stack([a[keep], b[keep]], axis=1), axis=1)
+    pairs = pairs[_np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    return pairs
+
+
+def aabbContained(aabbMin, aabbMax, containerMin, containerMax, tolerance=0.0):
+    """
+    Test which axis aligned bounding boxes lie entirely inside a container box.
+
+    :param aabbMin: lower corners of the boxes
+    :type aabbMin: array_like (N,3)
+    :param aabbMax: upper corners of the boxes
+    :type aabbMax: array_like (N,3)
+    :param containerMin: lower corner of the container
+    :type containerMin: array_like (3)
+    :param containerMax: upper corner of the container
+    :type containerMax: array_like (3)
+    :param tolerance: distance by which the container is grown before testing
+    :type tolerance: float
+    returns: bool array (N) true where the box is inside the container
+    """
+    aabbMin = _np.asarray(aabbMin, dtype=float).reshape(-1, 3)
+    aabbMax = _np.asarray(aabbMax, dtype=float).reshape(-1, 3)
+    containerMin = _np.asarray(containerMin, dtype=float) - tolerance
+    containerMax = _np.asarray(containerMax, dtype=float) + tolerance
+    return _np.all((aabbMin >= containerMin) & (aabbMax <= containerMax), axis=1)
+
+
+def connectedComponents(n, pairs):
+    """
+    Group n items into connected components given the pairs of items that are connected
+    (union-find with path halving).
+
+    :param n: number of items
+    :type n: int
+    :param pairs: connected index pairs, e.g. from aabbSweepAndPrune
+    :type pairs: array_like (M,2)
+    returns: list of components, each a sorted list of item indices, ordered by first item
+    """
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        ri, rj = find(int(i)), find(int(j))
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    components = {}
+    for i in range(n):
+        components.setdefault(find(i), []).append(i)
+    return list(components.values())
+
+
+def _signedArea2d(x, y):
+    return 0.5 * _np.sum(x * _np.roll(y, -1) - _np.roll(x, -1) * y)
+
+
+def revolvedMesh(loops, sPhi, dPhi, nslice, caps=None):
+    """
+    Vertex and face arrays of the solid swept by rotating a profile in the (r,z) plane
+    about the z axis. The arc is approximated by nslice flat facets. Profile points on
+    the axis (r = 0) become a single vertex and their faces triangles.
+
+    :param loops: closed profile(s) [[r0,z0],[r1,z1],...]; the first is the outer boundary, any further loops are holes. The orientation is arbitrary.
+    :type loops: list of array_like (K,2)
+    :param sPhi: start angle in rad
+    :type sPhi: float
+    :param dPhi: opening angle in rad
+    :type dPhi: float
+    :param nslice: number of facets around the axis
+    :type nslice: int
+    :param caps: convex polygons covering the profile, used to close the ends for dPhi < 2 pi. Given as lists of indices into the concatenated loops, default is the first loop as one polygon.
+    :type caps: list of list of int
+    returns: vertices (N,3), flat face vertex indices and face offsets, see CSG.fromArrays
+    """
+    profiles = [_np.asarray(loop, dtype=float).reshape(-1, 2) for loop in loops]
+    full = abs(dPhi - 2 * _np.pi) < 1e-9
+    nPhi = nslice if full else nslice + 1
+
+    # coincident profile points share vertices
+    points, alias = _np.unique(_np.concatenate(profiles), axis=0, return_inverse=True)
+    alias = alias.reshape(-1)
+
+    r = points[:, 0]
+    onAxis = r <= 1e-12 * max(1.0, _np.abs(r).max())
+
+    # vertex index table (point, phi) with one shared vertex for points on the axis
+    nVertices = _np.where(onAxis, 1, nPhi)
+    first = _np.concatenate([[0], _np.cumsum(nVertices)[:-1]])
+    index = first[:, None] + _np.where(onAxis[:, None], 0, _np.arange(nPhi)[None, :])
+
+    phi = sPhi + dPhi / nslice * _np.arange(nPhi)
+    vertices = _np.empty((nVertices.sum(), 3))
+    vertices[index, 0] = r[:, None] * _np.cos(phi)[None, :]
+    vertices[index, 1] = r[:, None] * _np.sin(phi)[None, :]
+    vertices[index, 2] = points[:, 1][:, None]
+    vertices[first[onAxis], :2] = 0.0
+
+    # side faces, one quad per profile edge and slice, oriented outwards
+    faces = []
+    start = 0
+    for loopNumber, profile in enumerate(profiles):
+        n = len(profile)
+        i1 = alias[start + _np.arange(n)]
+        i2 = alias[start + (_np.arange(n) + 1) % n]
+        start += n
+
+        area = _signedArea2d(profile[:, 0], profile[:, 1])
+        if (area < 0) == (loopNumber == 0):
+            i1, i2 = i2, i1  # outer boundary anticlockwise, holes clockwise
+
+        # drop edges of zero length and edges along the axis
+        keep = (i1 != i2) & ~(onAxis[i1] & onAxis[i2])
+        i1, i2 = i1[keep], i2[keep]
+
+        j1 = _np.arange(nslice)
+        j2 = (j1 + 1) % nPhi
+        quads = _np.stack(
+            [index[i1][:, j1], index[i1][:, j2], index[i2][:, j2], index[i2][:, j1]], axis=-1
+        )
+        faces.append(quads.reshape(-1, 4))
+
+    quads = _np.concatenate(faces)
+
+    # quads with a vertex on the axis collapse to triangles
+    keep = quads != _np.roll(quads, 1, axis=1)
+    faceVertices = [quads[keep]]
+    sizes = [keep.sum(axis=1)]
+
+    if not full:
+        if caps is None:
+            caps = [_np.arange(len(profiles[0]))]
+        for cap in caps:
+            cap = alias[_np.asarray(cap, dtype=int)]
+            cap = cap[cap != _np.roll(cap, 1)]
+            if _signedArea2d(points[cap, 0], points[cap, 1]) < 0:
+                cap = cap[::-1]
+            # anticlockwise in (r,z) faces -phi, i.e. out of the start of the solid
+            faceVertices += [index[cap, 0], index[cap[::-1], nPhi - 1]]
+            sizes += [[len(cap)], [len(cap)]]
+
+    faces = _np.concatenate(faceVertices).astype(_np.int64)
+    offsets = _np.concatenate([[0], _np.cumsum(_np.concatenate(sizes))]).astype(_np.int64)
+    return vertices, faces, offsets
+
+
+def planeSection(vertices, triangles, origin, normal):
+    """
+    Intersect a triangle mesh with one or more planes. Vertices on a plane count as
+    being in front of it, so every cut triangle gives exactly one segment and faces
+    lying in the plane give none (their neighbours supply the outline).
+
+    :param vertices: vertex positions
+    :type vertices: array_like (N,3)
+    :param triangles: vertex indices of the triangles
+    :type triangles: array_like (M,3)
+    :param origin: a point on each plane
+    :type origin: array_like (3) or (P,3)
+    :param normal: normal of each plane, need not be normalised
+    :type normal: array_like (3) or (P,3)
+    returns: list (one entry per plane) of float arrays (S,2,3) of segment end points
+    """
+    vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+    triangles = _np.asarray(triangles, dtype=_np.int64).reshape(-1, 3)
+    origin = _np.asarray(origin, dtype=float).reshape(-1, 3)
+    normal = _np.asarray(normal, dtype=float).reshape(-1, 3)
+    origin, normal = _np.broadcast_arrays(origin, normal)
+
+    # signed distances of all vertices to all planes at once
+    distance = vertices @ normal.T - _np.sum(origin * normal, axis=1)
+    front = distance >= 0
+
+    segments = []
+    for p in range(len(normal)):
+        side = front[:, p][triangles]
+        nFront = side.sum(axis=1)
+        cut = (nFront == 1) | (nFront == 2)
+        tri = triangles[cut]
+        side = side[cut]
+
+        # the vertex alone on its side of the plane and the two edges leaving it
+        lone = _np.argmax(side == (nFront[cut] == 1)[:, None], axis=1)
+        rows = _np.arange(len(tri))
+        a = tri[rows, lone]
+        ends = []
+        for b in (tri[rows, (lone + 1) % 3], tri[rows, (lone + 2) % 3]):
+            # order the edge end points so an edge shared by two triangles gives the
+            # bitwise same point in both
+            lo = _np.minimum(a, b)
+            hi = _np.maximum(a, b)
+            dLo = distance[lo, p]
+            dHi = distance[hi, p]
+            t = dLo / (dLo - dHi)
+            ends.append(vertices[lo] + t[:, None] * (vertices[hi] - vertices[lo]))
+        segments.append(_np.stack(ends, axis=1))
+
+    return segments
+
+
+def stitchSegments(segments, decimals=9):
+    """
+    Join line segments that share end points into polylines. Closed loops repeat their
+    first point at the end; zero length and duplicate segments are dropped.
+
+    :param segments: segment end points, e.g. from planeSection
+    :type segments: array_like (S,2,3)
+    :param decimals: number of decimals end points are rounded to before comparing
+    :type decimals: int
+    returns: list of float arrays (K,3), one per polyline
+    """
+    segments = _np.asarray(segments, dtype=float).reshape(-1, 2, 3)
+    if len(segments) == 0:
+        return []
+
+    points, index = uniqueVertices(segments.reshape(-1, 3), decimals)
+    edges = index.reshape(-1, 2)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    edges = _np.unique(_np.sort(edges, axis=1), axis=0)
+
+    nPoints = len(points)
+    adjacent = [[] for _ in range(nPoints)]
+    for e, (i, j) in enumerate(edges.tolist()):
+        adjacent[i].append((j, e))
+        adjacent[j].append((i, e))
+    used = [False] * len(edges)
+
+    def walk(start):
+        line = [start]
+        node = start
+        while True:
+            for nextNode, e in adjacent[node]:
+                if not used[e]:
+                    break
+            else:
+                return line
+            used[e] = True
+            node = nextNode
+            line.append(node)
+
+    lines = []
+    # open chains start at points with an odd number of segments, then the closed loops
+    degree = _np.bincount(edges.ravel(), minlength=nPoints)
+    for start in _np.flatnonzero(degree % 2).tolist() + edges[:, 0].tolist():
+        while any(not used[e] for _, e in adjacent[start]):
+            lines.append(walk(start))
+
+    return [points[line] for line in lines]
@@ -1,5 +1,8 @@
+#include <algorithm>
+#include <limits>
 #include <vector>
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
 #include <pybind11/stl.h>
@@ -101,6 +104,11 @@ template <> struct hash<Surface_mesh_ECER> {
 
 } // namespace std
 
+typedef py::array_t<double, py::array::c_style | py::array::forcecast>
+    DoubleArray;
+typedef py::array_t<int64_t, py::array::c_style | py::array::forcecast>
+    IndexArray;
+
 /**********************************************************************
 EPICK
 **********************************************************************/
@@ -214,6 +222,112 @@ void toCGALSurfaceMesh(Surface_mesh_EPICK &sm, py::list &polygons) {
   }
 }
 
+py::ssize_t arraysToCGALSurfaceMesh(Surface_mesh_EPICK &sm,
+                                    DoubleArray &vertices, IndexArray &faces,
+                                    IndexArray &offsets) {
+  // vertices (N,3), faces flat vertex indices of all faces, face i is
+  // faces[offsets[i]:offsets[i+1]]
+  auto v = vertices.unchecked<2>();
+  auto f = faces.unchecked<1>();
+  auto o = offsets.unchecked<1>();
+
+  // the accessors are unchecked, so validate all indices before using them
+  if (v.shape(1) != 3)
+    throw py::value_error("vertices must have shape (N,3)");
+  if (o.shape(0) < 1 || o(0) != 0 || o(o.shape(0) - 1) != f.shape(0))
+    throw py::value_error("offsets must start at 0 and end at len(faces)");
+  for (py::ssize_t i = 1; i < o.shape(0); ++i) {
+    if (o(i) < o(i - 1))
+      throw py::value_error("offsets must be non-decreasing");
+  }
+  for (py::ssize_t k = 0; k < f.shape(0); ++k) {
+    if (f(k) < 0 || f(k) >= v.shape(0))
+      throw py::value_error("face vertex index out of range");
+  }
+
+  py::ssize_t nFaces = o.shape(0) - 1;
+  sm.reserve(v.shape(0), f.shape(0), nFaces);
+
+  for (py::ssize_t i = 0; i < v.shape(0); ++i) {
+    sm.add_vertex(Point_3_EPICK(v(i, 0), v(i, 1), v(i, 2)));
+  }
+
+  // faces that would make the mesh non-manifold or inconsistently oriented are
+  // skipped, as by toCGALSurfaceMesh, and counted
+  py::ssize_t nSkipped = 0;
+  std::vector<Surface_mesh_EPICK::Vertex_index> face;
+  for (py::ssize_t i = 0; i < nFaces; ++i) {
+    face.clear();
+    for (int64_t k = o(i); k < o(i + 1); ++k) {
+      face.push_back(Surface_mesh_EPICK::Vertex_index((size_t)f(k)));
+    }
+    if (sm.add_face(face) == Surface_mesh_EPICK::null_face())
+      ++nSkipped;
+  }
+  return nSkipped;
+}
+
+py::tuple toArrays(Surface_mesh_EPICK &sm) {
+  // vertices (N,3) float64 and triangles (M,3) int64 as numpy arrays, filled
+  // directly without intermediate python lists
+  DoubleArray verts({(py::ssize_t)sm.number_of_vertices(), (py::ssize_t)3});
+  IndexArray faces({(py::ssize_t)sm.number_of_faces(), (py::ssize_t)3});
+  auto v = verts.mutable_unchecked<2>();
+  auto f = faces.mutable_unchecked<2>();
+
+  // contiguous indices even if the mesh contains removed vertices
+  std::vector<int64_t> index(sm.num_vertices(), -1);
+
+  py::ssize_t i = 0;
+  for (Surface_mesh_EPICK::Vertex_index vd : sm.vertices()) {
+    const Point_3_EPICK &p = sm.point(vd);
+    v(i, 0) = CGAL::to_double(p.x());
+    v(i, 1) = CGAL::to_double(p.y());
+    v(i, 2) = CGAL::to_double(p.z());
+    index[(size_t)vd] = i++;
+  }
+
+  py::ssize_t j = 0;
+  for (Surface_mesh_EPICK::Face_index fd : sm.faces()) {
+    int k = 0;
+    for (Surface_mesh_EPICK::Halfedge_index hd :
+         CGAL::halfedges_around_face(sm.halfedge(fd), sm)) {
+      if (k == 3) {
+        throw py::value_error("toArrays requires a triangle mesh");
+      }
+      f(j, k++) = index[(size_t)sm.source(hd)];
+    }
+    if (k != 3) {
+      throw py::value_error("toArrays requires a triangle mesh");
+    }
+    ++j;
+  }
+
+  return py::make_tuple(verts, faces);
+}
+
+DoubleArray bbox(Surface_mesh_EPICK &sm) {
+  // [[xmin, ymin, zmin], [xmax, ymax, zmax]] of the vertices
+  DoubleArray box({(py::ssize_t)2, (py::ssize_t)3});
+  auto b = box.mutable_unchecked<2>();
+  for (int k = 0; k < 3; ++k) {
+    b(0, k) = std::numeric_limits<double>::infinity();
+    b(1, k) = -std::numeric_limits<double>::infinity();
+  }
+
+  for (Surface_mesh_EPICK::Vertex_index vd : sm.vertices()) {
+    const Point_3_EPICK &p = sm.point(vd);
+    double x[3] = {CGAL::to_double(p.x()), CGAL::to_double(p.y()),
+                   CGAL::to_double(p.z())};
+    for (int k = 0; k < 3; ++k) {
+      b(0, k) = std::min(b(0, k), x[k]);
+      b(1, k) = std::max(b(1, k), x[k]);
+    }
+  }
+
+  return box;
+}
+
 /**********************************************************************
 EPECK
 **********************************************************************/
@@ -327,6 +441,112 @@ void toCGALSurfaceMesh(Surface_mesh_EPECK &sm, py::list &polygons) {
   }
 }
 
+py::ssize_t arraysToCGALSurfaceMesh(Surface_mesh_EPECK &sm,
+                                    DoubleArray &vertices, IndexArray &faces,
+                                    IndexArray &offsets) {
+  // vertices (N,3), faces flat vertex indices of all faces, face i is
+  // faces[offsets[i]:offsets[i+1]]
+  auto v = vertices.unchecked<2>();
+  auto f = faces.unchecked<1>();
+  auto o = offsets.unchecked<1>();
+
+  // the accessors are unchecked, so validate all indices before using them
+  if (v.shape(1) != 3)
+    throw py::value_error("vertices must have shape (N,3)");
+  if (o.shape(0) < 1 || o(0) != 0 || o(o.shape(0) - 1) != f.shape(0))
+    throw py::value_error("offsets must start at 0 and end at len(faces)");
+  for (py::ssize_t i = 1; i < o.shape(0); ++i) {
+    if (o(i) < o(i - 1))
+      throw py::value_error("offsets must be non-decreasing");
+  }
+  for (py::ssize_t k = 0; k < f.shape(0); ++k) {
+    if (f(k) < 0 || f(k) >= v.shape(0))
+      throw py::value_error("face vertex index out of range");
+  }
+
+  py::ssize_t nFaces = o.shape(0) - 1;
+  sm.reserve(v.shape(0), f.shape(0), nFaces);
+
+  for (py::ssize_t i = 0; i < v.shape(0); ++i) {
+    sm.add_vertex(Point_3_EPECK(v(i, 0), v(i, 1), v(i, 2)));
+  }
+
+  // faces that would make the mesh non-manifold or inconsistently oriented are
+  // skipped, as by toCGALSurfaceMesh, and counted
+  py::ssize_t nSkipped = 0;
+  std::vector<Surface_mesh_EPECK::Vertex_index> face;
+  for (py::ssize_t i = 0; i < nFaces; ++i) {
+    face.clear();
+    for (int64_t k = o(i); k < o(i + 1); ++k) {
+      face.push_back(Surface_mesh_EPECK::Vertex_index((size_t)f(k)));
+    }
+    if (sm.add_face(face) == Surface_mesh_EPECK::null_face())
+      ++nSkipped;
+  }
+  return nSkipped;
+}
+
+py::tuple toArrays(Surface_mesh_EPECK &sm) {
+  // vertices (N,3) float64 and triangles (M,3) int64 as numpy arrays, filled
+  // directly without intermediate python lists
+  DoubleArray verts({(py::ssize_t)sm.number_of_vertices(), (py::ssize_t)3});
+  IndexArray faces({(py::ssize_t)sm.number_of_faces(), (py::ssize_t)3});
+  auto v = verts.mutable_unchecked<2>();
+  auto f = faces.mutable_unchecked<2>();
+
+  // contiguous indices even if the mesh contains removed vertices
+  std::vector<int64_t> index(sm.num_vertices(), -1);
+
+  py::ssize_t i = 0;
+  for (Surface_mesh_EPECK::Vertex_index vd : sm.vertices()) {
+    const Point_3_EPECK &p = sm.point(vd);
+    v(i, 0) = CGAL::to_double(p.x());
+    v(i, 1) = CGAL::to_double(p.y());
+    v(i, 2) = CGAL::to_double(p.z());
+    index[(size_t)vd] = i++;
+  }
+
+  py::ssize_t j = 0;
+  for (Surface_mesh_EPECK::Face_index fd : sm.faces()) {
+    int k = 0;
+    for (Surface_mesh_EPECK::Halfedge_index hd :
+         CGAL::halfedges_around_face(sm.halfedge(fd), sm)) {
+      if (k == 3) {
+        throw py::value_error("toArrays requires a triangle mesh");
+      }
+      f(j, k++) = index[(size_t)sm.source(hd)];
+    }
+    if (k != 3) {
+      throw py::value_error("toArrays requires a triangle mesh");
+    }
+    ++j;
+  }
+
+  return py::make_tuple(verts, faces);
+}
+
+DoubleArray bbox(Surface_mesh_EPECK &sm) {
+  // [[xmin, ymin, zmin], [xmax, ymax, zmax]] of the vertices
+  DoubleArray box({(py::ssize_t)2, (py::ssize_t)3});
+  auto b = box.mutable_unchecked<2>();
+  for (int k = 0; k < 3; ++k) {
+    b(0, k) = std::numeric_limits<double>::infinity();
+    b(1, k) = -std::numeric_limits<double>::infinity();
+  }
+
+  for (Surface_mesh_EPECK::Vertex_index vd : sm.vertices()) {
+    const Point_3_EPECK &p = sm.point(vd);
+    double x[3] = {CGAL::to_double(p.x()), CGAL::to_double(p.y()),
+                   CGAL::to_double(p.z())};
+    for (int k = 0; k < 3; ++k) {
+      b(0, k) = std::min(b(0, k), x[k]);
+      b(1, k) = std::max(b(1, k), x[k]);
+    }
+  }
+
+  return box;
+}
+
 void toCGALSurfaceMesh(Surface_mesh_EPECK &sm1, Surface_mesh_ECER &sm2) {
   py::list *polys = new py::list();
 
@@ -505,8 +725,15 @@ PYBIND11_MODULE(Surface_mesh, m) {
   m.def("toCGALSurfaceMesh", [](Surface_mesh_EPICK &sm, py::list &polygons) {
     toCGALSurfaceMesh(sm, polygons);
   });
+  m.def("toCGALSurfaceMesh",
+        [](Surface_mesh_EPICK &sm, DoubleArray &vertices, IndexArray &faces,
+           IndexArray &offsets) {
+          return arraysToCGALSurfaceMesh(sm, vertices, faces, offsets);
+        });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPICK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("toArrays", [](Surface_mesh_EPICK &sm) { return toArrays(sm); });
+  m.def("bbox", [](Surface_mesh_EPICK &sm) { return bbox(sm); });
 
   /**********************************************************************
   EPECK
@@ -678,8 +905,15 @@ PYBIND11_MODULE(Surface_mesh, m) {
   m.def("toCGALSurfaceMesh", [](Surface_mesh_EPECK &sm, py::list &polygons) {
     toCGALSurfaceMesh(sm, polygons);
   });
+  m.def("toCGALSurfaceMesh",
+        [](Surface_mesh_EPECK &sm, DoubleArray &vertices, IndexArray &faces,
+           IndexArray &offsets) {
+          return arraysToCGALSurfaceMesh(sm, vertices, faces, offsets);
+        });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPECK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("toArrays", [](Surface_mesh_EPECK &sm) { return toArrays(sm); });
+  m.def("bbox", [](Surface_mesh_EPECK &sm) { return bbox(sm); });
 
   /**********************************************************************
   ECER
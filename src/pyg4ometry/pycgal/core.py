@@ -5,6 +5,7 @@ from . import geom
 from . import Aff_transformation_3
 from . import Vector_3
 from . import Point_2
+from . import Point_3
 from . import Partition_traits_2_Polygon_2
 from . import Polygon_2
 from . import Polygon_with_holes_2
@@ -14,8 +15,11 @@ from . import Vector_3
 from . import CGAL
 from . import pythonHelpers
 
+import logging as _logging
 import numpy as _np
 
+_log = _logging.getLogger(__name__)
+
 
 class CSG:
     def __init__(self):
@@ -29,9 +33,87 @@ class CSG:
         Polygon_mesh_processing.triangulate_faces(csg.sm)
         return csg
 
+    @classmethod
+    def fromArrays(cls, vertices, faces, offsets=None):
+        """
+        Construct directly from arrays without creating Python polygon objects.
+
+        :param vertices: vertex positions
+        :type vertices: array_like (N,3)
+        :param faces: vertex indices, either (M,k) for faces with k vertices each or flat for all faces, see offsets
+        :type faces: array_like
+        :param offsets: face i is faces[offsets[i]:offsets[i+1]]
+        :type offsets: array_like (M+1)
+
+        Raises ValueError for out of range indices or offsets. Faces that CGAL cannot add,
+        e.g. non-manifold or inconsistently oriented ones, are skipped with a warning.
+        """
+        vertices = _np.ascontiguousarray(vertices, dtype=_np.float64).reshape(-1, 3)
+        faces = _np.asarray(faces, dtype=_np.int64)
+        if offsets is None:
+            offsets = _np.arange(0, faces.size + 1, faces.shape[1], dtype=_np.int64)
+        faces = _np.ascontiguousarray(faces.reshape(-1))
+        offsets = _np.ascontiguousarray(offsets, dtype=_np.int64)
+
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(faces):
+            msg = "offsets must start at 0 and end at len(faces)"
+            raise ValueError(msg)
+        if _np.any(_np.diff(offsets) < 0):
+            msg = "offsets must be non-decreasing"
+            raise ValueError(msg)
+        if len(faces) and (faces.min() < 0 or faces.max() >= len(vertices)):
+            msg = f"face vertex indices must be in [0, {len(vertices)})"
+            raise ValueError(msg)
+
+        csg = CSG()
+        nSkipped = Surface_mesh.toCGALSurfaceMesh(csg.sm, vertices, faces, offsets)
+        if nSkipped:
+            _log.warning("CSG.fromArrays> skipped %d of %d faces", nSkipped, len(offsets) - 1)
+        Polygon_mesh_processing.triangulate_faces(csg.sm)
+        return csg
+
+    @classmethod
+    def fromVerticesAndPolygons(cls, vertices, polygons):
+        """
+        Construct from a list of vertices [[x,y,z], ...] and a list of polygons given as
+        vertex indices [[i,j,k], ...], i.e. the first two items of toVerticesAndPolygons.
+        """
+        sizes = [len(polygon) for polygon in polygons]
+        offsets = _np.concatenate([[0], _np.cumsum(sizes, dtype=_np.int64)])
+        faces = _np.fromiter(
+            (i for polygon in polygons for i in polygon), dtype=_np.int64, count=offsets[-1]
+        )
+        return cls.fromArrays(vertices, faces, offsets)
+
+    @classmethod
+    def concatenate(cls, csgs):
+        """
+        Combine meshes into one without a boolean operation. Only valid when the
+        meshes do not intersect or touch, in which case it is equivalent to their union.
+        """
+        arrays = [csg.toArrays() for csg in csgs]
+        offsets = _np.cumsum([0] + [len(vertices) for vertices, _ in arrays[:-1]])
+        vertices = _np.concatenate([vertices for vertices, _ in arrays])
+        faces = _np.concatenate([faces + offset for (_, faces), offset in zip(arrays, offsets)])
+        return cls.fromArrays(vertices, faces)
+
     def toVerticesAndPolygons(self):
         return Surface_mesh.toVerticesAndPolygons(self.sm)
 
+    def toArrays(self):
+        """
+        Vertices as a (N,3) float64 array and triangles as a (M,3) int64 array of vertex
+        indices. Much cheaper than toVerticesAndPolygons for large meshes.
+        """
+        return Surface_mesh.toArrays(self.sm)
+
+    def bbox(self):
+        """
+        Axis aligned bounding box [[xmin,ymin,zmin],[xmax,ymax,zmax]] as a (2,3) array,
+        inf and -inf for an empty mesh.
+        """
+        return Surface_mesh.bbox(self.sm)
+
     def clone(self):
         csg = CSG()
         csg.sm = self.sm.clone()
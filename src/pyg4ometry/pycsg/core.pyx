@@ -82,9 +82,57 @@ class CSG(object):
         csg.polygons = list([p.clone() for p in self.polygons])
         return csg
 
+    @classmethod
+    def fromArrays(cls, vertices, faces, offsets=None):
+        """
+        Construct from vertices (N,3) and faces, either (M,k) vertex indices or flat
+        vertex indices of all faces with face i being faces[offsets[i]:offsets[i+1]].
+        """
+        vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+        faces = _np.asarray(faces)
+        if offsets is None:
+            offsets = _np.arange(0, faces.size + 1, faces.shape[1])
+            faces = faces.reshape(-1)
+        vectors = [Vector(*v) for v in vertices.tolist()]
+        polygons = [
+            Polygon([Vertex(vectors[k].clone()) for k in faces[offsets[i] : offsets[i + 1]]])
+            for i in range(len(offsets) - 1)
+        ]
+        return CSG.fromPolygons(polygons)
+
+    @classmethod
+    def concatenate(cls, csgs):
+        """
+        Combine meshes into one without a boolean operation. Only valid when the
+        meshes do not intersect or touch, in which case it is equivalent to their union.
+        """
+        csg = CSG()
+        for c in csgs:
+            csg.polygons.extend([p.clone() for p in c.polygons])
+        return csg
+
     def toPolygons(self):
         return self.polygons
 
+    def toArrays(self):
+        """
+        Vertices as a (N,3) float64 array and triangles (polygons fan triangulated) as a
+        (M,3) int64 array of vertex indices.
+        """
+        verts, polys, _ = self.toVerticesAndPolygons()
+        vertices = _np.array(verts, dtype=_np.float64).reshape(-1, 3)
+        faces = [[p[0], p[k], p[k + 1]] for p in polys for k in range(1, len(p) - 1)]
+        return vertices, _np.array(faces, dtype=_np.int64).reshape(-1, 3)
+
+    def bbox(self):
+        """
+        Axis aligned bounding box [[xmin,ymin,zmin],[xmax,ymax,zmax]] as a (2,3) array.
+        """
+        vertices = self.toArrays()[0]
+        if len(vertices) == 0:
+            return _np.array([[_np.inf] * 3, [-_np.inf] * 3])
+        return _np.array([vertices.min(axis=0), vertices.max(axis=0)])
+
     def isNull(self):
         return len(self.toPolygons()) == 0
 
@@ -1,29 +1,21 @@
 import numpy as _np
-import re as _re
+import os as _os
 import warnings as _warnings
-import struct
-import io
 
+from .. import meshutils as _meshutils
 from .. import visualisation as _vi
 from .. import geant4 as _g4
 from .. import gdml as _gd
 
-
-class _Facet:
-    def __init__(self, normal=(0, 0, 0)):
-        self.vertices = []
-        self.normal = normal
-
-    def add_vertex(self, xyztup):
-        self.vertices.append(xyztup)
-
-    def dump(self):
-        return (tuple(self.vertices), self.normal)
+# binary STL facet record: normal, 3 vertices and the attribute byte count
+_binaryFacet = _np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
 
 
 class Reader:
     """
-    STL file reader
+    STL file reader. The facets are read into NumPy arrays: distinct vertex positions,
+    vertex indices of each triangle and the facet normals, which are used to construct
+    the TessellatedSolid directly.
 
     :param filename: Input STL filename
     :type filename: str, pathlib.Path
@@ -56,99 +48,128 @@ class Reader:
         self.solidname = solidname
 
         self.worldVolumeName = ""
-        self.facet_list = []
 
         self.scale = float(scale)
 
         # load file
-        with open(self.filename, "rb") as f:
-            data = f.read()
-            # this detection is not good, there might be binary STL files that start with 'solid'.
-            is_binary = forcebinary or struct.unpack("5s", data[0:5])[0] != b"solid"
-            try:
-                self.facet_list = list(
-                    self._load_binary(data) if is_binary else self._load_ascii(data)
+        is_binary = forcebinary or self._isBinary()
+        try:
+            triangles, normals = self._load_binary() if is_binary else self._load_ascii()
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed reading STL file {self.filename}. Either the file is corrupt, uses non-standard "
+                f"extensions, or file type has been detected wrongly. Trying to load a binary file?: {is_binary}"
+                + (
+                    " - binary loading can be forced by setting forcebinary=True"
+                    if not is_binary
+                    else ""
                 )
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed reading STL file {self.filename}. Either the file is corrupt, uses non-standard "
-                    f"extensions, or file type has been detected wrongly. Trying to load a binary file?: {is_binary}"
-                    + (
-                        " - binary loading can be forced by setting forcebinary=True"
-                        if not is_binary
-                        else ""
-                    )
-                ) from e
+            ) from e
+
+        # The scaling here is a bit cheeky, but the scale parameter in
+        # GDML seems to be ignored by Geant4 for Tessellated Solids
+        triangles = self.scale * triangles.astype(_np.float64).reshape(-1, 3)
+        self.normals = self.scale * normals.astype(_np.float64).reshape(-1, 3)
+
+        # vertices are repeated for every facet they belong to, keep each only once
+        self.vertices, index = _meshutils.uniqueVertices(triangles)
+        self.faces = index.reshape(-1, 3).astype(_np.int32)
 
         # centre model if requested
         if centre:
             self.extentCentre()
 
-        self.solid = _g4.solid.TessellatedSolid(
-            self.solidname,
-            self.facet_list,
-            self._registry,
-            _g4.solid.TessellatedSolid.MeshType.Stl,
+        self.solid = _g4.solid.TessellatedSolid.fromArrays(
+            self.solidname, self.vertices, self.faces, self._registry
         )
 
-    def _load_ascii(self, data):
+    def _isBinary(self):
         """
-        Load ASCII STL file from bytes instance
+        An ASCII file starts with 'solid', but so do some binary files, which are recognised
+        by their size matching the facet count in the header.
+        """
+        size = _os.path.getsize(self.filename)
+        with open(self.filename, "rb") as f:
+            header = f.read(84)
+        if not header.startswith(b"solid"):
+            return True
+        return size >= 84 and size == 84 + 50 * int(_np.frombuffer(header[80:84], "<u4")[0])
+
+    def _load_ascii(self):
+        """
+        Load ASCII STL file. The solid lines and keywords are blanked out and the remaining
+        numbers, a normal and three vertices per facet, are parsed in one go.
 
-        :type data: bytes
+        :returns: triangle vertices (M,3,3) and facet normals (M,3)
         """
-        # Compile re to match numbers
-        num_re = _re.compile(r"^[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?$")
-
-        def extractXYZ(string):
-            # The scaling here is a bit cheeky, but the scale parameter in
-            # GDML seems to be ignored by Geant4 for Tessellated Solids
-            return tuple([self.scale * float(v) for v in string.split() if num_re.match(v)])
-
-        f = io.TextIOWrapper(io.BytesIO(data))
-        line = f.readline()
-        facet = None
-        while line:
-            sline = line.strip()
-            if sline.startswith("facet"):  # Indicates a facet, only first char comparison
-                assert facet == None
-                normal = extractXYZ(sline)
-                facet = _Facet(normal)
-
-            elif sline.startswith("vertex"):
-                assert facet != None
-                vertex = extractXYZ(sline)
-                facet.add_vertex(vertex)
-
-            elif sline.startswith("endfacet"):
-                yield facet.dump()
-                facet = None
-
-            line = f.readline()
-
-    def _load_binary(self, data):
+        with open(self.filename, "rb") as f:
+            data = f.read().lower()
+
+        nFacets = data.count(b"endfacet")
+        if data.count(b"vertex") != 3 * nFacets:
+            msg = "only triangular facets are supported"
+            raise ValueError(msg)
+
+        # drop the 'solid name' and 'endsolid name' lines, names are arbitrary
+        pieces = []
+        pos = 0
+        while (i := data.find(b"solid", pos)) != -1:
+            pieces.append(data[pos : data.rfind(b"\n", pos, i) + 1])
+            pos = data.find(b"\n", i)
+            if pos == -1:
+                pos = len(data)
+        pieces.append(data[pos:])
+        data = b" ".join(pieces)
+
+        # blank out the keywords, keeping the e of exponents which follows a digit or point
+        chars = _np.frombuffer(data, dtype=_np.uint8).copy()
+        letter = (chars >= ord("a")) & (chars <= ord("z"))
+        previous = chars[:-1]
+        letter[1:] &= ~(
+            (chars[1:] == ord("e"))
+            & (((previous >= ord("0")) & (previous <= ord("9"))) | (previous == ord(".")))
+        )
+        chars[letter] = ord(" ")
+
+        with _warnings.catch_warnings():
+            # anything left that is not a number stops parsing, which is reported below
+            _warnings.simplefilter("ignore", DeprecationWarning)
+            numbers = _np.fromstring(chars.tobytes(), sep=" ")
+        if numbers.size != 12 * nFacets:
+            msg = f"expected {12 * nFacets} numbers for {nFacets} facets, found {numbers.size}"
+            raise ValueError(msg)
+
+        numbers = numbers.reshape(-1, 4, 3)
+        return numbers[:, 1:], numbers[:, 0]
+
+    def _load_binary(self):
         """
-        Load binary STL file from bytes instance
+        Load binary STL file. The facet records are memory mapped and converted in bulk.
 
-        :type data: bytes
+        :returns: triangle vertices (M,3,3) and facet normals (M,3)
         """
         # ignore the first 80 bytes of data, as this is the header.
-        faces = struct.unpack("<I", data[80:84])[0]
-
-        def extractVector(d):
-            vec = struct.unpack("<fff", d)
-            return tuple([self.scale * v for v in vec])
-
-        for fc in range(faces):
-            fo = 84 + fc * 50  # offset of the current facet
-            facet = _Facet(extractVector(data[fo : fo + 12]))
-            for v in range(1, 4):
-                vo = fo + v * 12
-                facet.add_vertex(extractVector(data[vo : vo + 12]))
-            # ignore last 2 bytes of facet definition - this might break if the additional byte count
-            # _actually_ refers to an additional byte count, but it not always does (some application
-            # directly store metadata in those two bytes).
-            yield facet.dump()
+        with open(self.filename, "rb") as f:
+            f.seek(80)
+            nFacets = int(_np.frombuffer(f.read(4), "<u4")[0])
+
+        if nFacets == 0:
+            return _np.zeros((0, 3, 3)), _np.zeros((0, 3))
+
+        # the attribute byte count is ignored - some applications directly store metadata in it
+        facets = _np.memmap(self.filename, dtype=_binaryFacet, mode="r", offset=84, shape=nFacets)
+        try:
+            return _np.array(facets["vertices"]), _np.array(facets["normal"])
+        finally:
+            del facets
+
+    @property
+    def facet_list(self):
+        """
+        Facets as a list of ((v1, v2, v3), normal) tuples.
+        """
+        triangles = self.vertices[self.faces].tolist()
+        return [(tuple(map(tuple, t)), tuple(n)) for t, n in zip(triangles, self.normals.tolist())]
 
     def extent(self):
         """
@@ -158,30 +179,7 @@ class Reader:
         :rtype: [[xmin,ymin,zmin],[xmax, ymax, zmax]]
         """
 
-        xmin = 1e9
-        ymin = 1e9
-        zmin = 1e9
-        xmax = -1e9
-        ymax = -1e9
-        zmax = -1e9
-
-        for f in self.facet_list:
-            for v in f[0]:
-                if v[0] < xmin:
-                    xmin = v[0]
-                if v[1] < ymin:
-                    ymin = v[1]
-                if v[2] < zmin:
-                    zmin = v[2]
-
-                if v[0] > xmax:
-                    xmax = v[0]
-                if v[1] > ymax:
-                    ymax = v[1]
-                if v[2] > zmax:
-                    zmax = v[2]
-
-        return [[xmin, ymin, zmin], [xmax, ymax, zmax]]
+        return [self.vertices.min(axis=0).tolist(), self.vertices.max(axis=0).tolist()]
 
     def extentCentre(self):
         """
@@ -189,7 +187,6 @@ class Reader:
         """
 
         e = _np.array(self.extent())
-        de = e[1] - e[0]
         c = (e[1] + e[0]) / 2.0
         self.translate(-c)
 
@@ -202,18 +199,7 @@ class Reader:
 
         """
 
-        facet_list = []
-
-        for f in self.facet_list:
-            vl = []
-            n = f[1]
-            for v in f[0]:
-                vt = list(_np.array(v) + _np.array(translation))
-                vl.append(vt)
-
-            facet_list.append([vl, n])
-
-        self.facet_list = facet_list
+        self.vertices = self.vertices + _np.asarray(translation, dtype=_np.float64)
 
     def getSolid(self):
         """
@@ -173,6 +173,92 @@ def matrix2tbxyz(matrix):
     return [x, y, z]
 
 
+def matrix2rotationScale(matrix, tolerance=1e-6):
+    """
+    Split transformation matrices into a rotation followed by a scaling along the local
+    axes, i.e. matrix = rotation @ diag(scale). A reflection is carried by a negative scale.
+
+    :param matrix: 3x3 matrix or array of them
+    :type matrix: array(3,3) or array(N,3,3)
+    :param tolerance: maximum deviation of rotation.T @ rotation from the identity
+    :type tolerance: float
+    :returns: (rotation, scale, valid) arrays of shape (...,3,3), (...,3) and (...), valid is false for matrices that are not of this form (shear)
+    """
+    m = _np.asarray(matrix, dtype=float)
+    scale = _np.linalg.norm(m, axis=-2)
+    scale = _np.where(scale == 0, 1.0, scale)
+    rotation = m / scale[..., None, :]
+
+    reflected = _np.linalg.det(rotation) < 0
+    scale[..., 0] = _np.where(reflected, -scale[..., 0], scale[..., 0])
+    rotation[..., :, 0] = _np.where(reflected[..., None], -rotation[..., :, 0], rotation[..., :, 0])
+
+    deviation = _np.swapaxes(rotation, -1, -2) @ rotation - _np.eye(3)
+    valid = _np.all(_np.abs(deviation) <= tolerance, axis=(-2, -1))
+    return rotation, scale, valid
+
+
+def matrix2quaternion(matrix):
+    """
+    Convert rotation matrices to unit quaternions.
+
+    :param matrix: 3x3 rotation matrix or array of them
+    :type matrix: array(3,3) or array(N,3,3)
+    :returns: quaternions (w, x, y, z) with w >= 0
+    :rtype: array(4) or array(N,4)
+    """
+    m = _np.asarray(matrix, dtype=float)
+    trace = m[..., 0, 0] + m[..., 1, 1] + m[..., 2, 2]
+
+    # row k is 4 q_k (w, x, y, z), the row with the largest q_k is the best conditioned
+    rows = _np.stack(
+        [
+            _np.stack(
+                [
+                    1 + trace,
+                    m[..., 2, 1] - m[..., 1, 2],
+                    m[..., 0, 2] - m[..., 2, 0],
+                    m[..., 1, 0] - m[..., 0, 1],
+                ],
+                axis=-1,
+            ),
+            _np.stack(
+                [
+                    m[..., 2, 1] - m[..., 1, 2],
+                    1 + 2 * m[..., 0, 0] - trace,
+                    m[..., 0, 1] + m[..., 1, 0],
+                    m[..., 0, 2] + m[..., 2, 0],
+                ],
+                axis=-1,
+            ),
+            _np.stack(
+                [
+                    m[..., 0, 2] - m[..., 2, 0],
+                    m[..., 0, 1] + m[..., 1, 0],
+                    1 + 2 * m[..., 1, 1] - trace,
+                    m[..., 1, 2] + m[..., 2, 1],
+                ],
+                axis=-1,
+            ),
+            _np.stack(
+                [
+                    m[..., 1, 0] - m[..., 0, 1],
+                    m[..., 0, 2] + m[..., 2, 0],
+                    m[..., 1, 2] + m[..., 2, 1],
+                    1 + 2 * m[..., 2, 2] - trace,
+                ],
+                axis=-1,
+            ),
+        ],
+        axis=-2,
+    )
+    diagonal = _np.stack([rows[..., k, k] for k in range(4)], axis=-1)
+    best = _np.argmax(diagonal, axis=-1)
+    q = _np.take_along_axis(rows, best[..., None, None], axis=-2)[..., 0, :]
+    q = q / _np.linalg.norm(q, axis=-1, keepdims=True)
+    return _np.where(q[..., :1] < 0, -q, q)
+
+
 def axisangle2tbxyz(axis, angle):
     """
     Convert axis and angle to tait bryan angles
@@ -1,4 +1,5 @@
 import vtk as _vtk
+import vtk.util.numpy_support as _numpy_support
 import copy as _copy
 import numpy as _np
 
@@ -16,20 +17,19 @@ def pycsgMeshToVtkPolyData(mesh):
     # refine mesh
     # mesh.refine()
 
-    verts, cells, count = mesh.toVerticesAndPolygons()
+    verts, cells = mesh.toArrays()
+    count = len(cells)
     meshPolyData = _vtk.vtkPolyData()
     points = _vtk.vtkPoints()
     polys = _vtk.vtkCellArray()
-    scalars = _vtk.vtkFloatArray()
 
-    for v in verts:
-        points.InsertNextPoint(v)
+    points.SetData(_numpy_support.numpy_to_vtk(verts, deep=True))
 
-    for p in cells:
-        polys.InsertNextCell(mkVtkIdList(p))
+    # legacy cell array layout [3, i, j, k, 3, ...]
+    cellArray = _np.hstack([_np.full((count, 1), 3, dtype=_np.int64), cells]).ravel()
+    polys.SetCells(count, _numpy_support.numpy_to_vtkIdTypeArray(cellArray, deep=True))
 
-    for i in range(count):
-        scalars.InsertTuple1(i, 1)
+    scalars = _numpy_support.numpy_to_vtk(_np.ones(count, dtype=_np.float32), deep=True)
 
     meshPolyData.SetPoints(points)
     meshPolyData.SetPolys(polys)
@@ -1,7 +1,9 @@
 import copy as _copy
+from collections.abc import Sequence as _Sequence
 
 from .. import config as _config
 from .. import exceptions
+from .MeshCache import cachedMesh as _cachedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ..pycsg.core import CSG as _CSG
@@ -22,15 +24,15 @@ class OverlapType:
 
 
 class Mesh:
-    def __init__(self, solid):
+    def __init__(self, solid, localmesh=None):
         parameters = []
         values = {}
 
         # solid which contains the mesh
         self.solid = solid
 
-        # mesh in local coordinates
-        self.localmesh = self.solid.mesh()
+        # mesh in local coordinates (unless already meshed elsewhere, e.g. in another process)
+        self.localmesh = localmesh if localmesh is not None else _cachedMesh(self.solid)
 
         # bounding mesh in local coordinates
         self.localboundingmesh = self.getBoundingBoxMesh()
@@ -43,7 +45,7 @@ class Mesh:
         self.overlapmeshes = []
 
         # recreate mesh
-        self.localmesh = self.solid.mesh().clone()
+        self.localmesh = _cachedMesh(self.solid).clone()
 
         # recreate bounding mesh
         self.localboundingmesh = self.getBoundingBoxMesh()
@@ -66,29 +68,77 @@ class Mesh:
         return _getBoundingBoxMesh(bb)
 
 
+class LazyMeshList(_Sequence):
+    """
+    Meshes of the copies of a replica, division or parameterised volume. A mesh is only
+    generated when it is first accessed, and copies whose solids have identical evaluated
+    parameters (SolidBase.meshKey), i.e. differ only by their transform, share one Mesh.
+
+    :param sources: for each copy a solid, a Mesh (used as it is) or a function without arguments returning either, called on first access
+    :type sources: list
+
+    An item is None if its source is or returns None, e.g. the mesh of a logical volume
+    made with config.doMeshing False, and is looked up again on the next access.
+    """
+
+    def __init__(self, sources):
+        self.sources = list(sources)
+        self._meshes = [None] * len(self.sources)
+        self._shared = {}  # solid meshKey : Mesh
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        mesh = self._meshes[index]
+        if mesh is None:
+            source = self.sources[index]
+            if callable(source):
+                source = source()
+            if source is None:
+                return None
+            if isinstance(source, Mesh):
+                mesh = source
+            else:
+                key = source.meshKey()
+                mesh = self._shared.get(key) if key is not None else None
+                if mesh is None:
+                    mesh = Mesh(source)
+                    if key is not None:
+                        self._shared[key] = mesh
+            self._meshes[index] = mesh
+        return mesh
+
+    def nDistinctMeshes(self):
+        """Number of distinct meshes generated so far."""
+        return len({id(m) for m in self._meshes if m is not None})
+
+
 def _getBoundingBox(aMesh, rotationMatrix=None, translation=None, nameForError=""):
     """
     Axes aligned bounding box. Can also provide a rotation and
     a translation (applied in that order) to the vertices.
     """
-    vertices, _, _ = aMesh.toVerticesAndPolygons()
-    if not vertices:
+    if aMesh.vertexCount() == 0:
         _log.warning("getBoundingBox null mesh error : %s", nameForError)
         if _config.meshingNullException:
             raise exceptions.NullMeshError(nameForError)
         else:
             return [[-1e-9, -1e-9, -1e-9], [1e9, 1e9, 1e9]]
-    vertices = _np.vstack(vertices)
-
-    if rotationMatrix is not None:
-        vertices = rotationMatrix.dot(vertices.T).T
-    if translation is not None:
-        vertices[..., 0] += translation[0]
-        vertices[..., 1] += translation[1]
-        vertices[..., 2] += translation[2]
 
-    vMin = [min(vertices[..., 0]), min(vertices[..., 1]), min(vertices[..., 2])]
-    vMax = [max(vertices[..., 0]), max(vertices[..., 1]), max(vertices[..., 2])]
+    if rotationMatrix is None and translation is None:
+        vMin, vMax = aMesh.bbox().tolist()
+    else:
+        vertices = aMesh.toArrays()[0]
+        if rotationMatrix is not None:
+            vertices = vertices @ _np.asarray(rotationMatrix).T
+        if translation is not None:
+            vertices = vertices + _np.array([translation[0], translation[1], translation[2]])
+        vMin = vertices.min(axis=0).tolist()
+        vMax = vertices.max(axis=0).tolist()
 
     _log.debug("visualisation.Mesh.getBoundingBox> %s %s", vMin, vMax)
 
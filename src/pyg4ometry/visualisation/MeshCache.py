@@ -0,0 +1,163 @@
+"""
+Optional on-disk cache of solid meshes. Meshes are stored as vertex and face arrays in
+.npz files named by SolidBase.meshKey, a content hash of everything that determines the
+mesh, so unchanged solids are not meshed again when the same geometry is reloaded. The
+total size of the cache is bounded by evicting the least recently used files.
+
+The cache is disabled by default and enabled by setting pyg4ometry.config.meshCacheDirectory.
+"""
+
+from .. import config as _config
+
+if _config.meshing == _config.meshingType.pycsg:
+    from ..pycsg.core import CSG as _CSG
+elif _config.meshing == _config.meshingType.cgal_sm:
+    from ..pycgal.core import CSG as _CSG
+
+import logging as _logging
+import numpy as _np
+import os as _os
+import pathlib as _pathlib
+import tempfile as _tempfile
+
+_log = _logging.getLogger(__name__)
+
+
+def _meshToArrays(mesh):
+    """
+    Convert a mesh to float64 (N,3) vertices, flat int64 face vertex indices and the
+    offset of each face in that array.
+    """
+    vertices, triangles = mesh.toArrays()
+    offsets = _np.arange(0, triangles.size + 1, 3, dtype=_np.int64)
+    return vertices, triangles.reshape(-1), offsets
+
+
+def _cacheFiles(directory):
+    return list(_pathlib.Path(directory).glob("*.npz"))
+
+
+# running total size in bytes of the cache directories written to by this process and
+# the number of writes since the directory was last scanned
+_cacheSizes = {}
+
+# the directory is scanned again after this many writes, to account for other processes
+_rescanInterval = 1000
+
+# eviction frees space down to this fraction of the maximum size, so a full cache is not
+# scanned on every write
+_evictFraction = 0.9
+
+
+def _evict(directory, maxSize):
+    """
+    Remove the least recently used meshes until the cache is no bigger than maxSize bytes.
+    Returns the remaining size of the cache.
+    """
+    files = []
+    for f in _cacheFiles(directory):
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue  # removed by another process
+        files.append((st.st_mtime, st.st_size, f))
+
+    totalSize = sum(f[1] for f in files)
+    if totalSize <= maxSize:
+        return totalSize
+
+    for _, size, f in sorted(files, key=lambda x: x[0]):
+        if totalSize <= maxSize:
+            break
+        try:
+            f.unlink()
+        except FileNotFoundError:
+            pass
+        totalSize -= size
+        _log.debug("MeshCache> evicted %s", f.name)
+    return totalSize
+
+
+def _recordWrite(directory, size, maxSize):
+    """
+    Add a newly written file of size bytes to the running size of the cache and evict
+    when that goes over maxSize. The directory is only scanned on the first write, every
+    _rescanInterval writes and when evicting.
+    """
+    key = str(directory)
+    totalSize, nWrites = _cacheSizes.get(key, (None, 0))
+    if totalSize is None or nWrites >= _rescanInterval:
+        totalSize = _evict(directory, maxSize)
+        nWrites = 0
+    else:
+        totalSize += size
+        nWrites += 1
+
+    if totalSize > maxSize:
+        totalSize = _evict(directory, _evictFraction * maxSize)
+        nWrites = 0
+    _cacheSizes[key] = (totalSize, nWrites)
+
+
+def cachedMesh(solid):
+    """
+    Return solid.mesh(), loaded from the mesh cache if enabled and present, otherwise
+    meshed and stored in the cache.
+
+    :param solid: solid to mesh
+    :type solid: pyg4ometry.geant4.solid.SolidBase
+    """
+    directory = _config.meshCacheDirectory
+    if directory is None:
+        return solid.mesh()
+
+    directory = _pathlib.Path(directory)
+    key = solid.meshKey()
+    if key is None:
+        return solid.mesh()  # no deterministic key, e.g. a parameter that cannot be evaluated
+    fileName = directory / (key + ".npz")
+
+    try:
+        with _np.load(fileName) as data:
+            mesh = _CSG.fromArrays(data["vertices"], data["faces"], data["offsets"])
+        _os.utime(fileName)  # mark as recently used
+        _log.debug("MeshCache> hit %s %s", solid.name, key)
+        return mesh
+    except FileNotFoundError:
+        pass
+    except (OSError, KeyError, ValueError):
+        _log.warning("MeshCache> unreadable cache entry %s - remeshing", fileName)
+
+    mesh = solid.mesh()
+    _log.debug("MeshCache> miss %s %s", solid.name, key)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    vertices, faces, offsets = _meshToArrays(mesh)
+
+    # write to a temporary file first so concurrent readers never see a partial entry
+    fd, tmpName = _tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with _os.fdopen(fd, "wb") as f:
+            _np.savez(f, vertices=vertices, faces=faces, offsets=offsets)
+        _os.replace(tmpName, fileName)
+        size = fileName.stat().st_size
+    except OSError:
+        _log.warning("MeshCache> could not write %s", fileName)
+        if _os.path.exists(tmpName):
+            _os.remove(tmpName)
+        return mesh
+
+    _recordWrite(directory, size, _config.meshCacheMaxSize)
+    return mesh
+
+
+def clearMeshCache(directory=None):
+    """
+    Remove all meshes from the cache directory (default pyg4ometry.config.meshCacheDirectory).
+    """
+    directory = directory if directory is not None else _config.meshCacheDirectory
+    if directory is None:
+        return
+    for f in _cacheFiles(directory):
+        f.unlink()
+    _cacheSizes.pop(str(_pathlib.Path(directory)), None)
@@ -0,0 +1,304 @@
+import json as _json
+import logging as _logging
+
+import numpy as _np
+
+from .. import meshutils as _meshutils
+from .ViewerBase import ViewerBase as _ViewerBase
+
+_log = _logging.getLogger(__name__)
+
+
+def sectionPlaneAxes(normal):
+    """
+    Orthonormal in-plane axes (u,v) used for 2D section coordinates. They are the two
+    coordinate axes least aligned with the normal, in x,y,z order, made perpendicular to
+    it, so normal x gives (y,z), y gives (x,z) and z gives (x,y) as in
+    VtkViewer.exportCutterSection.
+
+    :param normal: plane normal
+    :type normal: array_like (3)
+    returns: (u, v) float arrays (3)
+    """
+    normal = _np.asarray(normal, dtype=float)
+    normal = normal / _np.linalg.norm(normal)
+    a, b = (i for i in range(3) if i != int(_np.argmax(_np.abs(normal))))
+    u = _np.eye(3)[a] - normal[a] * normal
+    u /= _np.linalg.norm(u)
+    v = _np.eye(3)[b] - normal[b] * normal - u[b] * u
+    v /= _np.linalg.norm(v)
+    return u, v
+
+
+class PlaneSection:
+    """
+    Section of the placed geometry by one plane. All polylines are stored in flat
+    arrays: the points of polyline i are points[offsets[i]:offsets[i+1]] and it belongs
+    to the mesh meshNames[lineMesh[i]] placed as instanceNames[lineInstance[i]]. Closed
+    polylines repeat their first point at the end.
+
+    :param origin: point on the plane
+    :type origin: array_like (3)
+    :param normal: unit plane normal
+    :type normal: array_like (3)
+    """
+
+    def __init__(self, origin, normal):
+        self.origin = _np.asarray(origin, dtype=float)
+        self.normal = _np.asarray(normal, dtype=float)
+        self.u, self.v = sectionPlaneAxes(self.normal)
+        self.points = _np.empty((0, 3))
+        self.offsets = _np.zeros(1, dtype=_np.int64)
+        self.lineMesh = _np.zeros(0, dtype=_np.int64)
+        self.lineInstance = _np.zeros(0, dtype=_np.int64)
+        self.meshNames = []
+        self.instanceNames = []
+
+    def __repr__(self):
+        return (
+            f"PlaneSection : origin={self.origin.tolist()} normal={self.normal.tolist()} "
+            f"{len(self)} polylines"
+        )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def polyline(self, i):
+        return self.points[self.offsets[i] : self.offsets[i + 1]]
+
+    def polylines(self, meshName=None):
+        """
+        List of (meshName, instanceName, points (K,3)), optionally only of one mesh.
+        """
+        return [
+            (
+                self.meshNames[self.lineMesh[i]],
+                self.instanceNames[self.lineInstance[i]],
+                self.polyline(i),
+            )
+            for i in range(len(self))
+            if meshName is None or self.meshNames[self.lineMesh[i]] == meshName
+        ]
+
+    def points2d(self, scaling=1.0):
+        """
+        Points in the plane coordinates (u,v) relative to the origin as a (K,2) array.
+        """
+        return scaling * (self.points - self.origin) @ _np.stack([self.u, self.v], axis=1)
+
+    def plot(self, axes=None, color="k", **kwargs):
+        """
+        Draw the section in 2D plane coordinates with matplotlib.
+        """
+        import matplotlib.pyplot as _plt
+
+        if axes is None:
+            axes = _plt.gca()
+        p2 = self.points2d()
+        for i in range(len(self)):
+            line = p2[self.offsets[i] : self.offsets[i + 1]]
+            axes.plot(line[:, 0], line[:, 1], color=color, **kwargs)
+        return axes
+
+    def toDict(self, scaling=1.0):
+        p2 = self.points2d(scaling)
+        return {
+            "origin": self.origin.tolist(),
+            "normal": self.normal.tolist(),
+            "u": self.u.tolist(),
+            "v": self.v.tolist(),
+            "polylines": [
+                {
+                    "mesh": self.meshNames[self.lineMesh[i]],
+                    "instance": self.instanceNames[self.lineInstance[i]],
+                    "points": p2[self.offsets[i] : self.offsets[i + 1]].tolist(),
+                }
+                for i in range(len(self))
+            ],
+        }
+
+
+def writeSections(fileName, sections, scaling=1.0):
+    """
+    Write plane sections to a .json file (2D plane coordinates per polyline) or to a
+    compressed .npz file with the polylines of all planes in flat arrays: points (K,2),
+    lineOffsets (L+1), linePlane, lineMesh and lineInstance (L), the plane origins,
+    normals, u and v axes (P,3) and the meshNames and instanceNames.
+
+    :param fileName: output file name, ending in .json or .npz
+    :type fileName: str
+    :param sections: sections, e.g. from SectionExporter.section
+    :type sections: list of PlaneSection
+    :param scaling: multiplier for all section coordinates
+    :type scaling: float
+    """
+    fileName = str(fileName)
+    if fileName.endswith(".json"):
+        with open(fileName, "w") as f:
+            _json.dump({"planes": [s.toDict(scaling) for s in sections]}, f)
+    elif fileName.endswith(".npz"):
+        meshNames = sorted({n for s in sections for n in s.meshNames})
+        instanceNames = sorted({n for s in sections for n in s.instanceNames})
+        meshIndex = {n: i for i, n in enumerate(meshNames)}
+        instanceIndex = {n: i for i, n in enumerate(instanceNames)}
+
+        def remap(names, index, lookup):
+            table = _np.array([lookup[n] for n in names] or [0], dtype=_np.int64)
+            return table[index]
+
+        pointCounts = [len(s.points) for s in sections]
+        lineOffsets = [0]
+        for s, start in zip(sections, _np.cumsum([0, *pointCounts[:-1]])):
+            lineOffsets.extend((s.offsets[1:] + start).tolist())
+
+        _np.savez_compressed(
+            fileName,
+            points=_np.concatenate([s.points2d(scaling) for s in sections] or [_np.empty((0, 2))]),
+            lineOffsets=_np.array(lineOffsets, dtype=_np.int64),
+            linePlane=_np.repeat(_np.arange(len(sections)), [len(s) for s in sections]),
+            lineMesh=_np.concatenate(
+                [remap(s.meshNames, s.lineMesh, meshIndex) for s in sections]
+                or [_np.zeros(0, dtype=_np.int64)]
+            ),
+            lineInstance=_np.concatenate(
+                [remap(s.instanceNames, s.lineInstance, instanceIndex) for s in sections]
+                or [_np.zeros(0, dtype=_np.int64)]
+            ),
+            origins=_np.array([s.origin * scaling for s in sections]).reshape(-1, 3),
+            normals=_np.array([s.normal for s in sections]).reshape(-1, 3),
+            u=_np.array([s.u for s in sections]).reshape(-1, 3),
+            v=_np.array([s.v for s in sections]).reshape(-1, 3),
+            meshNames=_np.array(meshNames, dtype=str),
+            instanceNames=_np.array(instanceNames, dtype=str),
+        )
+    else:
+        msg = f"Unknown section file extension for {fileName}, use .json or .npz"
+        raise ValueError(msg)
+
+
+class SectionExporter(_ViewerBase):
+    """
+    Plane sections of placed geometry computed with NumPy, without building any VTK
+    pipeline. Geometry is added as for the other viewers; each distinct mesh is
+    converted to arrays once and only instances whose bounding box straddles a plane
+    are intersected.
+
+    Example:
+
+    >>> s = SectionExporter()
+    >>> s.addLogicalVolume(reg.getWorldVolume())
+    >>> z = np.linspace(-1000, 1000, 201)
+    >>> sections = s.section(np.outer(z, [0, 0, 1]), [0, 0, 1])
+    >>> writeSections("xy-sections.npz", sections)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._meshArrays = {}
+
+    def clear(self):
+        super().clear()
+        self._meshArrays = {}
+
+    def meshArrays(self, name):
+        """
+        Vertices (N,3), triangles (M,3) and bounding box corners (8,3) of mesh name.
+        """
+        if name not in self._meshArrays:
+            vertices, triangles = self.localmeshes[name].toArrays()
+            vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+            triangles = _np.asarray(triangles, dtype=_np.int64).reshape(-1, 3)
+            if len(triangles) == 0:
+                corners = _np.empty((0, 3))
+            else:
+                lo, hi = vertices.min(axis=0), vertices.max(axis=0)
+                corners = _np.array([[(lo, hi)[i >> k & 1][k] for k in range(3)] for i in range(8)])
+            self._meshArrays[name] = (vertices, triangles, corners)
+        return self._meshArrays[name]
+
+    def section(self, origins, normals, decimals=9):
+        """
+        Cut all instances with one or more planes.
+
+        :param origins: a point on each plane
+        :type origins: array_like (3) or (P,3)
+        :param normals: normal of each plane
+        :type normals: array_like (3) or (P,3)
+        :param decimals: rounding used to join segment end points into polylines
+        :type decimals: int
+        returns: list of PlaneSection, one per plane
+        """
+        origins = _np.asarray(origins, dtype=float).reshape(-1, 3)
+        normals = _np.asarray(normals, dtype=float).reshape(-1, 3)
+        origins, normals = _np.broadcast_arrays(origins, normals)
+        normals = normals / _np.linalg.norm(normals, axis=1)[:, None]
+        offsets = _np.sum(origins * normals, axis=1)
+        nPlanes = len(normals)
+
+        # per plane: points, polyline lengths, mesh and instance name of every polyline
+        collected = [([], [], [], []) for _ in range(nPlanes)]
+
+        for name, placements in self.instancePlacements.items():
+            if name not in self.localmeshes:
+                continue
+            vertices, triangles, corners = self.meshArrays(name)
+            if len(triangles) == 0:
+                continue
+
+            matrices = _np.array(
+                [_np.asarray(p["transformation"], dtype=float) for p in placements]
+            )
+            translations = _np.array(
+                [_np.asarray(p["translation"], dtype=float).reshape(3) for p in placements]
+            )
+
+            # bounding box corners of every instance against every plane
+            worldCorners = _np.einsum("ijk,ck->icj", matrices, corners) + translations[:, None, :]
+            cornerDistance = worldCorners @ normals.T - offsets
+            straddles = (cornerDistance.min(axis=1) < 0) & (cornerDistance.max(axis=1) >= 0)
+
+            for i in _np.flatnonzero(straddles.any(axis=1)):
+                planes = _np.flatnonzero(straddles[i])
+                worldVertices = vertices @ matrices[i].T + translations[i]
+                segments = _meshutils.planeSection(
+                    worldVertices, triangles, origins[planes], normals[planes]
+                )
+                for p, planeSegments in zip(planes, segments):
+                    for line in _meshutils.stitchSegments(planeSegments, decimals):
+                        points, lengths, meshes, instances = collected[p]
+                        points.append(line)
+                        lengths.append(len(line))
+                        meshes.append(name)
+                        instances.append(placements[i]["name"])
+
+        sections = []
+        for p in range(nPlanes):
+            points, lengths, meshes, instances = collected[p]
+            section = PlaneSection(origins[p], normals[p])
+            if points:
+                section.points = _np.concatenate(points)
+                section.offsets = _np.concatenate([[0], _np.cumsum(lengths)]).astype(_np.int64)
+                section.meshNames = list(dict.fromkeys(meshes))
+                section.instanceNames = list(dict.fromkeys(instances))
+                meshIndex = {n: j for j, n in enumerate(section.meshNames)}
+                instanceIndex = {n: j for j, n in enumerate(section.instanceNames)}
+                section.lineMesh = _np.array([meshIndex[n] for n in meshes], dtype=_np.int64)
+                section.lineInstance = _np.array(
+                    [instanceIndex[n] for n in instances], dtype=_np.int64
+                )
+            sections.append(section)
+
+        _log.debug(
+            "SectionExporter.section> %d planes %d polylines",
+            nPlanes,
+            sum(len(s) for s in sections),
+        )
+        return sections
+
+    def exportSections(self, fileName, origins, normals, scaling=1.0):
+        """
+        Cut all instances with the planes and write the sections, see writeSections.
+        """
+        sections = self.section(origins, normals)
+        writeSections(fileName, sections, scaling)
+        return sections
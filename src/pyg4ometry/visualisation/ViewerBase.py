@@ -1,5 +1,7 @@
 import base64 as _base64
 import copy as _copy
+import json as _json
+import struct as _struct
 import numpy as _np
 import random as _random
 import logging as _log
@@ -38,6 +40,82 @@ def _daughterSubtractedMesh(lv):
     return mm
 
 
+_GLTF_ARRAY_BUFFER = 34962
+_GLTF_ELEMENT_ARRAY_BUFFER = 34963
+_gltfComponentTypes = {
+    _np.dtype(_np.int16): 5122,
+    _np.dtype(_np.uint16): 5123,
+    _np.dtype(_np.uint32): 5125,
+    _np.dtype(_np.float32): 5126,
+}
+_gltfTypes = {1: "SCALAR", 3: "VEC3", 4: "VEC4"}
+
+
+class _GlbBuilder:
+    """
+    Binary buffer, buffer views and accessors of a glb file, filled from NumPy arrays.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.byteLength = 0
+        self.bufferViews = []
+        self.accessors = []
+
+    def addAccessor(self, array, components=None, target=None, normalized=False, bounds=False):
+        """
+        Append a 2D array as one buffer view and accessor and return the accessor index.
+        Only the first components columns are accessed, further columns are padding so
+        that each element starts on a 4 byte boundary.
+        """
+        array = _np.ascontiguousarray(array)
+        array = array.reshape(len(array), -1)
+        if components is None:
+            components = array.shape[1]
+        data = array.tobytes()
+
+        view = {"buffer": 0, "byteOffset": self.byteLength, "byteLength": len(data)}
+        if target is not None:
+            view["target"] = target
+        if components != array.shape[1]:
+            view["byteStride"] = array.shape[1] * array.itemsize
+        self.bufferViews.append(view)
+
+        self.chunks.append(data + b"\0" * (-len(data) % 4))
+        self.byteLength += len(data) + (-len(data) % 4)
+
+        accessor = {
+            "bufferView": len(self.bufferViews) - 1,
+            "componentType": _gltfComponentTypes[array.dtype],
+            "count": len(array),
+            "type": _gltfTypes[components],
+        }
+        if normalized:
+            accessor["normalized"] = True
+        if bounds:
+            accessor["min"] = array[:, :components].min(axis=0).tolist()
+            accessor["max"] = array[:, :components].max(axis=0).tolist()
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def write(self, fileName, gltf):
+        gltf["buffers"] = [{"byteLength": self.byteLength}]
+        gltf["bufferViews"] = self.bufferViews
+        gltf["accessors"] = self.accessors
+
+        jsonChunk = _json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+        jsonChunk += b" " * (-len(jsonChunk) % 4)
+        length = 12 + 8 + len(jsonChunk) + 8 + self.byteLength
+
+        with open(fileName, "wb") as f:
+            f.write(_struct.pack("<4sII", b"glTF", 2, length))
+            f.write(_struct.pack("<II", len(jsonChunk), 0x4E4F534A))
+            f.write(jsonChunk)
+            f.write(_struct.pack("<II", self.byteLength, 0x004E4942))
+            for chunk in self.chunks:
+                f.write(chunk)
+
+
 class ViewerBase:
     """
     Base class for all viewers and exporters. Handles unique meshes and their instances
@@ -235,7 +313,7 @@ class ViewerBase:
         icount = 0
         for k in fluka_registry.regionDict:
             _log.debug("ViewerBase.addFlukaRegions> %s", k)
-            m = fluka_registry.regionDict[k].mesh()
+            m = fluka_registry.regionDict[k].mesh(flukaregistry=fluka_registry)
 
             if m is not None:
                 self.addMesh(k, m)
@@ -457,16 +535,10 @@ class ViewerBase:
             csg = self.localmeshes[k]
 
             scale = 1 - 0.001 * self.instanceVisOptions[k][0].depth
-            csg.scale([scale, scale, scale])
-
-            inf = csg.info()
 
-            vAndPs = csg.toVerticesAndPolygons()
-            verts = vAndPs[0]
-            tris = vAndPs[1]
-
-            verts = _np.array(verts).astype(_np.float32)
-            tris = _np.array(tris).astype(_np.uint32)
+            verts, tris = csg.toArrays()
+            verts = (scale * _np.asarray(verts).reshape(-1, 3)).astype(_np.float32)
+            tris = _np.asarray(tris).astype(_np.uint32)
 
             verts_binary_blob = verts.flatten().tobytes()
             tris_binary_blob = tris.flatten().tobytes()
@@ -609,6 +681,185 @@ class ViewerBase:
         else:
             _log.error("ViewerBase::exportGLTFScene> unknown gltf extension")
 
+    def exportGLB(
+        self,
+        glbFileName="scene.glb",
+        instancing=True,
+        minInstances=2,
+        quantise=False,
+        scale=1.0,
+        instanceNames=True,
+    ):
+        """
+        Export the scene as a binary glTF file written directly from NumPy arrays, without
+        pygltflib and without modifying the meshes. Each mesh is stored once; its
+        placements become a single node with the EXT_mesh_gpu_instancing extension, or one
+        node each for meshes placed fewer than minInstances times. The colour and alpha of
+        the first visualisation options of a mesh give its material.
+
+        :param glbFileName: output file name
+        :type glbFileName: str
+        :param instancing: use EXT_mesh_gpu_instancing for repeated placements
+        :type instancing: bool
+        :param minInstances: least number of placements of a mesh to be instanced
+        :type minInstances: int
+        :param quantise: store vertex positions as normalised 16 bit integers (KHR_mesh_quantization), the dequantisation is folded into the node and instance transforms
+        :type quantise: bool
+        :param scale: multiplier for all coordinates, e.g. 1e-3 for metres
+        :type scale: float
+        :param instanceNames: list the placement names of instanced nodes in the node extras
+        :type instanceNames: bool
+        """
+        glb = _GlbBuilder()
+        materials = []
+        materialIndex = {}
+        meshes = []
+        nodes = []
+
+        for k, placements in self.instancePlacements.items():
+            if k not in self.localmeshes or len(placements) == 0:
+                continue
+            vertices, triangles = self.localmeshes[k].toArrays()
+            vertices = _np.asarray(vertices, dtype=float).reshape(-1, 3)
+            triangles = _np.asarray(triangles).reshape(-1, 3)
+            if len(triangles) == 0:
+                continue
+
+            # material
+            visOptions = self.instanceVisOptions[k][0]
+            colour = [float(c) for c in visOptions.colour[:3]]
+            alpha = float(visOptions.alpha)
+            key = (*colour, alpha)
+            if key not in materialIndex:
+                material = {
+                    "pbrMetallicRoughness": {
+                        "baseColorFactor": [*colour, alpha],
+                        "metallicFactor": 0.1,
+                        "roughnessFactor": 0.7,
+                    }
+                }
+                if alpha < 1:
+                    material["alphaMode"] = "BLEND"
+                materialIndex[key] = len(materials)
+                materials.append(material)
+
+            # positions, dequantised as offset + quantScale * stored value
+            if quantise:
+                lo, hi = vertices.min(axis=0), vertices.max(axis=0)
+                offset = 0.5 * (lo + hi)
+                half = 0.5 * (hi - lo)
+                half[half == 0] = 1.0
+                quantScale = half / 32767
+                positions = _np.zeros((len(vertices), 4), dtype=_np.int16)
+                positions[:, :3] = _np.round((vertices - offset) / quantScale)
+                position = glb.addAccessor(
+                    positions, 3, _GLTF_ARRAY_BUFFER, normalized=True, bounds=True
+                )
+                # normalised shorts are read as value / 32767
+                quantScale = half
+            else:
+                offset = _np.zeros(3)
+                quantScale = _np.ones(3)
+                position = glb.addAccessor(
+                    vertices.astype(_np.float32), target=_GLTF_ARRAY_BUFFER, bounds=True
+                )
+
+            indexType = _np.uint16 if len(vertices) <= 65535 else _np.uint32
+            indices = glb.addAccessor(
+                triangles.astype(indexType).reshape(-1, 1), target=_GLTF_ELEMENT_ARRAY_BUFFER
+            )
+            meshes.append(
+                {
+                    "name": k,
+                    "primitives": [
+                        {
+                            "attributes": {"POSITION": position},
+                            "indices": indices,
+                            "material": materialIndex[key],
+                        }
+                    ],
+                }
+            )
+            iMesh = len(meshes) - 1
+
+            # world = matrix @ (depthScale * (offset + quantScale * stored)) + translation,
+            # the depth scale keeps coincident daughter and mother faces apart
+            depthScale = 1 - 0.001 * visOptions.depth
+            matrices = _np.array(
+                [_np.asarray(p["transformation"], dtype=float) for p in placements]
+            )
+            translations = _np.array(
+                [_np.asarray(p["translation"], dtype=float).reshape(3) for p in placements]
+            )
+            matrices = scale * matrices
+            translations = scale * translations + depthScale * matrices @ offset
+            matrices = matrices * (depthScale * quantScale)[None, None, :]
+
+            rotations, scales, valid = _transformation.matrix2rotationScale(matrices)
+            quaternions = _transformation.matrix2quaternion(rotations)[:, [1, 2, 3, 0]]
+            names = [str(p["name"]) for p in placements]
+
+            instanced = _np.flatnonzero(valid) if instancing else _np.zeros(0, dtype=int)
+            if len(instanced) < minInstances:
+                instanced = _np.zeros(0, dtype=int)
+            if len(instanced) > 0:
+                node = {
+                    "name": k,
+                    "mesh": iMesh,
+                    "extensions": {
+                        "EXT_mesh_gpu_instancing": {
+                            "attributes": {
+                                "TRANSLATION": glb.addAccessor(
+                                    translations[instanced].astype(_np.float32)
+                                ),
+                                "ROTATION": glb.addAccessor(
+                                    quaternions[instanced].astype(_np.float32)
+                                ),
+                                "SCALE": glb.addAccessor(scales[instanced].astype(_np.float32)),
+                            }
+                        }
+                    },
+                }
+                if instanceNames:
+                    node["extras"] = {"instances": [names[i] for i in instanced]}
+                nodes.append(node)
+
+            for i in _np.setdiff1d(_np.arange(len(placements)), instanced):
+                node = {"name": names[i], "mesh": iMesh}
+                if valid[i]:
+                    # identity components are the defaults and left out
+                    if _np.any(translations[i] != 0):
+                        node["translation"] = translations[i].tolist()
+                    if _np.any(quaternions[i] != [0, 0, 0, 1]):
+                        node["rotation"] = quaternions[i].tolist()
+                    if _np.any(scales[i] != 1):
+                        node["scale"] = scales[i].tolist()
+                else:
+                    matrix = _np.identity(4)
+                    matrix[:3, :3] = matrices[i]
+                    matrix[:3, 3] = translations[i]
+                    node["matrix"] = matrix.T.ravel().tolist()  # column major
+                nodes.append(node)
+
+        gltf = {
+            "asset": {"version": "2.0", "generator": "pyg4ometry"},
+            "scene": 0,
+            "scenes": [{"nodes": list(range(len(nodes)))}],
+            "nodes": nodes,
+            "meshes": meshes,
+            "materials": materials,
+        }
+        extensionsUsed = []
+        if any("extensions" in n for n in nodes):
+            extensionsUsed.append("EXT_mesh_gpu_instancing")
+        if quantise:
+            extensionsUsed.append("KHR_mesh_quantization")
+            gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+        if extensionsUsed:
+            gltf["extensionsUsed"] = extensionsUsed
+
+        glb.write(glbFileName, gltf)
+
     def exportGLTFAssets(self, gltfFileName="test.gltf"):
         """Export all the assets (meshes) without all the instances. The position of the asset is
         the position of the first instance"""
@@ -1,5 +1,6 @@
 import numpy as _np
 import vtk as _vtk
+import vtk.util.numpy_support as _numpy_support
 from .. import geant4 as _g4
 from .. import exceptions as _exceptions
 from .. import transformation as _transformation
@@ -21,6 +22,7 @@ class VtkViewer:
 
     :param size: (int,int) - (nPixelsHorizontal, nPixelsVeritcal), default (1024,1024)
     :param interpolation: (str) - one of "none", "flat", "gouraud", "phong"
+    :param instanced: (bool) - draw all placements of a mesh with the same visualisation options with one actor (a glyph mapper with per placement transforms) instead of one actor per placement, default False. Section cutters are not made for these placements.
 
     :Examples:
 
@@ -103,6 +105,11 @@ class VtkViewer:
 
         self._defaultVis = _VisOptions()
 
+        # instanced rendering, see addMesh and buildInstances
+        self.instanced = kwargs.get("instanced", False)
+        self.instanceGroups = {}  # (solid name, id(visOptions)) : _InstanceGroup
+        self._instanceActorMap = {}  # actor : _InstanceGroup
+
     def addAxes(self, length=20.0, origin=(0, 0, 0)):
         """
         Add x,y,z axis to the scene.
@@ -297,6 +304,8 @@ class VtkViewer:
         """
         import os
 
+        self.buildInstances()
+
         if fileName:
             # Select the writer to use.
             _path, ext = os.path.splitext(fileName)
@@ -522,14 +531,8 @@ class VtkViewer:
     def addMeshSimple(self, csgMesh, visOptions=_VisOptions(), clip=False, name="mesh"):
         if clip:
             csgMesh = csgMesh.clone()
-            verts, _, _ = csgMesh.toVerticesAndPolygons()
-            x = _np.array([v[0] for v in verts])
-            y = _np.array([v[1] for v in verts])
-            z = _np.array([v[2] for v in verts])
-            xsize = max(x) - min(x)
-            ysize = max(y) - min(y)
-            zsize = max(z) - min(z)
-            t = -_np.array([min(x) + xsize / 2.0, min(y) + ysize / 2.0, min(z) + ysize / 2.0])
+            vMin, vMax = csgMesh.bbox()
+            t = -(vMin + vMax) / 2.0
             csgMesh.translate(t)
 
         self.addMesh(
@@ -700,6 +703,14 @@ class VtkViewer:
         cutters=True,
         clippers=False,
     ):
+        if self.instanced and not overlap and not clippers:
+            rotation, scale, valid = _transformation.matrix2rotationScale(mtra)
+            if valid:
+                self._addInstance(
+                    pv_name, solid_name, mesh, rotation, scale, tra, localmeshes, visOptions
+                )
+                return
+
         # VtkPolyData : check if mesh is in localmeshes dict
         _log.debug("VtkViewer.addLogicalVolume> vtkPD")
 
@@ -922,7 +933,96 @@ class VtkViewer:
         actors.append(vtkActor)
         self.ren.AddActor(vtkActor)
 
+    def _addInstance(
+        self, pv_name, solid_name, mesh, rotation, scale, tra, localmeshes, visOptions
+    ):
+        key = (solid_name, id(visOptions))
+        group = self.instanceGroups.get(key)
+        if group is None:
+            if solid_name in localmeshes:
+                vtkPD = localmeshes[solid_name]
+            else:
+                vtkPD = _Convert.pycsgMeshToVtkPolyData(mesh)
+                localmeshes[solid_name] = vtkPD
+            group = _InstanceGroup(vtkPD, visOptions)
+            self.instanceGroups[key] = group
+        group.add(pv_name, rotation, scale, tra)
+
+    def buildInstances(self):
+        """
+        Create (or update) the actors of the placements collected in instanced mode. Called
+        by view and exportScreenShot, so only needed before using the renderer directly.
+        """
+        for group in self.instanceGroups.values():
+            if group.actor is None:
+                vtkPD = group.polydata
+                if self.interpolation != "none":
+                    normal_generator = _vtk.vtkPolyDataNormals()
+                    normal_generator.SetInputData(vtkPD)
+                    normal_generator.SetSplitting(0)
+                    normal_generator.SetConsistency(0)
+                    normal_generator.SetAutoOrientNormals(0)
+                    normal_generator.SetComputePointNormals(1)
+                    normal_generator.SetComputeCellNormals(1)
+                    normal_generator.SetFlipNormals(0)
+                    normal_generator.SetNonManifoldTraversal(0)
+                    normal_generator.Update()
+                    vtkPD = normal_generator.GetOutput()
+
+                vtkMAP = _vtk.vtkGlyph3DMapper()
+                vtkMAP.ScalarVisibilityOff()
+                vtkMAP.SetSourceData(vtkPD)
+                vtkMAP.SetOrientationArray("orientation")
+                vtkMAP.SetOrientationModeToQuaternion()
+                vtkMAP.SetScaleArray("scale")
+                vtkMAP.SetScaleModeToScaleByVectorComponents()
+                self.mappers.append(vtkMAP)
+
+                vtkActor = _vtk.vtkActor()
+                vtkActor.SetMapper(vtkMAP)
+                self._setActorVisOptions(vtkActor, group.visOptions)
+                self.actors.append(vtkActor)
+                self.ren.AddActor(vtkActor)
+
+                group.actor = vtkActor
+                self._instanceActorMap[vtkActor] = group
+
+            if group.nBuilt != len(group.names):
+                group.actor.GetMapper().SetInputData(group.instancePolyData())
+                group.nBuilt = len(group.names)
+
+    def pickInstance(self, actor, position):
+        """
+        Return the name of the physical volume drawn by an instanced actor at a position (mm)
+        on its surface, e.g. from a picker, or None.
+
+        :param actor: vtkActor - picked actor
+        :param position: [float, float, float] - picked position in the scene
+        """
+        group = self._instanceActorMap.get(actor)
+        if group is None:
+            return None
+        return group.instanceAt(position)
+
+    def _setActorVisOptions(self, vtkActor, visOptions):
+        if self.interpolation == "gouraud":
+            vtkActor.GetProperty().SetInterpolationToGouraud()
+        elif self.interpolation == "phong":
+            vtkActor.GetProperty().SetInterpolationToPhong()
+        elif self.interpolation == "flat":
+            vtkActor.GetProperty().SetInterpolationToFlat()
+
+        vtkActor.GetProperty().SetColor(*visOptions.getColour())
+        vtkActor.GetProperty().SetOpacity(visOptions.alpha)
+        if visOptions.representation == "surface":
+            vtkActor.GetProperty().SetRepresentationToSurface()
+        elif visOptions.representation == "wireframe":
+            vtkActor.GetProperty().SetRepresentationToWireframe()
+        vtkActor.SetVisibility(visOptions.visible)
+
     def view(self, interactive=True, resetCamera=True):
+        self.buildInstances()
+
         # enable user interface interactor
         self.iren.Initialize()
 
@@ -1199,6 +1299,70 @@ class VtkViewerColouredMaterial(PubViewer):
         super().__init__(*args, materialVisOptions=_getPredefinedMaterialVisOptions(), **kwargs)
 
 
+class _InstanceGroup:
+    """
+    Placements of one mesh with the same visualisation options, drawn by one glyph mapper.
+    Each placement is stored as a rotation, a scale along the local axes and a translation.
+    """
+
+    def __init__(self, polydata, visOptions):
+        self.polydata = polydata
+        self.visOptions = visOptions
+        self.names = []
+        self.rotations = []
+        self.scales = []
+        self.translations = []
+        self.actor = None
+        self.nBuilt = 0
+
+    def add(self, name, rotation, scale, translation):
+        self.names.append(name)
+        self.rotations.append(rotation)
+        self.scales.append(scale)
+        self.translations.append(translation)
+
+    def instancePolyData(self):
+        """Points at the placement positions with orientation and scale point data."""
+        translations = _np.array(self.translations, dtype=float).reshape(-1, 3)
+        quaternions = _transformation.matrix2quaternion(_np.array(self.rotations).reshape(-1, 3, 3))
+        scales = _np.array(self.scales, dtype=float).reshape(-1, 3)
+
+        points = _vtk.vtkPoints()
+        points.SetData(_numpy_support.numpy_to_vtk(translations, deep=True))
+        orientation = _numpy_support.numpy_to_vtk(quaternions, deep=True)
+        orientation.SetName("orientation")
+        scale = _numpy_support.numpy_to_vtk(scales, deep=True)
+        scale.SetName("scale")
+
+        polydata = _vtk.vtkPolyData()
+        polydata.SetPoints(points)
+        polydata.GetPointData().AddArray(orientation)
+        polydata.GetPointData().AddArray(scale)
+        return polydata
+
+    def instanceAt(self, position, tolerance=1e-3):
+        """
+        Name of the placement whose mesh bounding box contains position, the one with the
+        closest centre if several do, or None.
+        """
+        rotations = _np.array(self.rotations).reshape(-1, 3, 3)
+        scales = _np.array(self.scales, dtype=float).reshape(-1, 3)
+        translations = _np.array(self.translations, dtype=float).reshape(-1, 3)
+
+        # position in the local frame of each placement
+        local = _np.einsum("nji,nj->ni", rotations, _np.asarray(position) - translations) / scales
+
+        bounds = _np.array(self.polydata.GetBounds()).reshape(3, 2)
+        inside = _np.all(
+            (local >= bounds[:, 0] - tolerance) & (local <= bounds[:, 1] + tolerance), axis=1
+        )
+        if not inside.any():
+            return None
+        distance = _np.linalg.norm(local - bounds.mean(axis=1), axis=1)
+        distance[~inside] = _np.inf
+        return self.names[int(_np.argmin(distance))]
+
+
 class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
     def __init__(self, renderer, vtkviewer):
         self.AddObserver("RightButtonPressEvent", self.rightButtonPressEvent)
@@ -1214,7 +1378,10 @@ class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
 
         actor = picker.GetActor()
         # If an actor was right clicked
-        if actor:
+        instanceName = self.vtkviewer.pickInstance(actor, picker.GetPickPosition())
+        if instanceName is not None:
+            _log.debug(f"{type(self.vtkviewer).__name__}> selected> {instanceName}")
+        elif actor:
             actorMap = self.vtkviewer.physicalActorMap
             try:
                 name = next(x[0] for x in actorMap.items() if x[1] is actor)
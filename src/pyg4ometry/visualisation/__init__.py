@@ -1,10 +1,14 @@
 from .Mesh import Mesh
+from .Mesh import LazyMeshList
 from .Mesh import OverlapType
 from .Mesh import _getBoundingBox
 from .Mesh import _getBoundingBoxMesh
+from .MeshCache import cachedMesh
+from .MeshCache import clearMeshCache
 from .VisualisationOptions import *
 from .VtkViewer import *
 from .ViewerBase import ViewerBase
+from .Section import PlaneSection, SectionExporter, sectionPlaneAxes, writeSections
 from .VtkViewerNew import *
 from .BlenderViewer import *
 from .RenderWriter import *
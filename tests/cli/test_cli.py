@@ -81,6 +81,10 @@ def test_cli_checkoverlaps_long(testdata):
     _cli.main(["-i", testdata["gdml/001_box.gdml"], "--checkoverlaps"], testing=True)
 
 
+def test_cli_checkoverlaps_workers(testdata):
+    _cli.main(["-i", testdata["gdml/001_box.gdml"], "-c", "--workers", "2"], testing=True)
+
+
 def test_cli_clip_short(testdata):
     _cli.main(
         [
@@ -387,6 +391,26 @@ def test_cli_planecutter_long2(testdata, tmptestdir):
     )
 
 
+def test_cli_planecutter_repeated(testdata, tmptestdir):
+    _cli.main(
+        [
+            "-i",
+            testdata["gdml/001_box.gdml"],
+            "-p",
+            "0,0,0,0,1,0",
+            "-p",
+            "0,0,0,1,0,0",
+            "-P",
+            tmptestdir / "box_cuts.json",
+        ],
+        testing=True,
+    )
+    import json
+
+    with open(tmptestdir / "box_cuts.json") as f:
+        assert len(json.load(f)["planes"]) == 2
+
+
 def test_cli_planecutter_short_wrong(testdata):
     with pytest.raises(ValueError, match="pyg4> must specify -P or --planeCutterOutput file") as ex:
         # no -P given for output - should complain
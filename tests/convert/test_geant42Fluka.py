@@ -1,5 +1,8 @@
 import pytest
 
+import pyg4ometry.convert as _convert
+import pyg4ometry.fluka as _fluka
+
 from . import T001_geant4Box2Fluka
 from . import T002_geant4Tubs2Fluka
 from . import T003_geant4CutTubs2Fluka
@@ -688,6 +691,29 @@ def test_Geant42FlukaConversion_T101_physical_logical(tmptestdir, testdata):
     )
 
 
+def test_Geant42FlukaConversion_T101_deduplicate(tmptestdir, testdata):
+    r = T101_physical_logical.Test(
+        vis=False,
+        interactive=False,
+        fluka=True,
+        outputPath=tmptestdir,
+        refFilePath=None,
+    )
+
+    freg = _convert.geant4Reg2FlukaReg(r["greg"], deduplicate=True)
+
+    # b1l is placed four times, the first placement is the lattice prototype
+    assert len(freg.latticeDict) == 3
+    assert len(freg.bodyDict) < len(r["freg"].bodyDict)
+
+    w = _fluka.Writer()
+    w.addDetector(freg)
+    w.write(tmptestdir / "T101_deduplicate.inp")
+
+    rfreg = _fluka.Reader(tmptestdir / "T101_deduplicate.inp").getRegistry()
+    assert set(rfreg.latticeDict) == set(freg.latticeDict)
+
+
 def test_Geant42FlukaConversion_T105_Assembly(tmptestdir, testdata):
     T105_geant4Assembly2Fluka.Test(
         vis=False,
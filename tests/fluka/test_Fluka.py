@@ -1418,3 +1418,268 @@ def test_fluka_vis(tmptestdir, testdata):
     v = _VtkViewerNew()
     v.addFlukaRegions(r)
     v.buildPipelinesAppend()
+
+
+def test_bodyAABB():
+    from pyg4ometry.fluka import RCC, REC, RPP, SPH, TRC, XYP, ZEC, Transform
+    from pyg4ometry.fluka.vector import AABB
+
+    rtrans = rotoTranslationFromTra2("aabbTRF", [[np.pi / 4, np.pi / 5, np.pi / 3], [10, -20, 30]])
+    transform = Transform(expansion=2.0, rotoTranslation=rtrans)
+    reference = AABB([-50, -40, -30], [60, 70, 80])
+
+    bodies = [
+        RPP("rpp", 0, 10, -5, 5, 2, 4, transform=transform),
+        SPH("sph", [1, 2, 3], 4, transform=transform),
+        RCC("rcc", [0, 0, 0], [5, 5, 5], 2, transform=transform),
+        REC("rec", [0, 0, 0], [0, 0, 10], [2, 0, 0], [0, 3, 0], transform=transform),
+        TRC("trc", [0, 0, 0], [5, 5, 5], 5, 2, transform=transform),
+        XYP("xyp", 3, transform=transform),
+        ZEC("zec", 1, 2, 3, 4, transform=transform),
+    ]
+    for body in bodies:
+        for aabb in [None, reference]:
+            meshAABB = AABB.fromMesh(body.mesh(aabb=aabb))
+            analyticAABB = body.aabb(aabb=aabb)
+            meshLower, meshUpper = np.asarray(meshAABB.lower), np.asarray(meshAABB.upper)
+            lower, upper = np.asarray(analyticAABB.lower), np.asarray(analyticAABB.upper)
+            # the analytic box encloses the faceted mesh and is close to it
+            tolerance = 0.05 * max(meshUpper - meshLower)
+            # infinite bodies are meshed ~1e7 in size, so allow for rounding relative to that
+            eps = 1e-6 + 1e-9 * max(np.abs(meshLower).max(), np.abs(meshUpper).max())
+            assert np.all(lower <= meshLower + eps)
+            assert np.all(upper >= meshUpper - eps)
+            assert np.allclose(lower, meshLower, atol=tolerance)
+            assert np.allclose(upper, meshUpper, atol=tolerance)
+
+
+def test_zoneAABB():
+    from pyg4ometry.fluka import RPP, SPH, XYP, ZCC, Region, Zone
+
+    slab = Zone()
+    slab.addIntersection(ZCC("zcc", 0, 0, 3))
+    slab.addIntersection(XYP("top", 5))
+    slab.addSubtraction(XYP("bottom", -5))
+    aabb = slab.aabb()
+    assert np.allclose(aabb.lower, [-3, -3, -5])
+    assert np.allclose(aabb.upper, [3, 3, 5])
+
+    empty = Zone()
+    empty.addIntersection(RPP("inner", 0, 1, 0, 1, 0, 1))
+    empty.addSubtraction(RPP("outer", -1, 2, -1, 2, -1, 2))
+    assert empty.aabb() is None
+
+    region = Region("aabbRegion")
+    region.addZone(slab)
+    region.addZone(empty)
+    assert region.zoneAABBs()[1] is None
+    assert region.aabb() == aabb
+
+    # a curved subtraction leaves the bounding box, only the mesh shows the zone is empty
+    shell = Zone()
+    shell.addIntersection(SPH("small", [0, 0, 0], 5))
+    shell.addSubtraction(SPH("large", [0, 0, 0], 10))
+    region.addZone(shell)
+    assert region.zoneAABBs()[2] is not None
+    assert region.zoneAABBs(checkNull=True)[2] is None
+
+
+def test_FlukaRegistry_removeDuplicateBodies():
+    from pyg4ometry.fluka import ARB, RPP, Region, Zone
+
+    freg = FlukaRegistry()
+    vertices = [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+    ]
+    faces = [4321, 5678, 1265, 2376, 1485, 3487]
+    bodies = [
+        RPP("box1", 0, 1, 0, 1, 0, 1, flukaregistry=freg, comment="first"),
+        RPP("box2", 0, 1, 0, 1, 0, 1, flukaregistry=freg),
+        RPP("box3", 0, 1, 0, 1, 0, 2, flukaregistry=freg),
+        ARB("arb1", vertices, faces, flukaregistry=freg),
+        ARB("arb2", vertices, faces, flukaregistry=freg),
+        # the same vertices in another order make another body
+        ARB("arb3", vertices[4:] + vertices[:4], faces, flukaregistry=freg),
+    ]
+    region = Region("region")
+    for body in bodies:
+        zone = Zone()
+        zone.addIntersection(body)
+        region.addZone(zone)
+    freg.addRegion(region)
+
+    assert freg.removeDuplicateBodies() == {"box2": "box1", "arb2": "arb1"}
+    assert list(freg.bodyDict.keys()) == ["box1", "box3", "arb1", "arb3"]
+    assert [zone.intersections[0].body.name for zone in region.zones] == [
+        "box1",
+        "box1",
+        "box3",
+        "arb1",
+        "arb1",
+        "arb3",
+    ]
+
+
+def test_FlukaRegistry_meshMemo():
+    from pyg4ometry.fluka import RPP, SPH, Region, Zone
+
+    freg = FlukaRegistry()
+    box = RPP("box", -5, 5, -5, 5, -5, 5, flukaregistry=freg)
+    ball = SPH("ball", [0, 0, 0], 2, flukaregistry=freg)
+
+    regions = []
+    for name in ["inner", "outer"]:
+        zone = Zone()
+        zone.addIntersection(box if name == "outer" else ball)
+        if name == "outer":
+            zone.addSubtraction(ball)
+        region = Region(name)
+        region.addZone(zone)
+        freg.addRegion(region)
+        regions.append(region)
+
+    mesh1 = freg.bodyMesh(ball)
+    mesh2 = freg.bodyMesh(ball)
+    assert mesh1 is not mesh2  # fresh copies
+    assert len(freg.meshMemo) == 1
+
+    for region in regions:
+        region.mesh(flukaregistry=freg)
+    # ball and box once each, and the two zones
+    assert len(freg.meshMemo) == 4
+
+    freg.invalidateBodyMesh(ball)
+    assert len(freg.meshMemo) == 1
+
+    ball.radius = 3  # a modified body changes its hash and is meshed again
+    freg.bodyMesh(ball)
+    freg.bodyMesh(ball)
+    assert len(freg.meshMemo) == 2
+
+    freg.clearMeshMemo()
+    assert not freg.meshMemo
+
+
+def test_fluka2Geant4Workers():
+    import pyg4ometry.convert as convert
+    from pyg4ometry.fluka import RCC, ZCC, Region, Zone
+
+    freg = FlukaRegistry()
+    for i in range(4):
+        outer = RCC(f"outer{i}", [20 * i, 0, 0], [0, 0, 10], 5, flukaregistry=freg)
+        inner = ZCC(f"inner{i}", 20 * i, 0, 2, flukaregistry=freg)
+        zone = Zone()
+        zone.addIntersection(outer)
+        zone.addSubtraction(inner)
+        region = Region(f"region{i}")
+        region.addZone(zone)
+        freg.addRegion(region)
+        freg.assignma("COPPER", region)
+
+    serial = convert.fluka2Geant4(freg)
+    parallel = convert.fluka2Geant4(freg, workers=2)
+
+    assert list(serial.logicalVolumeDict) == list(parallel.logicalVolumeDict)
+    assert list(serial.physicalVolumeDict) == list(parallel.physicalVolumeDict)
+    for name, lv in serial.logicalVolumeDict.items():
+        lvParallel = parallel.logicalVolumeDict[name]
+        assert lv.material.name == lvParallel.material.name
+        assert lv.mesh.localmesh.vertexCount() == lvParallel.mesh.localmesh.vertexCount()
+        assert np.allclose(lv.mesh.getBoundingBox(), lvParallel.mesh.getBoundingBox())
+
+
+def test_connectedZones():
+    from pyg4ometry.fluka import SPH, Region, Zone
+
+    freg = FlukaRegistry()
+    spheres = [SPH(f"s{i}", [x, 0, 0], 2, flukaregistry=freg) for i, x in enumerate([0, 3, 6, 100])]
+
+    region = Region("chain")
+    for sphere in spheres:
+        zone = Zone()
+        zone.addIntersection(sphere)
+        region.addZone(zone)
+    # disjoint intersection, an empty zone
+    zone = Zone()
+    zone.addIntersection(spheres[0])
+    zone.addIntersection(spheres[3])
+    region.addZone(zone)
+
+    components = sorted(sorted(c) for c in region.connectedZones())
+    assert components == [[0, 1, 2], [3], [4]]
+
+    # the first and last of the chain are connected through the middle zone only
+    graph = region.zoneGraph()
+    assert not graph.has_edge(0, 2)
+
+
+def test_regionToDNF():
+    from pyg4ometry.exceptions import FLUKAError
+    from pyg4ometry.fluka import SPH, Region, Zone
+    from pyg4ometry.fluka import boolean_algebra
+
+    freg = FlukaRegistry()
+    a, b, c, d = (SPH(name, [x, 0, 0], 5, flukaregistry=freg) for name, x in zip("abcd", range(4)))
+    far = SPH("far", [100, 0, 0], 1, flukaregistry=freg)
+
+    # +a -(+b -(+c +d)) = a & ~b | a & c & d
+    inner = Zone()
+    inner.addIntersection(c)
+    inner.addIntersection(d)
+    sub = Zone()
+    sub.addIntersection(b)
+    sub.addSubtraction(inner)
+    zone = Zone()
+    zone.addIntersection(a)
+    zone.addSubtraction(sub)
+
+    assert boolean_algebra.nTermsDNF(zone) == 2
+    dnf = zone.toDNF("dnf")
+    assert dnf.isDNF()
+    assert [z.dumps() for z in dnf.zones] == [" +a -b", " +a +c +d"]
+
+    # far is disjoint from a, so +a +(+far -b) is empty and -far does nothing
+    farZone = Zone()
+    farZone.addIntersection(far)
+    farZone.addSubtraction(b)
+    zone = Zone()
+    zone.addIntersection(a)
+    zone.addIntersection(farZone)
+    assert boolean_algebra.zoneToDNFZones(zone) == []
+    zone = Zone()
+    zone.addIntersection(a)
+    zone.addSubtraction(farZone)
+    assert [z.dumps() for z in boolean_algebra.zoneToDNFZones(zone)] == [" +a", " +a +b"]
+
+    # 4**12 terms before pruning, a single zone after
+    zone = Zone()
+    zone.addIntersection(a)
+    for i in range(12):
+        sub = Zone()
+        for j in range(4):
+            sub.addIntersection(SPH(f"s{i}_{j}", [50 + 10 * j, 10 * i, 0], 1, flukaregistry=freg))
+        zone.addSubtraction(sub)
+    assert boolean_algebra.nTermsDNF(zone) == 4**12
+    assert [z.dumps() for z in boolean_algebra.zoneToDNFZones(zone)] == [" +a"]
+
+    region = Region("region")
+    region.addZone(zone)
+    region.addZone(dnf.zones[0])
+    with pytest.raises(FLUKAError):
+        region.toDNF("dnf", maxZones=1)
+    assert len(region.toDNF("dnf").zones) == 2
+
+    # the same zones with almost no partial terms remembered
+    maxVisitedTerms = boolean_algebra._maxVisitedTerms
+    boolean_algebra._maxVisitedTerms = 1
+    try:
+        assert [z.dumps() for z in region.toDNF("dnf").zones] == [" +a", " +a -b"]
+    finally:
+        boolean_algebra._maxVisitedTerms = maxVisitedTerms
@@ -646,3 +646,39 @@ def test_GdmlDefine_MatrixGetItemInRegistry():
     mat = pyg4ometry.gdml.Matrix("mat", 2, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10], r, True)
     v = mat[0, 0]
     assert v.expression.expressionString == "mat[1,1]"
+
+
+def test_GdmlDefine_ExpressionCache():
+    r = pyg4ometry.geant4.Registry()
+    a = pyg4ometry.gdml.Constant("a", "2", r)
+    b = pyg4ometry.gdml.Constant("b", "3*a+1", r)
+    assert b.eval() == 7
+
+    # parsed once, memoised until a define changes
+    assert r.expressionValues["3*a+1"] == 7
+    a.setExpression("3")
+    assert b.eval() == 10
+    a.expression.expressionString = "4"
+    assert b.eval() == 13
+    assert pyg4ometry.gdml.evaluateToFloat(r, "b/13+sin(0)") == 1
+
+    assert r.getExpressionParser().variables("b*a+mm") == ["b", "a", "mm"]
+
+
+def test_GdmlDefine_ExpressionWithoutRegistry():
+    from pyg4ometry.gdml.GdmlExpression import GdmlExpressionEval
+
+    assert pyg4ometry.gdml.Constant("c", 6, None, False).eval() == 6
+    assert pyg4ometry.gdml.Quantity("q", 2, "mm", "length", None, False).eval() == 2
+    assert pyg4ometry.gdml.Defines.BasicExpression("e", "4*2*mm", None).eval() == 8
+
+    # the compiled expressions are bounded, least recently used first out
+    maxSize = GdmlExpressionEval._compiledMaxSize
+    GdmlExpressionEval._compiledMaxSize = 2
+    try:
+        for i in range(5):
+            pyg4ometry.gdml.Defines.BasicExpression("e", f"{i}+sin(0)", None).eval()
+        assert len(GdmlExpressionEval._compiled) == 2
+        assert "4+sin(0)" in GdmlExpressionEval._compiled
+    finally:
+        GdmlExpressionEval._compiledMaxSize = maxSize
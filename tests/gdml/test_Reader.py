@@ -952,3 +952,90 @@ def test_GdmlLoad_BDSIM_colour_force_visible(testdata):
     reader = pyg4ometry.gdml.Reader(filepath, makeAllVisible=True)
     wlv = reader.getRegistry().getWorldVolume()
     assert wlv.daughterVolumes[0].logicalVolume.visOptions.visible
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "gdml/G01/solids.gdml",
+        "gdml/201_materials.gdml",
+        "gdml/303_matrix.gdml",
+        "gdml/G01/auxiliary.gdml",
+    ],
+)
+def test_GdmlLoad_Streaming(testdata, filename):
+    registry = pyg4ometry.gdml.Reader(testdata[filename]).getRegistry()
+    streamed = pyg4ometry.gdml.Reader(testdata[filename], streaming=True).getRegistry()
+
+    assert list(streamed.defineDict) == list(registry.defineDict)
+    assert list(streamed.materialDict) == list(registry.materialDict)
+    assert list(streamed.solidDict) == list(registry.solidDict)
+    assert list(streamed.logicalVolumeDict) == list(registry.logicalVolumeDict)
+    assert list(streamed.physicalVolumeDict) == list(registry.physicalVolumeDict)
+    assert len(streamed.userInfo) == len(registry.userInfo)
+    assert streamed.getWorldVolume().name == registry.getWorldVolume().name
+    for name, define in registry.defineDict.items():
+        assert str(streamed.defineDict[name].eval()) == str(define.eval())
+
+
+def test_GdmlWrite_Streaming(testdata, tmptestdir):
+    import gzip as _gzip
+
+    registry = pyg4ometry.gdml.Reader(testdata["gdml/G01/solids.gdml"]).getRegistry()
+
+    writer = pyg4ometry.gdml.Writer()
+    writer.addDetector(registry)
+    writer.write(tmptestdir / "solids.gdml")
+
+    streamingWriter = pyg4ometry.gdml.Writer(streaming=True)
+    streamingWriter.addDetector(registry)
+    streamingWriter.write(tmptestdir / "solids_streamed.gdml.gz")
+
+    with open(tmptestdir / "solids.gdml") as f, _gzip.open(
+        tmptestdir / "solids_streamed.gdml.gz", "rt"
+    ) as g:
+        assert f.read() == g.read()
+
+
+def test_GdmlWrite_StreamingLateElements():
+    import io as _io
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 5000, 5000, 5000, reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    reg.setWorld(wl)
+
+    writer = pyg4ometry.gdml.Writer(streaming=True)
+    writer.addDetector(reg)
+
+    # elements written after addDetector are still part of the document
+    extra = pyg4ometry.geant4.solid.Orb("extra", 10, pyg4ometry.geant4.Registry())
+    writer.writeSolid(extra)
+    f = _io.StringIO()
+    writer.write(f)
+    assert 'name="extra"' in f.getvalue()
+
+    # the temporary files are closed, so the document cannot be written again
+    with pytest.raises(RuntimeError, match="already been written"):
+        writer.write(_io.StringIO())
+
+
+def test_GdmlWrite_CompactTessellated(tmptestdir):
+    reg = pyg4ometry.geant4.Registry()
+    p1 = [(-500, 500, 0), (500, 500, 0), (500, -500, 0), (-500, -500, 0)]
+    p2 = [(-1000, 1000, 2000), (1000, 1000, 2000), (1000, -1000, 2000), (-1000, -1000, 2000)]
+    ws = pyg4ometry.geant4.solid.Box("ws", 5000, 5000, 5000, reg)
+    ts = pyg4ometry.geant4.solid.createTessellatedSolid("ts", [p1, p2], reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    tl = pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], tl, "tp", wl, reg)
+    reg.setWorld(wl)
+
+    writer = pyg4ometry.gdml.Writer(compactTessellated=True)
+    writer.addDetector(reg)
+    writer.write(tmptestdir / "compact_tessellated.gdml")
+
+    reg2 = pyg4ometry.gdml.Reader(tmptestdir / "compact_tessellated.gdml").getRegistry()
+    # the 12 triangles share the 8 corners of the frustum
+    assert len([d for d in reg2.defineDict if d.startswith("ts_v")]) == 8
+    assert reg2.solidDict["ts"].mesh().volume() == pytest.approx(ts.mesh().volume())
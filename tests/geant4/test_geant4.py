@@ -205,6 +205,133 @@ def test_Python_FreeCadImportFail():
 # #############################
 
 
+def test_Python_AABBSweepAndPrune():
+    from pyg4ometry.meshutils import aabbSweepAndPrune
+
+    aabbMin = [[0, 0, 0], [5, 0, 0], [1, 1, 1], [20, 20, 20], [10, 0, 0]]
+    aabbMax = [[2, 2, 2], [6, 1, 1], [3, 3, 3], [21, 21, 21], [11, 1, 1]]
+    pairs = aabbSweepAndPrune(aabbMin, aabbMax)
+    assert pairs.tolist() == [[0, 2]]
+
+    # touching boxes are kept as candidates (coplanar surfaces)
+    pairs = aabbSweepAndPrune([[0, 0, 0], [1, 0, 0]], [[1, 1, 1], [2, 1, 1]])
+    assert pairs.tolist() == [[0, 1]]
+
+    assert len(aabbSweepAndPrune([[0, 0, 0]], [[1, 1, 1]])) == 0
+
+
+def _overlappingBoxes():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv1", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [5, 0, 0], bl, "b_pv2", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [30, 0, 0], bl, "b_pv3", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [48, 0, 0], bl, "b_pv4", wl, reg)
+    return wl
+
+
+def test_Python_CheckOverlaps():
+    wl = _overlappingBoxes()
+    nOverlaps = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=nOverlaps)
+    # b_pv1-b_pv2 overlap and b_pv4 protrudes from the world
+    assert nOverlaps[0] == 2
+    assert len(wl.mesh.overlapmeshes) == 2
+
+
+def test_Python_CheckOverlapsWorkers():
+    wl = _overlappingBoxes()
+    nOverlaps = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=nOverlaps, workers=2)
+    assert nOverlaps[0] == 2
+    assert len(wl.mesh.overlapmeshes) == 2
+
+
+def test_Python_CheckOverlapsWorkersOnePool(monkeypatch):
+    import sys
+    import pyg4ometry
+
+    # the package exports the class under the module name
+    _lvModule = sys.modules["pyg4ometry.geant4.LogicalVolume"]
+    pools = []
+    ProcessPoolExecutor = _lvModule._ProcessPoolExecutor
+
+    def countingProcessPoolExecutor(*args, **kwargs):
+        pools.append(args or kwargs)
+        return ProcessPoolExecutor(*args, **kwargs)
+
+    monkeypatch.setattr(_lvModule, "_ProcessPoolExecutor", countingProcessPoolExecutor)
+    monkeypatch.setattr(_lvModule, "_overlapBatchSize", 1)
+
+    # the daughter volume contains overlapping boxes of its own, so that the tests of the
+    # tree come in several batches
+    wl = _overlappingBoxes()
+    reg = wl.registry
+    inner = pyg4ometry.geant4.solid.Box("inner", 40, 40, 40, reg, "mm")
+    il = pyg4ometry.geant4.LogicalVolume(inner, "G4_Galactic", "il", reg)
+    bl = reg.logicalVolumeDict["bl"]
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "i_pv1", il, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [5, 0, 0], bl, "i_pv2", il, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, -30, 0], il, "il_pv", wl, reg)
+
+    nOverlaps = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=nOverlaps, workers=2)
+    assert len(pools) == 1
+    assert nOverlaps[0] == 3
+    assert len(il.mesh.overlapmeshes) == 1
+
+
+def test_Python_CheckOverlapsTubsBore():
+    import pyg4ometry
+
+    g4 = pyg4ometry.geant4
+    reg = g4.Registry()
+    ts = g4.solid.Tubs("ts", 50, 100, 200, 0, "2*pi", reg)
+    tl = g4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    bs = g4.solid.Box("bs", 20, 20, 20, reg)
+    bl = g4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    # inside the extent of the mother, but in its bore, so entirely outside it
+    g4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv", tl, reg)
+
+    report = tl.checkOverlaps()
+    assert report.nOverlaps(pyg4ometry.visualisation.OverlapType.protrusion) == 1
+
+
+def test_Python_CheckOverlapsReport(tmptestdir):
+    import pyg4ometry
+
+    wl = _overlappingBoxes()
+    report = wl.checkOverlaps(recursive=True)
+    assert len(report) == 2
+    assert report.nOverlaps(pyg4ometry.visualisation.OverlapType.overlap) == 1
+    assert report.nOverlaps(pyg4ometry.visualisation.OverlapType.protrusion) == 1
+    assert report.nPairs == 6
+    assert report.nPairsPruned == 5
+
+    overlap = report.overlaps[0]
+    assert (overlap.name1, overlap.name2) == ("b_pv1", "b_pv2")
+    if overlap.volume is not None:  # pycsg meshes have no volume
+        assert overlap.volume == pytest.approx(500)
+
+    report.writeCsv(tmptestdir / "T_overlap_report.csv")
+    report.writeJson(tmptestdir / "T_overlap_report.json")
+    loaded = pyg4ometry.geant4.OverlapReport.loadJson(tmptestdir / "T_overlap_report.json")
+    assert len(loaded) == 2
+    assert len(loaded.tests) == len(report.tests)
+
+
+def test_Python_AABBContained():
+    from pyg4ometry.meshutils import aabbContained
+
+    inside = aabbContained([[0, 0, 0], [-1, 0, 0]], [[1, 1, 1], [1, 1, 1]], [0, 0, 0], [2, 2, 2])
+    assert inside.tolist() == [True, False]
+
+
 # #############################
 # CSG
 # #############################
@@ -228,6 +355,427 @@ def test_Python_Remesh():
     l1.mesh.remesh()
 
 
+def test_Python_MeshKey():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    s1 = pyg4ometry.geant4.solid.Box("s1", 10, 10, 10, reg, "mm")
+    s2 = pyg4ometry.geant4.solid.Box("s2", 10, 10, 10, reg, "mm")
+    s3 = pyg4ometry.geant4.solid.Box("s3", 10, 10, 10, reg, "cm")
+    u1 = pyg4ometry.geant4.solid.Union("u1", s1, s2, [[0, 0, 0], [5, 0, 0]], reg)
+    u2 = pyg4ometry.geant4.solid.Union("u2", s1, s3, [[0, 0, 0], [5, 0, 0]], reg)
+    assert s1.meshKey() == s2.meshKey()
+    assert s1.meshKey() != s3.meshKey()
+    assert u1.meshKey() != u2.meshKey()
+
+    # no key for parameters without a repr that is the same in every session
+    s1.pX = object()
+    assert s1.meshKey() is None
+
+    # nor for solids that do not declare their parameters
+    hs = pyg4ometry.geant4.solid.HalfSpace("hs", reg)
+    hs.addPolygon([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+    assert hs.meshKey() is None
+
+
+def test_Python_MeshCache(tmptestdir):
+    import pyg4ometry
+
+    cacheDir = tmptestdir / "meshcache"
+    pyg4ometry.config.meshCacheDirectory = cacheDir
+    try:
+        reg = pyg4ometry.geant4.Registry()
+        s1 = pyg4ometry.geant4.solid.Tubs("s1", 0, 10, 20, 0, "2*pi", reg)
+        l1 = pyg4ometry.geant4.LogicalVolume(s1, "G4_Galactic", "l1", reg)
+        entry = cacheDir / (s1.meshKey() + ".npz")
+        assert entry.exists()
+        entrySize = entry.stat().st_size
+
+        # solids without a key are meshed without the cache
+        hs = pyg4ometry.geant4.solid.HalfSpace("hs", reg)
+        hs.addPolygon([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+        assert pyg4ometry.visualisation.cachedMesh(hs).polygonCount() == 1
+
+        l2 = pyg4ometry.geant4.LogicalVolume(s1, "G4_Galactic", "l2", reg)
+        # compare triangles, pycsg polygons are triangulated in the cache
+        assert len(l2.mesh.localmesh.toArrays()[1]) == len(l1.mesh.localmesh.toArrays()[1])
+
+        pyg4ometry.visualisation.clearMeshCache()
+        assert len(list(cacheDir.glob("*.npz"))) == 0
+
+        # least recently used meshes are evicted to stay within the size limit
+        maxSize = pyg4ometry.config.meshCacheMaxSize
+        pyg4ometry.config.meshCacheMaxSize = 3 * entrySize
+        try:
+            for i in range(10):
+                t = pyg4ometry.geant4.solid.Tubs(f"t{i}", 0, 10 + i, 20, 0, "2*pi", reg)
+                pyg4ometry.visualisation.cachedMesh(t)
+        finally:
+            pyg4ometry.config.meshCacheMaxSize = maxSize
+        size = sum(f.stat().st_size for f in cacheDir.glob("*.npz"))
+        assert 0 < size <= 3 * entrySize
+    finally:
+        pyg4ometry.config.meshCacheDirectory = None
+
+
+def test_Python_SolidMeshMemo():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    t = pyg4ometry.geant4.solid.Tubs("t", 0, 5, 200, 0, "2*pi", reg)
+    b1 = pyg4ometry.geant4.solid.Box("b1", 50, 50, 50, reg)
+    b2 = pyg4ometry.geant4.solid.Box("b2", 50, 50, 50, reg)
+    s1 = pyg4ometry.geant4.solid.Subtraction("s1", b1, t, [[0, 0, 0], [0, 0, 0]], reg)
+    s2 = pyg4ometry.geant4.solid.Subtraction("s2", b2, t, [[0, 0, 0], [0, 0, 0]], reg)
+    u = pyg4ometry.geant4.solid.Union("u", s1, s2, [[0, 0, 0], [100, 0, 0]], reg)
+
+    nPolygons = u.mesh().polygonCount()
+    assert set(reg.solidMeshMemo) == {"t", "b1", "b2", "s1", "s2"}
+
+    # memoised meshes are copies and may be modified by the caller
+    m = reg.solidMesh(t)
+    m.translate([10, 0, 0])
+    assert u.mesh().polygonCount() == nPolygons
+
+    # editing a leaf drops it and every boolean built from it
+    b1.pX = 60
+    assert set(reg.solidMeshMemo) == {"t", "b2", "s2"}
+    u.mesh()
+    assert set(reg.solidMeshMemo) == {"t", "b1", "b2", "s1", "s2"}
+
+
+def test_Python_SolidMeshMemoDefineAndOrbEdit():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    size = pyg4ometry.gdml.Constant("size", 50, reg)
+    b = pyg4ometry.geant4.solid.Box("b", "size", "size", "size", reg)
+    o = pyg4ometry.geant4.solid.Orb("o", 10, reg)
+    u = pyg4ometry.geant4.solid.Union("u", b, o, [[0, 0, 0], [0, 0, 0]], reg)
+
+    def extent(mesh):
+        vertices, _ = mesh.toArrays()
+        return vertices.max(axis=0) - vertices.min(axis=0)
+
+    assert extent(u.mesh())[0] == pytest.approx(50)
+
+    # a changed define is picked up by the booleans using it
+    size.setExpression(80)
+    assert extent(u.mesh())[0] == pytest.approx(80)
+
+    # Orb has no edit notification, its mesh key changes all the same
+    o.pRMax = 100
+    assert extent(u.mesh())[0] == pytest.approx(200, rel=1e-2)
+
+
+def test_Python_MeshKeyMemo(monkeypatch):
+    import pyg4ometry
+
+    SolidBase = pyg4ometry.geant4.solid.SolidBase
+    reg = pyg4ometry.geant4.Registry()
+    size = pyg4ometry.gdml.Constant("size", 10, reg)
+    solid = pyg4ometry.geant4.solid.Box("b0", "size", 10, 10, reg)
+    leaves = [solid]
+    for i in range(1, 6):
+        leaf = pyg4ometry.geant4.solid.Orb(f"o{i}", i, reg)
+        leaves.append(leaf)
+        solid = pyg4ometry.geant4.solid.Union(f"u{i}", solid, leaf, [[0, 0, 0], [0, 0, 0]], reg)
+
+    computed = []
+    computeMeshKey = SolidBase._computeMeshKey
+
+    def countingComputeMeshKey(self):
+        computed.append(self.name)
+        return computeMeshKey(self)
+
+    monkeypatch.setattr(SolidBase, "_computeMeshKey", countingComputeMeshKey)
+
+    # every solid of the tree is hashed once, and not again while nothing changes
+    key = solid.meshKey()
+    assert sorted(computed) == sorted([s.name for s in leaves] + [f"u{i}" for i in range(1, 6)])
+    computed.clear()
+    assert solid.meshKey() == key
+    assert computed == []
+
+    # editing a leaf, also one without property setters, or a define changes the key
+    leaves[3].pRMax = 30
+    key2 = solid.meshKey()
+    assert key2 != key
+    size.setExpression(20)
+    assert solid.meshKey() not in (key, key2)
+
+
+def test_Python_LazyMeshing():
+    import pyg4ometry
+
+    def extent(lv):
+        vertices, _ = lv.mesh.localmesh.toArrays()
+        return vertices.max(axis=0) - vertices.min(axis=0)
+
+    pyg4ometry.config.lazyMeshing = True
+    try:
+        reg = pyg4ometry.geant4.Registry()
+        size = pyg4ometry.gdml.Constant("size", 10, reg)
+        b = pyg4ometry.geant4.solid.Box("b", "size", 10, 10, reg)
+        o = pyg4ometry.geant4.solid.Orb("o", 5, reg)
+        lv = pyg4ometry.geant4.LogicalVolume(b, "G4_Galactic", "lv", reg)
+        ol = pyg4ometry.geant4.LogicalVolume(o, "G4_Galactic", "ol", reg)
+        assert lv._mesh is None
+
+        mesh = lv.mesh
+        assert extent(lv) == pytest.approx([10, 10, 10])
+        assert lv.mesh is mesh
+
+        # making or editing other solids does not mesh it again
+        other = pyg4ometry.geant4.solid.Box("other", 1, 1, 1, reg)
+        other.pX = 2
+        assert lv.mesh is mesh
+
+        # editing the solid meshes it again on the next access
+        b.pY = 20
+        assert lv.mesh is not mesh
+        assert extent(lv) == pytest.approx([10, 20, 10])
+
+        # as does changing a define it uses
+        size.setExpression(30)
+        assert extent(lv) == pytest.approx([30, 20, 10])
+
+        # and editing a solid without edit notification
+        assert extent(ol) == pytest.approx([10, 10, 10], rel=1e-2)
+        o.pRMax = 20
+        assert extent(ol) == pytest.approx([40, 40, 40], rel=1e-2)
+    finally:
+        pyg4ometry.config.lazyMeshing = False
+
+
+def test_Python_LazyMeshingKeyChecks(monkeypatch):
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.SolidBase import SolidBase
+
+    computed = []
+    computeMeshKey = SolidBase._computeMeshKey
+
+    def countingComputeMeshKey(self):
+        computed.append(self.name)
+        return computeMeshKey(self)
+
+    monkeypatch.setattr(SolidBase, "_computeMeshKey", countingComputeMeshKey)
+    monkeypatch.setattr(pyg4ometry.config, "lazyMeshing", True)
+
+    reg = pyg4ometry.geant4.Registry()
+    b = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg)
+    lv = pyg4ometry.geant4.LogicalVolume(b, "G4_Galactic", "lv", reg)
+    mesh = lv.mesh
+
+    # without an edit in the registry the mesh key is not looked at again
+    b._meshKeyMemo = None
+    computed.clear()
+    for _ in range(10):
+        assert lv.mesh is mesh
+    assert computed == []
+
+    # an edit rechecks it once
+    b.pX = 20
+    assert lv.mesh is not mesh
+    mesh = lv.mesh
+    assert lv.mesh is mesh
+    assert computed == ["b"]
+
+
+def test_Python_DivisionCopySolids():
+    import pyg4ometry
+    from pyg4ometry.geant4.DivisionVolume import _evaluatedParameters
+
+    g4 = pyg4ometry.geant4
+    reg = g4.Registry()
+    size = pyg4ometry.gdml.Constant("size", 100, reg)
+    copy = g4.solid.Box("copy", size, 10, 10, reg, "mm", False)
+
+    # evaluating the parameters of a copy is not an edit of the shared registry
+    version = reg.solidEditVersion
+    _evaluatedParameters(copy)
+    assert reg.solidEditVersion == version
+    assert copy.pX == pytest.approx(100)
+
+    # copies without a mesh, e.g. of a volume made without meshing, are None
+    meshes = pyg4ometry.visualisation.LazyMeshList([lambda: None, copy])
+    assert meshes[0] is None
+    assert meshes[1] is not None
+
+
+def test_Python_ParameterisedSharedMeshes():
+    import pyg4ometry
+
+    g4 = pyg4ometry.geant4
+    reg = g4.Registry()
+    wl = g4.LogicalVolume(g4.solid.Box("ws", 1e4, 1e4, 1e4, reg), "G4_Galactic", "wl", reg)
+    pl = g4.LogicalVolume(g4.solid.Box("ps", 1, 1, 1, reg), "G4_Galactic", "pl", reg)
+
+    n = 30
+    dims = [g4.ParameterisedVolume.BoxDimensions(1 + i % 3, 2, 3) for i in range(n)]
+    transforms = [
+        [
+            pyg4ometry.gdml.Rotation(f"r{i}", 0, 0, 0, "rad", reg, False),
+            pyg4ometry.gdml.Position(f"p{i}", 10 * i, 0, 0, "mm", reg, False),
+        ]
+        for i in range(n)
+    ]
+    pv = g4.ParameterisedVolume("pv", pl, wl, n, dims, transforms, reg)
+
+    # meshes are made on first use and shared by copies of the same size
+    assert len(pv.meshes) == n
+    assert pv.meshes.nDistinctMeshes() == 0
+    vMax = pv.extent()[1]
+    assert vMax[0] == pytest.approx(10 * (n - 1) + 1.5)
+    assert pv.meshes.nDistinctMeshes() == 3
+    assert pv.meshes[0] is pv.meshes[3]
+
+
+def test_Python_MultiUnionDisjoint():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    b = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg)
+    positions = [0, 20, 40, 60, 65]
+    mu = pyg4ometry.geant4.solid.MultiUnion(
+        "mu", [b] * len(positions), [[[0, 0, 0], [x, 0, 0]] for x in positions], reg
+    )
+
+    # three separate boxes and two overlapping by half
+    assert mu.mesh().volume() == pytest.approx(4500)
+    assert mu.mesh(workers=2).volume() == pytest.approx(4500)
+
+
+def test_Python_MultiUnionWorkersOnePool(monkeypatch):
+    import sys
+    import pyg4ometry
+
+    _muModule = sys.modules["pyg4ometry.geant4.solid.MultiUnion"]
+    pools = []
+    ProcessPoolExecutor = _muModule._ProcessPoolExecutor
+
+    def countingProcessPoolExecutor(*args, **kwargs):
+        pools.append(args or kwargs)
+        return ProcessPoolExecutor(*args, **kwargs)
+
+    monkeypatch.setattr(_muModule, "_ProcessPoolExecutor", countingProcessPoolExecutor)
+
+    # one group of overlapping boxes, unioned over three levels of the tree
+    reg = pyg4ometry.geant4.Registry()
+    b = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg)
+    positions = [0, 5, 10, 15, 20, 25, 30, 35]
+    mu = pyg4ometry.geant4.solid.MultiUnion(
+        "mu", [b] * len(positions), [[[0, 0, 0], [x, 0, 0]] for x in positions], reg
+    )
+    mu.mesh(workers=2)
+    assert len(pools) == 1
+
+
+def test_Python_RevolvedMesh():
+    import numpy as np
+    from pyg4ometry.meshutils import revolvedMesh
+
+    # quarter of a tube, every directed edge must appear once in each direction
+    vertices, faces, offsets = revolvedMesh([[[1, -1], [2, -1], [2, 1], [1, 1]]], 0, np.pi / 2, 8)
+    edges = set()
+    for i in range(len(offsets) - 1):
+        face = faces[offsets[i] : offsets[i + 1]]
+        edges.update(zip(face, np.roll(face, -1)))
+    assert len(offsets) - 1 == 4 * 8 + 2
+    assert all((j, i) in edges for i, j in edges)
+
+    # cylinder, points on the axis are shared
+    vertices, faces, offsets = revolvedMesh([[[0, -1], [1, -1], [1, 1], [0, 1]]], 0, 2 * np.pi, 8)
+    assert len(vertices) == 2 * 8 + 2
+    assert list(np.diff(offsets)) == [3] * 8 + [4] * 8 + [3] * 8
+
+
+def test_Python_PrimitiveMeshVolume():
+    import numpy as np
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    solids = [
+        (pyg4ometry.geant4.solid.Box("b", 10, 20, 30, reg), 6000),
+        (pyg4ometry.geant4.solid.Tubs("t", 5, 10, 20, 0, "pi", reg, nslice=256), 750 * np.pi),
+        (pyg4ometry.geant4.solid.Sphere("s", 0, 10, 0, "pi", 0, "pi/2", reg), 1000 * np.pi / 3),
+        (pyg4ometry.geant4.solid.Torus("tor", 1, 2, 10, 0, "2*pi", reg), 60 * np.pi**2),
+    ]
+    for solid, volume in solids:
+        mesh = solid.mesh()
+        assert mesh.isClosed()
+        assert mesh.volume() == pytest.approx(volume, rel=0.05)
+
+
+def test_Python_MeshArrays():
+    import numpy as np
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    s = pyg4ometry.geant4.solid.Tubs("s", 0, 10, 20, 0, "2*pi", reg)
+    mesh = s.mesh()
+    mesh.translate([5, 0, 0])
+
+    vertices, faces = mesh.toArrays()
+    assert vertices.shape == (mesh.vertexCount(), 3)
+    assert vertices.dtype == np.float64
+    assert faces.shape == (mesh.polygonCount(), 3)
+    assert np.allclose(mesh.bbox(), [[-5, -10, -10], [15, 10, 10]])
+
+    # round trip through the array constructor
+    assert pyg4ometry.pycgal.core.CSG.fromArrays(vertices, faces).volume() == pytest.approx(
+        mesh.volume()
+    )
+
+    # invalid indices are rejected rather than read out of bounds
+    with pytest.raises(ValueError, match="indices"):
+        pyg4ometry.pycgal.core.CSG.fromArrays(vertices, faces + len(vertices))
+    with pytest.raises(ValueError, match="offsets"):
+        pyg4ometry.pycgal.core.CSG.fromArrays(vertices, faces.reshape(-1), [0, 6, 3, faces.size])
+
+
+def test_Python_TessellatedSolidArrays():
+    import numpy as np
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    TessellatedSolid = pyg4ometry.geant4.solid.TessellatedSolid
+    vertices, faces = pyg4ometry.geant4.solid.Box("b", 10, 20, 30, reg).mesh().toArrays()
+
+    # facet soup as read from STL, vertices are merged when meshing
+    soup = [[list(map(list, vertices[f])), [0, 0, 0]] for f in faces]
+    stl = TessellatedSolid("stl", soup, reg, TessellatedSolid.MeshType.Stl)
+    v, f = stl.toArrays()
+    assert v.shape == (3 * len(faces), 3)
+    assert f.dtype == np.int32
+    assert stl.mesh().volume() == pytest.approx(6000)
+
+    # array backed storage, quadrangles mixed with triangles padded with -1
+    arr = TessellatedSolid.fromArrays("arr", np.tile(vertices, (2, 1)), faces, reg)
+    arr.removeDuplicateVertices()
+    assert arr.meshtess[0].shape == (8, 3)
+    assert arr.mesh().volume() == pytest.approx(6000)
+
+    v, f = TessellatedSolid("quad", [vertices.tolist(), [[0, 1, 2, 3], [0, 1, 2]]], reg).toArrays()
+    assert f.tolist() == [[0, 1, 2, 3], [0, 1, 2, -1]]
+
+
+def test_Python_TessellatedSolidNonManifold():
+    import numpy as np
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    vertices, faces = pyg4ometry.geant4.solid.Box("b", 10, 20, 30, reg).mesh().toArrays()
+
+    # a repeated facet makes the tessellation non-manifold, it is skipped rather than
+    # losing the whole mesh
+    faces = np.concatenate([faces, faces[:1]])
+    ts = pyg4ometry.geant4.solid.TessellatedSolid.fromArrays("ts", vertices, faces, reg)
+    tl = pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    assert tl.mesh is not None
+    assert len(tl.mesh.localmesh.toArrays()[1]) >= len(faces) - 1
+
+
 def test_Python_ExceptionNullMeshErrorIntersection():
     import pyg4ometry
 
@@ -333,6 +881,58 @@ def test_Python_VisualisationVtk_setWireframe_VisualisationOptions(simple_box):
     # v.view(interactive=False)
 
 
+def test_Python_VisualisationVtk_Instanced():
+    import pyg4ometry
+
+    g4 = pyg4ometry.geant4
+    reg = g4.Registry()
+    ws = g4.solid.Box("ws", 1000, 1000, 1000, reg)
+    bs = g4.solid.Box("bs", 10, 20, 40, reg)
+    wl = g4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = g4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    for i in range(20):
+        g4.PhysicalVolume([0.1 * i, 0, 0.2 * i], [30 * i - 300, 0, 0], bl, f"b{i}", wl, reg)
+
+    v = pyg4ometry.visualisation.VtkViewer(instanced=True)
+    v.addLogicalVolume(wl)
+    v.buildInstances()
+
+    # world bounding actor and one actor for all placements
+    assert len(v.actors) == 2
+    assert v.pickInstance(v.actors[1], [30 * 7 - 300, 0, 0]) == "b7"
+    assert v.pickInstance(v.actors[1], [0, 400, 0]) is None
+
+
+def test_Python_VisualisationSection(tmp_path):
+    import pyg4ometry
+
+    g4 = pyg4ometry.geant4
+    reg = g4.Registry()
+    ws = g4.solid.Box("ws", 1000, 1000, 1000, reg)
+    bs = g4.solid.Box("bs", 10, 20, 40, reg)
+    wl = g4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = g4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    for i in range(20):
+        g4.PhysicalVolume([0, 0, 0.2 * i], [30 * i - 300, 0, 0], bl, f"b{i}", wl, reg)
+
+    s = pyg4ometry.visualisation.SectionExporter()
+    s.addLogicalVolume(wl)
+    sections = s.section([[0, 0, 0], [0, 0, 100]], [0, 0, 1])
+
+    # one closed rectangle per box and the world outline, nothing above the boxes
+    assert len(sections[0]) == 21
+    assert len(sections[1]) == 1
+    for _, _, points in sections[0].polylines("bl"):
+        assert _np.allclose(points[0], points[-1])
+        assert _np.linalg.norm(_np.diff(points, axis=0), axis=1).sum() == pytest.approx(60)
+
+    pyg4ometry.visualisation.writeSections(tmp_path / "sections.json", sections)
+    pyg4ometry.visualisation.writeSections(tmp_path / "sections.npz", sections)
+    data = _np.load(tmp_path / "sections.npz")
+    assert len(data["lineOffsets"]) == 23
+    assert list(data["linePlane"]).count(1) == 1
+
+
 def test_Python_VisualisationVtk_setOpacityOverlap(simple_box):
     r = simple_box
     v = r["vtkViewer"]
@@ -1,3 +1,5 @@
+import pytest
+
 from pyg4ometry import geant4
 from pyg4ometry import stl
 from pyg4ometry.visualisation import Convert
@@ -34,3 +36,38 @@ def test_StlWrite_T001_Box(testdata, tmptestdir, simple_box):
     m = lv.daughterVolumes[0].logicalVolume.mesh.localmesh
     pd = Convert.pycsgMeshToVtkPolyData(m)
     Writer.writeVtkPolyDataAsSTLFile(str(tmptestdir / "T001_Box.stl"), [pd])
+
+
+def test_StlLoad_AsciiBinary(tmptestdir):
+    import numpy as np
+
+    reg = geant4.Registry()
+    vertices, faces = geant4.solid.Box("b", 10, 20, 30, reg).mesh().toArrays()
+    triangles = vertices[faces]
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+    with open(tmptestdir / "T_box_ascii.stl", "w") as f:
+        f.write("solid box 1\n")
+        for t, n in zip(triangles, normals):
+            f.write("facet normal {} {} {}\nouter loop\n".format(*n))
+            for v in t:
+                f.write("vertex {:e} {:e} {:e}\n".format(*v))
+            f.write("endloop\nendfacet\n")
+        f.write("endsolid box 1\n")
+
+    # binary file whose header starts with 'solid', recognised from its size
+    facets = np.zeros(len(faces), dtype=[("n", "<f4", 3), ("v", "<f4", (3, 3)), ("a", "<u2")])
+    facets["n"] = normals
+    facets["v"] = triangles
+    with open(tmptestdir / "T_box_binary.stl", "wb") as f:
+        f.write(b"solid box".ljust(80))
+        f.write(np.uint32(len(faces)).tobytes())
+        f.write(facets.tobytes())
+
+    for fileName in ["T_box_ascii.stl", "T_box_binary.stl"]:
+        r = stl.Reader(tmptestdir / fileName, scale=2, centre=True, registry=geant4.Registry())
+        assert r.vertices.shape == (8, 3)
+        assert r.faces.shape == (len(faces), 3)
+        assert r.extent() == [[-10, -20, -30], [10, 20, 30]]
+        assert len(r.facet_list) == len(faces)
+        assert r.getSolid().mesh().volume() == pytest.approx(48000)
@@ -183,3 +183,41 @@ def test_RenderWriter(testdata, tmptestdir):
     v = _pyg4.visualisation.RenderWriter()
     v.addLogicalVolumeRecursive(reg.getWorldVolume())
     v.write(str(tmptestdir))
+
+
+def test_ViewerBase_exportGLB(testdata, tmptestdir):
+    import json
+    import struct
+
+    import numpy as np
+
+    r = _pyg4.gdml.Reader(testdata["gdml/T106_replica_x.gdml"])
+    v = _pyg4.visualisation.ViewerBase()
+    v.addLogicalVolume(r.getRegistry().getWorldVolume())
+    before = {k: m.toArrays()[0].copy() for k, m in v.localmeshes.items()}
+    nPlacements = sum(len(p) for p in v.instancePlacements.values())
+
+    for quantise in [False, True]:
+        fileName = str(tmptestdir / f"temp_{quantise}.glb")
+        v.exportGLB(fileName, quantise=quantise)
+
+        with open(fileName, "rb") as f:
+            data = f.read()
+        magic, version, length = struct.unpack("<4sII", data[:12])
+        assert (magic, version, length) == (b"glTF", 2, len(data))
+        jsonLength = struct.unpack("<I", data[12:16])[0]
+        gltf = json.loads(data[20 : 20 + jsonLength])
+
+        # the replicas are one instanced node
+        assert "EXT_mesh_gpu_instancing" in gltf["extensionsUsed"]
+        assert len(gltf["meshes"]) == len(v.localmeshes)
+        nInstances = 0
+        for node in gltf["nodes"]:
+            if "extensions" in node:
+                nInstances += len(node["extras"]["instances"])
+            else:
+                nInstances += 1
+        assert nInstances == nPlacements
+
+    for k, m in v.localmeshes.items():
+        assert np.array_equal(m.toArrays()[0], before[k])